@@ -0,0 +1,83 @@
+"""
+Compare the per-call cost of the dataset accessors before and after the
+data rows became immutable.
+
+Usage::
+
+    $ python benchmarks/accessors.py [--rows N] [--repeat N]
+
+Accessors used to return a deep copy of the data rows on every call,
+now they return the same immutable tuple. The tables are filled with
+synthetic rows, so no page is downloaded.
+"""
+
+import argparse
+import time
+
+from copy import deepcopy
+from dataclasses import fields
+from typing import Any, List, Tuple, Type
+
+from worldometer.world.base import _DataTables
+
+# The snapshot module imports every dataset class, registering them as subclasses.
+import worldometer.world.snapshot  # noqa: F401
+
+from table_parsers import get_dataset_classes
+
+
+FAKE_VALUES = {int: 1_000_000, float: 17.8, str: 'Worldometer'}
+
+
+def make_dataset(dataset_class: Type[_DataTables], rows: int) -> _DataTables:
+    dataset = dataset_class.__new__(dataset_class)
+    # The rows are set directly, so there is no page to validate or parse.
+    dataset._set_page(None)
+
+    for position, row_type in enumerate(dataset._row_types):
+        kwargs = {f.name: FAKE_VALUES[f.type] for f in fields(row_type)}  # type: ignore
+        dataset._tables[position] = tuple(row_type(**kwargs) for _ in range(rows))
+
+    return dataset
+
+
+def time_calls(func: Any, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def benchmark(dataset: _DataTables, repeat: int) -> Tuple[float, float]:
+    before = after = 0.0
+
+    for row_type in dataset._row_types:
+        rows: List[Any] = list(dataset._get_rows(row_type))
+        before += time_calls(lambda: deepcopy(rows), repeat)
+        after += time_calls(lambda: dataset._get_rows(row_type), repeat)
+
+    return before, after
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--rows', type=int, default=235)
+    arg_parser.add_argument('--repeat', type=int, default=100)
+    args = arg_parser.parse_args()
+
+    print(f'{"dataset":<42}{"deepcopy (us)":>15}{"shared (us)":>15}{"speedup":>12}')
+
+    for dataset_class in get_dataset_classes():
+        dataset = make_dataset(dataset_class, args.rows)
+        before, after = benchmark(dataset, args.repeat)
+
+        print(
+            f'{dataset_class.__name__:<42}'
+            f'{before * 1e6:>15.1f}'
+            f'{after * 1e6:>15.2f}'
+            f'{before / after:>11.0f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
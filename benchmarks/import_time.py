@@ -0,0 +1,70 @@
+"""
+Measure the time to import the package and its main entry points.
+
+Usage::
+
+    $ python benchmarks/import_time.py [--repeat N]
+
+Each statement runs (and is timed) in a new interpreter, so modules
+imported by previous statements do not affect the measure. The heavy
+dependencies loaded by each statement are listed, to check they are
+only loaded when needed.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+from typing import List, Tuple
+
+
+STATEMENTS = (
+    'import worldometer',
+    'import worldometer.world',
+    'from worldometer.world import WorldCounters',
+    'from worldometer.world.population import CountriesByPopulation',
+    'from worldometer import get_metric_of'
+)
+
+HEAVY_MODULES = ('numpy', 'pandas', 'lxml', 'requests_html', 'pyppeteer')
+
+SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, [m for m in {heavy_modules!r} if m in sys.modules]]))
+'''
+
+
+def measure(statement: str) -> Tuple[float, List[str]]:
+    script = SCRIPT.format(statement=statement, heavy_modules=HEAVY_MODULES)
+    output = subprocess.run(
+        [sys.executable, '-c', script],
+        check=True,
+        capture_output=True,
+        text=True
+    ).stdout
+    elapsed, modules = json.loads(output)
+    return elapsed, modules
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    print(f'{"statement":<66}{"time (ms)":>10}  heavy modules loaded')
+
+    for statement in STATEMENTS:
+        results = [measure(statement) for _ in range(args.repeat)]
+        elapsed = statistics.median(result[0] for result in results)
+        modules = results[0][1]
+
+        print(f'{statement:<66}{elapsed * 1000:>10.1f}  {", ".join(modules) or "-"}')
+
+
+if __name__ == '__main__':
+    main()
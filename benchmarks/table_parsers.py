@@ -0,0 +1,112 @@
+"""
+Compare the table parser backends on every page scraped by the package.
+
+Usage::
+
+    $ python benchmarks/table_parsers.py [--repeat N] [--html-dir DIR]
+
+Pages are downloaded from the website, unless ``--html-dir`` points to
+a directory with previously saved pages (named after the source path,
+e.g. ``country-codes.html``). Missing pages are downloaded and saved there.
+"""
+
+import argparse
+import os
+import time
+
+from typing import Dict, List, Optional, Type
+
+from worldometer.scraper.consts import BASE_URL
+from worldometer.scraper.controller import browser
+from worldometer.scraper.tables import TABLE_PARSER_BACKENDS, get_html_tables_data
+from worldometer.scraper.utils import make_url
+from worldometer.world.base import _DataTables
+
+# The snapshot module imports every dataset class, registering them as subclasses.
+import worldometer.world.snapshot  # noqa: F401
+
+
+def get_dataset_classes(cls: Type[_DataTables] = _DataTables) -> List[Type[_DataTables]]:
+    classes = []
+    for subclass in cls.__subclasses__():
+        if subclass.source_path != '[override]':
+            classes.append(subclass)
+        classes.extend(get_dataset_classes(subclass))
+    return classes
+
+
+def get_page_html(source_path: str, html_dir: Optional[str]) -> str:
+    filename = source_path.strip('/').replace('/', '_') + '.html'
+
+    if html_dir:
+        path = os.path.join(html_dir, filename)
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                return f.read()
+
+    html = browser.get_page_content(make_url(BASE_URL, source_path)).html
+
+    if html_dir:
+        os.makedirs(html_dir, exist_ok=True)
+        with open(os.path.join(html_dir, filename), 'w', encoding='utf-8') as f:
+            f.write(html)
+
+    return html
+
+
+def benchmark(dataset_class: Type[_DataTables], html: str, repeat: int) -> Dict[str, float]:
+    dataset = dataset_class.__new__(dataset_class)
+    kwargs = {
+        'html': html,
+        'attrs': dataset._attrs,
+        'new_column_names': dataset._get_new_column_names()
+    }
+
+    timings = {}
+    records = {}
+    for backend in TABLE_PARSER_BACKENDS:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            records[backend] = get_html_tables_data(**kwargs, backends=[backend])
+        timings[backend] = (time.perf_counter() - start) / repeat
+
+    # NaN values are never equal to each other, so compare the representations.
+    reprs = {repr(r) for r in records.values()}
+    if len(reprs) != 1:
+        raise AssertionError(f'Backends produced different records for {dataset_class.__name__}')
+
+    return timings
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    arg_parser.add_argument('--html-dir', default=None)
+    args = arg_parser.parse_args()
+
+    backends = list(TABLE_PARSER_BACKENDS)
+    print(f'{"dataset":<42}' + ''.join(f'{b + " (ms)":>12}' for b in backends) + f'{"speedup":>10}')
+
+    totals = dict.fromkeys(backends, 0.0)
+    for dataset_class in get_dataset_classes():
+        html = get_page_html(dataset_class.source_path, args.html_dir)
+        timings = benchmark(dataset_class, html, args.repeat)
+
+        for backend, seconds in timings.items():
+            totals[backend] += seconds
+
+        print(
+            f'{dataset_class.__name__:<42}'
+            + ''.join(f'{timings[b] * 1000:>12.1f}' for b in backends)
+            + f'{timings["bs4"] / timings["lxml"]:>9.1f}x'
+        )
+
+    print(
+        f'{"total":<42}'
+        + ''.join(f'{totals[b] * 1000:>12.1f}' for b in backends)
+        + f'{totals["bs4"] / totals["lxml"]:>9.1f}x'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -25,8 +25,13 @@ setup(
     install_requires=[
         'requests-html',
         'pandas',
-        'html5lib'
+        'html5lib',
+        'lxml'
     ],
+    extras_require={
+        # HTTPXTransport, to fetch the pages over HTTP/2.
+        'http2': ['httpx[http2,brotli]']
+    },
     zip_safe=False,
     python_requires='>=3.8',
     project_urls={
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from requests_html import HTML
+
+from worldometer.scraper.browser import AsyncBrowser
+
+
+class FakeAsyncResponse:
+
+    def __init__(self, url, status_code, content, headers=None):
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.encoding = 'utf-8'
+        self.headers = headers or {}
+        self.html = HTML(html=content, url=url)
+
+
+class FakeAsyncSession:
+    # Answers the requests with the given outcomes, in order: exceptions
+    # are raised, (status_code, content[, headers]) tuples are returned
+    # as responses. The requests are recorded as (url, timeout, headers).
+
+    def __init__(self, outcomes, delay=0.0):
+        self.outcomes = iter(outcomes)
+        self.delay = delay
+        self.requests = []
+
+    async def get(self, url, timeout=30, headers=None):
+        self.requests.append((url, timeout, headers))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        outcome = next(self.outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return FakeAsyncResponse(url, *outcome)
+
+
+@pytest.fixture
+def fake_async_session(monkeypatch):
+    # Makes the AsyncBrowser instances fetch the pages from a
+    # FakeAsyncSession, e.g. `fake_async_session(itertools.repeat((200, html)))`
+    # answers every request with the same page.
+    def install(outcomes, delay=0.0):
+        session = FakeAsyncSession(outcomes, delay=delay)
+        monkeypatch.setattr(AsyncBrowser, 'session', property(lambda self: session))
+        return session
+
+    return install
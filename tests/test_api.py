@@ -0,0 +1,84 @@
+import pytest
+
+from worldometer import api
+
+
+pytestmark = pytest.mark.filterwarnings('ignore::DeprecationWarning')
+
+
+@pytest.fixture
+def fake_load_metrics(monkeypatch):
+    calls = []
+
+    def fake_load_metrics():
+        calls.append(len(calls))
+        return {'births_today': 5676 + len(calls), 'deaths_today': 2383}
+
+    monkeypatch.setattr(api, '_load_metrics', fake_load_metrics)
+    monkeypatch.setattr(api, '_cached_metrics', {})
+    monkeypatch.setattr(api, '_cached_at', 0.0)
+    monkeypatch.setattr(api, '_refresh_thread', None)
+    return calls
+
+
+def test_get_metric_of_loads_the_metrics_once(fake_load_metrics):
+    assert api.get_metric_of('births_today') == {'births_today': 5677}
+    assert api.get_metric_of('deaths_today') == {'deaths_today': 2383}
+    assert len(fake_load_metrics) == 1
+
+
+def test_get_metric_of_invalid_label(fake_load_metrics):
+    with pytest.raises(Exception, match='invalid'):
+        api.get_metric_of('invalid_label')
+
+
+def test_get_metrics_of(fake_load_metrics):
+    assert api.get_metrics_of(['deaths_today', 'births_today']) == {
+        'deaths_today': 2383,
+        'births_today': 5677
+    }
+
+    with pytest.raises(Exception, match='invalid'):
+        api.get_metrics_of(['births_today', 'invalid_label'])
+
+
+def test_stale_metrics_are_served_while_refreshed(fake_load_metrics, monkeypatch):
+    api.get_metric_of('births_today')
+    monkeypatch.setattr(api, 'CACHE_TTL', 0.0)
+
+    assert api.get_metric_of('births_today') == {'births_today': 5677}
+
+    api._refresh_thread.join()
+    monkeypatch.setattr(api, 'CACHE_TTL', 60.0)
+
+    assert api.get_metric_of('births_today') == {'births_today': 5678}
+    assert len(fake_load_metrics) == 2
+
+
+def test_update_metrics(fake_load_metrics):
+    api.get_metric_of('births_today')
+    api.update_metrics()
+
+    assert api.get_metric_of('births_today') == {'births_today': 5678}
+
+
+def test_failed_refresh_is_logged_and_backs_off(fake_load_metrics, monkeypatch, caplog):
+    api.get_metric_of('births_today')
+
+    def failing_load_metrics():
+        fake_load_metrics.append(len(fake_load_metrics))
+        raise ConnectionError('Website unavailable')
+
+    monkeypatch.setattr(api, '_load_metrics', failing_load_metrics)
+    monkeypatch.setattr(api, '_cached_at', api._cached_at - api.CACHE_TTL)
+
+    assert api.get_metric_of('births_today') == {'births_today': 5677}
+    api._refresh_thread.join()
+
+    assert 'Could not refresh the metrics' in caplog.text
+
+    # The refresh is not retried until the TTL passes again.
+    refresh_thread = api._refresh_thread
+    assert api.get_metric_of('births_today') == {'births_today': 5677}
+    assert api._refresh_thread is refresh_thread
+    assert len(fake_load_metrics) == 2
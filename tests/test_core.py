@@ -0,0 +1,74 @@
+import pytest
+
+import worldometer.core as core
+import worldometer.world.counters as counters
+
+
+pytestmark = pytest.mark.filterwarnings('ignore::DeprecationWarning')
+
+
+@pytest.fixture
+def remote_calls(monkeypatch):
+    calls = []
+
+    def fake_get_rts_counters_metadata(path_url):
+        calls.append(path_url)
+        return {
+            'current_population': {'last_value': 8000000000, 'rate': 0.0},
+            'births_today': {'last_value': 5676 + len(calls), 'rate': 0.0},
+            'births_this_year': {'last_value': 15741371, 'rate': 0.0}
+        }
+
+    monkeypatch.setattr(counters, 'get_rts_counters_metadata', fake_get_rts_counters_metadata)
+    monkeypatch.setattr(core, '_shared_counters', None)
+    return calls
+
+
+def test_worldometer_collects_the_metrics_on_first_access(remote_calls):
+    w = core.Worldometer()
+
+    assert remote_calls == []
+    assert w.what_is_here() == {'categories': 8, 'labels': 63, 'metrics': 63}
+    assert remote_calls == []
+
+    metrics = w.metrics_with_labels()
+
+    assert len(remote_calls) == 1
+    assert metrics['current_population'] == 8000000000
+    assert metrics['births_today'] == 5677
+    assert metrics['births_this_year'] == 15741371
+
+
+def test_metrics_with_categories(remote_calls):
+    w = core.Worldometer()
+    metrics = w.metrics_with_labels(with_categories=True)
+
+    assert list(metrics) == w.categories()
+    assert metrics['world_population']['births_today'] == 5677
+    assert list(metrics['health']) == core._METRICS_LABELS['health']
+
+
+def test_shared_worldometer_objects_use_the_same_counters(remote_calls):
+    w1 = core.Worldometer(shared=True)
+    w2 = core.Worldometer(shared=True)
+
+    assert w1.metrics() == w2.metrics()
+    assert len(remote_calls) == 1
+
+    w2.update_metrics()
+
+    assert len(remote_calls) == 2
+    assert w2.metrics_with_labels()['births_today'] == 5678
+    assert w1.metrics_with_labels()['births_today'] == 5677
+
+
+def test_shared_metrics_are_read_from_a_copy_of_the_snapshot(remote_calls):
+    snapshot = core._get_shared_snapshot()
+
+    assert snapshot is not core._shared_counters.snapshot
+
+    # Reloading the shared counters does not change a copy being read.
+    reloaded = core._get_shared_snapshot(reload=True)
+
+    assert snapshot.value_of('births_today') == 5677
+    assert reloaded.value_of('births_today') == 5678
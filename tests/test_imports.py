@@ -0,0 +1,46 @@
+import subprocess
+import sys
+
+import pytest
+
+
+HEAVY_MODULES = ('numpy', 'pandas', 'lxml', 'requests_html', 'pyppeteer')
+
+
+def get_loaded_heavy_modules(statement):
+    script = f'import sys\n{statement}\nprint(",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))'
+    output = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True)
+    return [m for m in output.stdout.strip().split(',') if m]
+
+
+@pytest.mark.parametrize('statement', [
+    'import worldometer',
+    'import worldometer.world',
+    'import worldometer.world.geography',
+    'import worldometer.world.population',
+])
+def test_import_does_not_load_heavy_dependencies(statement):
+    assert get_loaded_heavy_modules(statement) == []
+
+
+def test_lazy_names_are_resolved():
+    import worldometer
+    import worldometer.world
+    from worldometer.world import population
+
+    assert worldometer.Worldometer.__module__ == 'worldometer.core'
+    assert worldometer.world.WorldCounters.__module__ == 'worldometer.world.counters'
+    assert population.LargestCities.__module__ == 'worldometer.world.population.largest_cities'
+    assert 'WorldCounters' in dir(worldometer.world)
+
+    with pytest.raises(AttributeError):
+        worldometer.world.NotAName
+
+
+@pytest.mark.parametrize('statement', [
+    'from worldometer.world import WorldCounters',
+    'from worldometer.scraper import get_rts_counters_object, get_rts_counters_metadata',
+    'from worldometer.world.population import CountriesByPopulation',
+])
+def test_counters_and_dataset_classes_do_not_load_pandas(statement):
+    assert 'pandas' not in get_loaded_heavy_modules(statement)
@@ -0,0 +1,65 @@
+import asyncio
+import threading
+
+import pytest
+
+from pyppeteer.errors import ElementHandleError
+
+from worldometer.scraper.browser import AsyncBrowser
+from worldometer.scraper.exceptions import ScriptRunnerError
+from worldometer.scraper.resilience import RetryPolicy
+
+
+def test_async_browser_has_a_session_for_each_event_loop():
+    browser = AsyncBrowser()
+    sessions = []
+
+    async def get_session():
+        return browser.session
+
+    def worker():
+        sessions.append(asyncio.run(get_session()))
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sessions[0] is not sessions[1]
+
+    # The sessions of the closed loops are discarded.
+    asyncio.run(get_session())
+    assert len(browser._sessions) == 1
+
+
+class FakeHTML:
+    url = 'https://www.worldometers.info/'
+    html = '<html></html>'
+
+    def __init__(self, error=None):
+        self.error = error
+
+    async def arender(self, script=None):
+        if self.error is not None:
+            raise self.error
+        return {'script': script}
+
+
+def test_async_browser_get_page_content(fake_async_session):
+    session = fake_async_session([(200, '<html><body><p>Worldometer</p></body></html>')])
+    browser = AsyncBrowser()
+
+    html = asyncio.run(browser.get_page_content('https://www.worldometers.info/', timeout=10))
+
+    assert html.find('p', first=True).text == 'Worldometer'
+    assert session.requests == [('https://www.worldometers.info/', 10, None)]
+
+
+def test_async_browser_run_js_script():
+    browser = AsyncBrowser(retry=RetryPolicy(attempts=1))
+
+    assert asyncio.run(browser.run_js_script(FakeHTML(), '() => 1')) == {'script': '() => 1'}
+
+    with pytest.raises(ScriptRunnerError):
+        asyncio.run(browser.run_js_script(FakeHTML(ElementHandleError()), '() => undefined_variable'))
@@ -0,0 +1,179 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from worldometer.scraper.browser import AsyncBrowser, Browser
+from worldometer.scraper.cache import HTTPCache
+from worldometer.scraper.transport import Response, Transport, TransportStats
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HTTPCache(str(tmp_path))
+
+
+@pytest.fixture
+def url():
+    return 'https://www.example.com/a'
+
+
+def test_cache_set_and_get(cache, url):
+    cache.set(url, body=b'<html></html>', encoding='utf-8', etag='"abc"', last_modified='Mon')
+
+    cached = cache.get(url)
+
+    assert cached is not None
+    assert cached.url == url
+    assert cached.body == b'<html></html>'
+    assert cached.encoding == 'utf-8'
+    assert cached.revalidation_headers == {'If-None-Match': '"abc"', 'If-Modified-Since': 'Mon'}
+    assert cached.is_fresh(max_age=60)
+
+
+def test_cache_get_missing_entry(cache, url):
+    assert cache.get(url) is None
+
+
+def test_cache_get_corrupted_entry(cache, url):
+    with open(cache._get_path(url), 'wb') as f:
+        f.write(b'not json\n<html></html>')
+
+    assert cache.get(url) is None
+
+
+def test_cache_entry_age_and_touch(cache, url):
+    cache.set(url, body=b'<html></html>')
+    old = time.time() - 120
+    os.utime(cache._get_path(url), (old, old))
+
+    assert not cache.get(url).is_fresh(max_age=60)
+
+    cache.touch(url)
+
+    assert cache.get(url).is_fresh(max_age=60)
+
+
+def test_cache_get_stored_at(cache, url):
+    assert cache.get_stored_at(url) is None
+
+    cache.set(url, body=b'<html></html>')
+
+    assert cache.get_stored_at(url) == cache.get(url).stored_at
+
+
+def test_cache_without_validators(cache, url):
+    cache.set(url, body=b'<html></html>')
+
+    assert cache.get(url).revalidation_headers == {}
+
+
+def test_cache_delete(cache, url):
+    cache.set(url, body=b'<html></html>')
+    cache.delete(url)
+
+    assert cache.get(url) is None
+    assert os.listdir(cache.directory) == []
+
+
+PAGE = b'<html><body><p>Worldometer</p></body></html>'
+VALIDATORS = {'ETag': '"v1"', 'Last-Modified': 'Mon, 16 Oct 2023 00:00:00 GMT'}
+
+
+def make_stale(cache, url):
+    old = time.time() - 120
+    os.utime(cache._get_path(url), (old, old))
+
+
+class RecordingTransport(Transport):
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, timeout=30, headers=None):
+        self.requests.append((url, timeout, headers))
+        status_code, content, response_headers = self.responses.pop(0)
+        return Response(url, status_code, content, 'utf-8', response_headers, 'HTTP/1.1')
+
+    def stats(self):
+        return TransportStats(len(self.requests), 1, {})
+
+
+@pytest.fixture(params=['sync', 'async'])
+def make_browser(request, cache, fake_async_session):
+    # Returns a function that creates a browser answering with the given
+    # responses, and a function to get a page from it.
+    def make(responses):
+        if request.param == 'sync':
+            browser = Browser(transport=RecordingTransport(responses), cache=cache)
+            return browser.transport, lambda url, max_age: browser.get_page_content(url, max_age=max_age)
+
+        session = fake_async_session(responses)
+        browser = AsyncBrowser(cache=cache)
+        return session, lambda url, max_age: asyncio.run(browser.get_page_content(url, max_age=max_age))
+
+    return make
+
+
+def test_browser_stores_and_uses_fresh_pages(make_browser, cache, url):
+    client, get_page_content = make_browser([(200, PAGE, VALIDATORS)])
+
+    get_page_content(url, max_age=60)
+    html = get_page_content(url, max_age=60)
+
+    assert html.find('p', first=True).text == 'Worldometer'
+    assert [headers for _, _, headers in client.requests] == [None]
+    assert cache.get(url).body == PAGE
+
+
+def test_browser_revalidates_stale_pages(make_browser, cache, url):
+    client, get_page_content = make_browser([(200, PAGE, VALIDATORS), (304, b'', {})])
+
+    get_page_content(url, max_age=60)
+    make_stale(cache, url)
+    html = get_page_content(url, max_age=60)
+
+    _, _, headers = client.requests[1]
+    assert headers == {
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': 'Mon, 16 Oct 2023 00:00:00 GMT'
+    }
+    assert html.find('p', first=True).text == 'Worldometer'
+    # The 304 marks the cached page as revalidated.
+    assert cache.get(url).is_fresh(max_age=60)
+
+
+def test_browser_replaces_modified_pages(make_browser, cache, url):
+    new_page = PAGE.replace(b'Worldometer', b'Updated')
+    client, get_page_content = make_browser([(200, PAGE, VALIDATORS), (200, new_page, {'ETag': '"v2"'})])
+
+    get_page_content(url, max_age=60)
+    make_stale(cache, url)
+    html = get_page_content(url, max_age=60)
+
+    assert html.find('p', first=True).text == 'Updated'
+    assert cache.get(url).body == new_page
+    assert cache.get(url).etag == '"v2"'
+
+
+def test_browser_does_not_cache_error_responses(make_browser, cache, url):
+    client, get_page_content = make_browser([(200, PAGE, VALIDATORS), (404, b'Not Found', {})])
+
+    get_page_content(url, max_age=60)
+    make_stale(cache, url)
+    get_page_content(url, max_age=60)
+
+    cached = cache.get(url)
+    assert cached.body == PAGE
+    assert not cached.is_fresh(max_age=60)
+
+
+def test_browser_without_max_age_bypasses_the_cache(make_browser, cache, url):
+    client, get_page_content = make_browser([(200, PAGE, VALIDATORS)])
+
+    get_page_content(url, max_age=None)
+
+    assert [headers for _, _, headers in client.requests] == [None]
+    assert cache.get(url) is None
@@ -0,0 +1,170 @@
+import asyncio
+import itertools
+import threading
+import time
+
+import pytest
+
+from requests_html import HTML
+
+import worldometer.scraper.controller as controller
+
+from worldometer.scraper.pool import BrowserPool
+
+
+FAKE_PAGE = """
+<html>
+<body>
+    <table class="table">
+        <tr><th>Year</th><th>Population</th></tr>
+        <tr><td>2023</td><td>4,753,079,727</td></tr>
+    </table>
+    <script>
+        rts_counters['asia-population'] = {"last_value": 4753079727, "rate": 1.1};
+    </script>
+</body>
+</html>
+"""
+
+
+@pytest.fixture
+def fetched_urls(monkeypatch):
+    urls = []
+
+    def fake_get_page_content(url, timeout=30, max_age=None):
+        urls.append(url)
+        return HTML(html=FAKE_PAGE, url=url)
+
+    def fake_run_js_script(html_obj, script):
+        raise AssertionError('The page should not be rendered')
+
+    monkeypatch.setattr(controller.browser, 'get_page_content', fake_get_page_content)
+    monkeypatch.setattr(controller.browser, 'run_js_script', fake_run_js_script)
+    return urls
+
+
+def test_page_extracts_tables_and_rts_counters_from_a_single_fetch(fetched_urls):
+    page = controller.get_page('/world-population/asia-population')
+
+    tables = page.get_data_tables(new_column_names=[('year', 'population')])
+    rts_counters = page.get_rts_counters_object()
+    metadata = page.get_rts_counters_metadata()
+
+    assert fetched_urls == ['https://www.worldometers.info/world-population/asia-population']
+    assert tables == [[{'year': 2023, 'population': 4753079727}]]
+    assert rts_counters == {'asia-population': 4753079727}
+    assert metadata == {'asia-population': {'last_value': 4753079727, 'rate': 1.1}}
+
+
+def test_get_rts_counters_object(fetched_urls):
+    rts_counters = controller.get_rts_counters_object('/world-population/asia-population')
+
+    assert rts_counters == {'asia-population': 4753079727}
+    assert len(fetched_urls) == 1
+
+
+def test_concurrent_page_loads_share_a_single_fetch(monkeypatch):
+    urls = []
+
+    def slow_get_page_content(url, timeout=30, max_age=None):
+        urls.append(url)
+        time.sleep(0.1)
+        return HTML(html=FAKE_PAGE, url=url)
+
+    monkeypatch.setattr(controller.browser, 'get_page_content', slow_get_page_content)
+
+    barrier = threading.Barrier(4)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(controller.get_rts_counters_metadata('/world-population/asia-population'))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(urls) == 1
+    assert results == [{'asia-population': {'last_value': 4753079727, 'rate': 1.1}}] * 4
+
+
+def test_page_renders_the_rts_counters_when_they_are_declared_empty(monkeypatch):
+    rendered = {'asia-population': {'last_value': 4753079727, 'rate': 1.1}}
+    scripts = []
+
+    def fake_run_js_script(html_obj, script):
+        scripts.append(script)
+        return rendered
+
+    monkeypatch.setattr(controller.browser, 'run_js_script', fake_run_js_script)
+
+    html = '<html><script>var rts_counters = {};</script></html>'
+    page = controller.Page(HTML(html=html, url='https://www.worldometers.info/'))
+
+    assert page.get_rts_counters_object() == {'asia-population': 4753079727}
+    assert page.get_rts_counters_metadata() == rendered
+    assert len(scripts) == 1
+
+
+@pytest.fixture
+def async_session(fake_async_session, monkeypatch):
+    async def fake_run_js_script(html_obj, script):
+        raise AssertionError('The page should not be rendered')
+
+    monkeypatch.setattr(controller.async_browser, 'run_js_script', fake_run_js_script)
+    return fake_async_session(itertools.repeat((200, FAKE_PAGE)), delay=0.01)
+
+
+def test_aget_rts_counters(async_session):
+    async def main():
+        return await asyncio.gather(
+            controller.aget_rts_counters_object('/world-population/asia-population'),
+            controller.aget_rts_counters_metadata('/world-population/asia-population')
+        )
+
+    rts_counters, metadata = asyncio.run(main())
+
+    assert rts_counters == {'asia-population': 4753079727}
+    assert metadata == {'asia-population': {'last_value': 4753079727, 'rate': 1.1}}
+    # Both coroutines share the same fetch.
+    assert [url for url, _, _ in async_session.requests] == [
+        'https://www.worldometers.info/world-population/asia-population'
+    ]
+
+
+def test_aget_data_tables(async_session):
+    tables = asyncio.run(controller.aget_data_tables(
+        '/world-population/asia-population',
+        new_column_names=[('year', 'population')]
+    ))
+
+    assert tables == [[{'year': 2023, 'population': 4753079727}]]
+    assert len(async_session.requests) == 1
+
+
+def test_aget_page_html(async_session):
+    html = asyncio.run(controller.aget_page_html('/world-population/asia-population'))
+
+    assert '<table class="table">' in html
+
+
+def test_set_browser_pool_closes_the_old_pool(monkeypatch):
+    closed = []
+
+    class FakePool:
+
+        def close(self):
+            closed.append(self)
+
+    old_pool = FakePool()
+    monkeypatch.setattr(controller.browser, 'pool', old_pool)
+
+    controller.set_browser_pool(size=2, max_renders=10, max_memory=2**30)
+
+    assert closed == [old_pool]
+    assert isinstance(controller.browser.pool, BrowserPool)
+    assert controller.browser.pool.size == 2
+    assert controller.browser.pool.max_renders == 10
+    assert controller.browser.pool.max_memory == 2**30
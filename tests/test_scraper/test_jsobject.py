@@ -0,0 +1,86 @@
+import math
+
+import pytest
+
+from worldometer.scraper.jsobject import parse_js_value
+from worldometer.scraper.exceptions import JSObjectParserError
+
+
+@pytest.mark.parametrize(
+    'source, expected',
+    [
+        ('1', 1),
+        ('-1', -1),
+        ('1.5', 1.5),
+        ('.5', 0.5),
+        ('1e3', 1000.0),
+        ('0x1F', 31),
+        ('"a\\"b"', 'a"b'),
+        ("'a\\nb'", 'a\nb'),
+        ("'\\u0041'", 'A'),
+        ('true', True),
+        ('false', False),
+        ('null', None),
+        ('undefined', None),
+        ('[1, 2, ]', [1, 2]),
+        ('{}', {}),
+        ('[]', [])
+    ]
+)
+def test_parse_js_value_literals(source, expected):
+    value, end = parse_js_value(source)
+
+    assert value == expected
+    assert end == len(source)
+
+
+def test_parse_js_value_special_numbers():
+    nan, _ = parse_js_value('NaN')
+    inf, _ = parse_js_value('Infinity')
+
+    assert math.isnan(nan)
+    assert math.isinf(inf)
+
+
+def test_parse_js_value_object():
+    source = """{
+        // comment
+        a: 1,
+        'b': {"c": [1, 2.5, null]},
+        /* another comment */
+        $d_1: 'text',
+        2: true,
+    }"""
+
+    value, end = parse_js_value(source)
+
+    assert value == {'a': 1, 'b': {'c': [1, 2.5, None]}, '$d_1': 'text', '2': True}
+    assert end == len(source)
+
+
+def test_parse_js_value_from_position():
+    source = 'var x = {a: 1}; var y = 2;'
+
+    value, end = parse_js_value(source, source.index('{'))
+
+    assert value == {'a': 1}
+    assert source[end] == ';'
+
+
+@pytest.mark.parametrize(
+    'source',
+    [
+        '',
+        '{a: 1',
+        '{a 1}',
+        '[1 2]',
+        '"unterminated',
+        '{a: b}',
+        '{a: 1 + 2}',
+        '{a: new Date()}',
+        '{a: function () {}}'
+    ]
+)
+def test_parse_js_value_with_invalid_source(source):
+    with pytest.raises(JSObjectParserError):
+        parse_js_value(source)
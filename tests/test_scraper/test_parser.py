@@ -1,12 +1,24 @@
+import numpy as np
+import pandas as pd
 import pytest
 
 from worldometer.scraper.parser import (
+    get_rts_counters_from_html,
     get_rts_counters_only_with_last_value_key,
-    get_html_tables_data
+    get_rts_counters_with_metadata,
+    get_html_tables_data,
+    get_html_tables_frames,
+    convert_column_types,
+    frame_to_arrays,
+    frame_to_records,
+    register_table_parser_backend,
+    TABLE_PARSER_BACKENDS
 )
 from worldometer.scraper.exceptions import (
     ColumnNamesLengthError,
-    HTMLTablesNotFoundError
+    HTMLTablesNotFoundError,
+    JSObjectParserError,
+    RTSCountersNotFoundError
 )
 
 
@@ -106,6 +118,27 @@ def test_get_rts_counters_only_with_last_value_key(fake_rts_counters_object: dic
     )
 
 
+def test_get_rts_counters_with_metadata(fake_rts_counters_object: dict):
+
+    rts_counters = get_rts_counters_with_metadata(fake_rts_counters_object)
+
+    assert rts_counters == {
+        'a': {'last_value': 1},
+        'b': {'last_value': 1.0},
+        'c': {'last_value': None}
+    }
+
+
+def test_get_rts_counters_with_metadata_keeps_numeric_fields():
+    rts_counters_object = {
+        'a': {'last_value': 10, 'rate': 0.5, 'interval': 1000, 'visible': True, 'name': 'a'}
+    }
+
+    rts_counters = get_rts_counters_with_metadata(rts_counters_object)
+
+    assert rts_counters == {'a': {'last_value': 10, 'rate': 0.5, 'interval': 1000}}
+
+
 def test_empty_rts_counters_object_passed():
     empty_rts_counters = {}
 
@@ -115,6 +148,97 @@ def test_empty_rts_counters_object_passed():
     assert len(rts_counters) == 0
 
 
+@pytest.fixture
+def fake_html_with_rts_counters():
+    return """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>HTML to Tests</title>
+            <script src="/js/counters.js">var rts_counters = {ignored: {}};</script>
+            <script type="text/javascript">
+                var rts_counters = {
+                    a: {k1: {}, k2: 'test', last_value: 1},
+                    'b': {k1: {}, k2: "test", last_value: 1.0}
+                };
+                rts_counters['c'] = {k1: {}, k2: 'test', last_value: null};
+                if (rts_counters == null) {}
+            </script>
+        </head>
+        <body>
+        </body>
+        </html>
+"""
+
+
+def test_get_rts_counters_from_html(fake_html_with_rts_counters: str, fake_rts_counters_object: dict):
+
+    rts_counters = get_rts_counters_from_html(fake_html_with_rts_counters)
+
+    assert rts_counters == fake_rts_counters_object
+
+
+def test_get_rts_counters_from_html_when_there_is_no_rts_counters(fake_html: str):
+    with pytest.raises(RTSCountersNotFoundError):
+        get_rts_counters_from_html(fake_html)
+
+
+@pytest.mark.parametrize('script', [
+    'var rts_counters = {};',
+    "var rts_counters = {}; rts_counters['a'] = {k1: 'test'};"
+])
+def test_get_rts_counters_from_html_when_there_are_no_counters(script: str):
+    html = f'<script>{script}</script>'
+
+    with pytest.raises(RTSCountersNotFoundError):
+        get_rts_counters_from_html(html)
+
+
+def test_get_rts_counters_from_html_when_it_is_not_a_literal():
+    html = """
+        <script>
+            rts_counters = {a: {last_value: start_value + elapsed * rate}};
+        </script>
+    """
+
+    with pytest.raises(JSObjectParserError):
+        get_rts_counters_from_html(html)
+
+
+@pytest.mark.parametrize('assignment', [
+    'rts_counters[key] = {k1: {}, last_value: 1};',
+    "rts_counters[keys[0]] = {k1: {}, last_value: 1};",
+    "rts_counters['b'].last_value = {};",
+    "rts_counters['b'] = make_counter('b');",
+    'rts_counters.b = null;',
+])
+def test_get_rts_counters_from_html_when_an_assignment_cannot_be_parsed(assignment: str):
+    html = f"""
+        <script>
+            var rts_counters = {{a: {{last_value: 1}}}};
+            {assignment}
+        </script>
+    """
+
+    with pytest.raises(JSObjectParserError):
+        get_rts_counters_from_html(html)
+
+
+def test_get_rts_counters_from_html_when_the_object_is_reassigned():
+    html = """
+        <script>
+            var rts_counters = {a: {last_value: 1}};
+            rts_counters['b'] = {last_value: 2};
+            rts_counters = {c: {last_value: 3}};
+            rts_counters.d = {last_value: 4};
+        </script>
+    """
+
+    rts_counters = get_rts_counters_from_html(html)
+
+    assert rts_counters == {'c': {'last_value': 3}, 'd': {'last_value': 4}}
+
+
 def test_get_html_tables_data(fake_html: str):
     num_expected_tables = 2
     attrs = None
@@ -155,9 +279,234 @@ def test_get_html_tables_data(fake_html: str):
         for value in dr.values()
     ]
     assert all(
-        isinstance(value, (int, float, str))
+        value is None or isinstance(value, (int, float, str))
         for value in data_rows_values
-    ), 'The column value is not of a supported type. It is expected to be int, float or str.'
+    ), 'The column value is not of a supported type. It is expected to be int, float, str or None.'
+
+
+@pytest.mark.parametrize('backend', ['lxml', 'bs4'])
+def test_get_html_tables_data_with_backend(fake_html: str, backend: str):
+    new_column_names = [('A1', 'B1', 'C1', 'D1'), ('A2', 'B2', 'C2', 'D2')]
+
+    data = get_html_tables_data(
+        html=fake_html,
+        attrs=None,
+        new_column_names=new_column_names,
+        backends=[backend]
+    )
+
+    assert len(data) == 2
+    assert all(
+        (dr[f'A{idx + 1}'], dr[f'B{idx + 1}'], dr[f'C{idx + 1}']) == ('test', 1, 1.0)
+        for idx, td in enumerate(data)
+        for dr in td
+    ), 'The column values are wrong. They are expected to be parsed to the same types by every backend.'
+
+
+def test_get_html_tables_data_backends_produce_identical_records(fake_html: str):
+    new_column_names = [('A1', 'B1', 'C1', 'D1'), ('A2', 'B2', 'C2', 'D2')]
+
+    lxml_data = get_html_tables_data(fake_html, attrs=None, new_column_names=new_column_names, backends=['lxml'])
+    bs4_data = get_html_tables_data(fake_html, attrs=None, new_column_names=new_column_names, backends=['bs4'])
+
+    assert str(lxml_data) == str(bs4_data)
+
+
+def test_get_html_tables_data_falls_back_to_next_backend(fake_html: str, monkeypatch):
+    def failing_backend(html, attrs):
+        raise ValueError('Could not parse')
+
+    monkeypatch.setitem(TABLE_PARSER_BACKENDS, 'failing', failing_backend)
+
+    data = get_html_tables_data(
+        fake_html,
+        attrs={'class': 'table'},
+        new_column_names=[('A1', 'B1', 'C1', 'D1')],
+        backends=['failing', 'lxml']
+    )
+
+    assert len(data) == 1
+
+
+def test_get_html_tables_data_does_not_fall_back_when_there_are_no_tables(monkeypatch):
+    calls = []
+
+    def fallback_backend(html, attrs):
+        calls.append(html)
+        return []
+
+    monkeypatch.setitem(TABLE_PARSER_BACKENDS, 'fallback', fallback_backend)
+
+    with pytest.raises(HTMLTablesNotFoundError):
+        get_html_tables_data(
+            '<html><body><p>No tables</p></body></html>',
+            attrs={'class': 'table'},
+            new_column_names=[('A1', 'B1', 'C1', 'D1')],
+            backends=['lxml', 'fallback']
+        )
+
+    assert calls == []
+
+
+def test_register_table_parser_backend(fake_html: str, monkeypatch):
+    monkeypatch.setattr('worldometer.scraper.tables.TABLE_PARSER_BACKENDS', {})
+    calls = []
+
+    def custom_backend(html, attrs):
+        calls.append((html, attrs))
+        return [pd.DataFrame({'A': [1], 'B': [2]})]
+
+    register_table_parser_backend('custom', custom_backend)
+
+    data = get_html_tables_data(
+        fake_html,
+        attrs={'class': 'table'},
+        new_column_names=[('a', 'b')],
+        backends=['custom']
+    )
+
+    assert calls == [(fake_html, {'class': 'table'})]
+    assert data == [[{'a': 1, 'b': 2}]]
+
+
+def test_get_html_tables_data_with_positions(fake_html: str):
+    new_column_names = [('A1', 'B1', 'C1', 'D1'), ('A2', 'B2', 'C2', 'D2')]
+
+    data = get_html_tables_data(
+        fake_html,
+        attrs=None,
+        new_column_names=new_column_names,
+        positions=[1]
+    )
+
+    assert len(data) == 2
+    assert data[0] is None
+    assert isinstance(data[1], list)
+    assert all(
+        tuple(dr.keys()) == new_column_names[1]
+        for dr in data[1]
+    ), 'The column names are wrong. They are expected to match the column names passed.'
+
+
+def test_get_html_tables_data_with_positions_keeps_the_records(fake_html: str):
+    new_column_names = [('A1', 'B1', 'C1', 'D1'), ('A2', 'B2', 'C2', 'D2')]
+
+    all_data = get_html_tables_data(fake_html, attrs=None, new_column_names=new_column_names)
+    selected_data = get_html_tables_data(
+        fake_html,
+        attrs=None,
+        new_column_names=new_column_names,
+        positions=[0, 1]
+    )
+
+    assert str(selected_data) == str(all_data)
+
+
+def test_get_html_tables_data_with_columns(fake_html: str):
+    new_column_names = [('A1', 'B1', 'C1', 'D1')]
+
+    data = get_html_tables_data(
+        fake_html,
+        attrs={'class': 'table'},
+        new_column_names=new_column_names,
+        positions=[0],
+        columns={0: ('A1', 'C1')}
+    )
+
+    assert data == [[{'A1': 'test', 'C1': 1.0}, {'A1': 'test', 'C1': 1.0}]]
+
+
+def test_convert_column_types():
+    df = pd.DataFrame({
+        'population': ['1,425,775,850', '338,289,857', 'N.A.'],
+        'yearly_change': ['0.81 %', '\u22120.05 %', '1.5 %'],
+        'density': [1, 2, 3],
+        'fertility_rate': ['1.2', '', '2.0'],
+        'country': ['India', 'United States', 'Other']
+    })
+
+    df = convert_column_types(df, {
+        'population': 'int',
+        'yearly_change': 'percent',
+        'density': 'int',
+        'fertility_rate': 'float',
+        'missing_column': 'int'
+    })
+
+    assert df['population'].dtype == 'Int64'
+    assert df['population'].tolist()[:2] == [1425775850, 338289857]
+    assert df['population'].isna().tolist() == [False, False, True]
+    assert df['yearly_change'].tolist() == [0.81, -0.05, 1.5]
+    assert df['density'].dtype == 'int64'
+    assert df['fertility_rate'].dtype == 'float64'
+    assert df['fertility_rate'].isna().tolist() == [False, True, False]
+    assert df['country'].tolist() == ['India', 'United States', 'Other']
+
+
+def test_frame_to_records():
+    df = pd.DataFrame({
+        'a': pd.Series([1, None], dtype='Int64'),
+        'b': [1.0, float('nan')],
+        'c': ['x', None]
+    })
+
+    records = frame_to_records(df)
+
+    assert records[0] == {'a': 1, 'b': 1.0, 'c': 'x'}
+    assert records[1] == {'a': None, 'b': None, 'c': None}
+    assert isinstance(records[0]['a'], int)
+    assert isinstance(records[0]['b'], float)
+
+
+def test_frame_to_arrays():
+    df = pd.DataFrame({
+        'a': pd.Series([1, None], dtype='Int64'),
+        'b': [1, 2],
+        'c': ['x', 'y']
+    })
+
+    arrays = frame_to_arrays(df)
+
+    assert arrays['a'].dtype == np.float64 and np.isnan(arrays['a'][1])
+    assert arrays['b'].dtype == np.int64
+    assert arrays['c'].tolist() == ['x', 'y']
+
+    arrays['b'][0] = 10
+    assert df['b'][0] == 1, 'The arrays are expected to be copies of the columns.'
+
+
+def test_get_html_tables_frames(fake_html: str):
+    frames = get_html_tables_frames(
+        fake_html,
+        attrs={'class': 'table'},
+        new_column_names=[('A1', 'B1', 'C1', 'D1')],
+        column_types={0: {'B1': 'int'}}
+    )
+
+    assert len(frames) == 1
+    assert isinstance(frames[0], pd.DataFrame)
+    assert list(frames[0].columns) == ['A1', 'B1', 'C1', 'D1']
+    assert frames[0]['B1'].dtype == 'int64'
+
+
+def test_get_html_tables_data_with_column_types(fake_html: str):
+    new_column_names = [('A1', 'B1', 'C1', 'D1')]
+
+    data = get_html_tables_data(
+        fake_html,
+        attrs={'class': 'table'},
+        new_column_names=new_column_names,
+        columns={0: ('B1', 'C1')},
+        column_types={0: {'B1': 'float', 'C1': 'int'}}
+    )
+
+    assert data == [[{'B1': 1.0, 'C1': 1}, {'B1': 1.0, 'C1': 1}]]
+    assert all(isinstance(dr['C1'], int) for dr in data[0])
+
+
+def test_get_html_tables_data_with_positions_and_wrong_length_of_new_column_names(fake_html: str):
+    with pytest.raises(ColumnNamesLengthError):
+        get_html_tables_data(fake_html, attrs=None, new_column_names=[('A1',)], positions=[0])
 
 
 def test_get_html_tables_data_with_attrs(fake_html: str):
@@ -193,9 +542,9 @@ def test_get_html_tables_data_with_attrs(fake_html: str):
         for value in dr.values()
     ]
     assert all(
-        isinstance(value, (int, float, str))
+        value is None or isinstance(value, (int, float, str))
         for value in data_rows_values
-    ), 'The column value is not of a supported type. It is expected to be int, float or str.'
+    ), 'The column value is not of a supported type. It is expected to be int, float, str or None.'
 
 
 @pytest.mark.parametrize(
@@ -229,6 +578,9 @@ def test_get_html_tables_data_when_there_is_no_html_table():
     with pytest.raises(HTMLTablesNotFoundError):
         get_html_tables_data(html, attrs=None, new_column_names=[])
 
+    with pytest.raises(HTMLTablesNotFoundError):
+        get_html_tables_data(html, attrs=None, new_column_names=[], positions=[0])
+
 
 def test_get_html_tables_data_when_there_is_no_html_document():
     with pytest.raises(ValueError):
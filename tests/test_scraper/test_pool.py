@@ -0,0 +1,202 @@
+import threading
+import time
+
+import pytest
+
+from pyppeteer.errors import NetworkError
+
+from worldometer.scraper.browser import Browser
+from worldometer.scraper.exceptions import PoolTimeoutError
+from worldometer.scraper.pool import BrowserPool, PooledBrowser, SessionPool
+from worldometer.scraper.resilience import CircuitBreakers
+from worldometer.scraper.transport import RequestsTransport
+
+
+@pytest.fixture
+def fake_pooled_browser(monkeypatch):
+    calls = {'render': 0, 'close': 0, 'crashes': 0}
+
+    def render(self, url, script=None, timeout=30):
+        calls['render'] += 1
+        if calls['crashes']:
+            calls['crashes'] -= 1
+            raise NetworkError('Browser crashed')
+        self.renders += 1
+        return f'<html>{url}</html>', script
+
+    def close(self):
+        calls['close'] += 1
+        self.renders = 0
+
+    monkeypatch.setattr(PooledBrowser, 'render', render)
+    monkeypatch.setattr(PooledBrowser, 'close', close)
+
+    return calls
+
+
+def test_browser_pool_render(fake_pooled_browser):
+    pool = BrowserPool(size=2)
+
+    content, script_return = pool.render('https://www.example.com', script='() => 1')
+
+    assert content == '<html>https://www.example.com</html>'
+    assert script_return == '() => 1'
+    assert fake_pooled_browser['close'] == 0
+
+
+def test_browser_pool_recycles_after_max_renders(fake_pooled_browser):
+    pool = BrowserPool(size=1, max_renders=2)
+
+    for _ in range(5):
+        pool.render('https://www.example.com')
+
+    assert fake_pooled_browser['render'] == 5
+    assert fake_pooled_browser['close'] == 2
+
+
+def test_browser_pool_recovers_from_crash(fake_pooled_browser):
+    pool = BrowserPool(size=1)
+    fake_pooled_browser['crashes'] = 1
+
+    content, _ = pool.render('https://www.example.com')
+
+    assert content == '<html>https://www.example.com</html>'
+    assert fake_pooled_browser['render'] == 2
+    assert fake_pooled_browser['close'] == 1
+
+
+def test_browser_pool_reuses_browsers(fake_pooled_browser):
+    pool = BrowserPool(size=2)
+
+    with pool.acquire() as first:
+        pass
+
+    with pool.acquire() as second:
+        pass
+
+    assert first is second
+
+
+@pytest.mark.parametrize('size', [0, -1])
+def test_browser_pool_with_invalid_size(size):
+    with pytest.raises(ValueError):
+        BrowserPool(size=size)
+
+
+def test_session_pool_creates_sessions_on_demand_up_to_its_size():
+    pool = SessionPool(size=2, timeout=0.01)
+
+    with pool.acquire() as first:
+        with pool.acquire() as second:
+            assert first is not second
+
+            with pytest.raises(PoolTimeoutError, match='2 sessions'):
+                with pool.acquire():
+                    pass
+
+    with pool.acquire() as session:
+        assert session in (first, second)
+
+    assert len(pool._sessions) == 2
+    pool.close()
+
+
+def test_session_pool_without_keep_alive():
+    pool = SessionPool(keep_alive=False)
+
+    with pool.acquire() as session:
+        assert session.headers['Connection'] == 'close'
+        assert session.get_adapter('https://www.worldometers.info')._pool_maxsize == 1
+
+    pool.close()
+
+
+def test_session_pool_from_several_threads():
+    pool = SessionPool(size=2)
+    in_use = set()
+    max_in_use = []
+    lock = threading.Lock()
+
+    def worker():
+        with pool.acquire() as session:
+            with lock:
+                assert session not in in_use
+                in_use.add(session)
+                max_in_use.append(len(in_use))
+            time.sleep(0.01)
+            with lock:
+                in_use.remove(session)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(max_in_use) <= 2
+    pool.close()
+
+
+def test_busy_session_pool_is_not_a_host_failure():
+    transport = RequestsTransport(size=1, timeout=0.01)
+    browser = Browser(transport=transport, breakers=CircuitBreakers(failure_threshold=1))
+    url = 'https://www.worldometers.info/'
+
+    with transport.sessions.acquire():
+        with pytest.raises(PoolTimeoutError):
+            browser.get_page_content(url)
+
+    assert not browser.breakers.get(url).is_open
+    transport.close()
+
+
+class FakeProcess:
+    pid = 0
+
+    def poll(self):
+        return None
+
+
+class FakeBrowserPage:
+
+    async def goto(self, url, options=None):
+        self.url = url
+
+    async def evaluate(self, script):
+        return script
+
+    async def content(self):
+        return f'<html>{self.url}</html>'
+
+
+class FakeBrowser:
+    process = FakeProcess()
+
+    async def newPage(self):
+        return FakeBrowserPage()
+
+    async def close(self):
+        pass
+
+
+def test_pooled_browser_creates_its_loop_on_the_first_render(monkeypatch):
+    async def fake_launch(**kwargs):
+        return FakeBrowser()
+
+    monkeypatch.setattr('worldometer.scraper.pool.pyppeteer.launch', fake_launch)
+
+    pool = BrowserPool(size=2)
+    pooled_browsers = list(pool._browsers)
+    assert all(pooled_browser._loop is None for pooled_browser in pooled_browsers)
+
+    content, script_return = pool.render('https://www.example.com', script='() => 1')
+
+    assert content == '<html>https://www.example.com</html>'
+    assert script_return == '() => 1'
+    assert sum(pooled_browser._loop is not None for pooled_browser in pooled_browsers) == 1
+
+    loops = [pooled_browser._loop for pooled_browser in pooled_browsers if pooled_browser._loop is not None]
+    pool.close()
+
+    assert all(loop.is_closed() for loop in loops)
+    assert all(pooled_browser._loop is None for pooled_browser in pooled_browsers)
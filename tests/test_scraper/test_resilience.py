@@ -0,0 +1,320 @@
+import asyncio
+
+import pytest
+import requests
+
+from pyppeteer.errors import ElementHandleError, TimeoutError
+from requests_html import HTML
+
+from worldometer.scraper.browser import AsyncBrowser, Browser
+from worldometer.scraper.cache import HTTPCache
+from worldometer.scraper.exceptions import CircuitOpenError, ScriptRunnerError
+from worldometer.scraper.resilience import (
+    CircuitBreaker,
+    CircuitBreakers,
+    RetryPolicy,
+    acall_with_retries,
+    call_with_retries
+)
+from worldometer.scraper.transport import RequestsTransport, Response
+
+
+PAGE = b'<html><body><p>Worldometer</p></body></html>'
+
+
+def test_retry_policy_delays():
+    assert list(RetryPolicy(attempts=4, backoff=1.0, max_backoff=3.0, jitter=False).delays()) == [1.0, 2.0, 3.0]
+    assert all(0 <= delay <= 1.0 for delay in RetryPolicy(attempts=10, backoff=1.0, max_backoff=1.0).delays())
+    assert list(RetryPolicy(attempts=1).delays()) == []
+
+
+def test_circuit_breaker(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr('worldometer.scraper.resilience.time.monotonic', lambda: now[0])
+
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0)
+    breaker.record_failure()
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.is_open
+    assert not breaker.allow()
+
+    # A single trial is allowed after the reset timeout.
+    now[0] = 10.0
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert not breaker.is_open
+    assert breaker.allow()
+
+
+def test_call_with_retries():
+    results = iter([ValueError('down'), ValueError('down'), 'page'])
+
+    def func():
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    breakers = CircuitBreakers(failure_threshold=3)
+    retry = RetryPolicy(attempts=3, backoff=0)
+
+    assert call_with_retries(func, 'https://a.com/x', retry, breakers, errors=(ValueError,)) == 'page'
+    assert not breakers.get('https://a.com/y').is_open
+
+
+def test_call_with_retries_opens_the_breaker_of_the_host():
+    calls = []
+
+    def func():
+        calls.append(1)
+        raise ValueError('down')
+
+    breakers = CircuitBreakers(failure_threshold=3, reset_timeout=60.0)
+    retry = RetryPolicy(attempts=2, backoff=0)
+
+    with pytest.raises(ValueError):
+        call_with_retries(func, 'https://a.com/x', retry, breakers, errors=(ValueError,))
+    assert not breakers.get('https://a.com/x').is_open
+
+    # Each failed attempt counts, so the breaker opens at the second
+    # attempt of this call, which is not retried any further.
+    with pytest.raises(ValueError):
+        call_with_retries(func, 'https://a.com/y', retry, breakers, errors=(ValueError,))
+    with pytest.raises(CircuitOpenError):
+        call_with_retries(func, 'https://a.com/z', retry, breakers, errors=(ValueError,))
+
+    assert len(calls) == 3
+    assert not breakers.get('https://b.com/x').is_open
+
+
+def test_call_with_retries_counts_failed_results():
+    breakers = CircuitBreakers(failure_threshold=2, reset_timeout=60.0)
+    retry = RetryPolicy(attempts=5, backoff=0)
+    calls = []
+
+    def func():
+        calls.append(1)
+        return 503
+
+    result = call_with_retries(func, 'https://a.com/x', retry, breakers, errors=(), is_failure=lambda r: r >= 500)
+
+    assert result == 503
+    assert len(calls) == 2
+    assert breakers.get('https://a.com/x').is_open
+
+
+def test_acall_with_retries():
+    results = iter([ValueError('down'), 'page'])
+    breakers = CircuitBreakers(failure_threshold=2, reset_timeout=60.0)
+    retry = RetryPolicy(attempts=3, backoff=0)
+
+    async def func():
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def fail():
+        raise ValueError('down')
+
+    async def main():
+        page = await acall_with_retries(func, 'https://a.com/x', retry, breakers, errors=(ValueError,))
+        with pytest.raises(ValueError):
+            await acall_with_retries(fail, 'https://a.com/x', retry, breakers, errors=(ValueError,))
+        with pytest.raises(CircuitOpenError):
+            await acall_with_retries(fail, 'https://a.com/x', retry, breakers, errors=(ValueError,))
+        return page
+
+    assert asyncio.run(main()) == 'page'
+
+
+class FlakyTransport(RequestsTransport):
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def get(self, url, timeout=30, headers=None):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return Response(url, outcome, PAGE if outcome == 200 else b'Error', 'utf-8', {}, 'HTTP/1.1')
+
+
+def make_browser(outcomes, failure_threshold=5):
+    return Browser(
+        transport=FlakyTransport(outcomes),
+        retry=RetryPolicy(attempts=2, backoff=0),
+        breakers=CircuitBreakers(failure_threshold=failure_threshold, reset_timeout=60.0)
+    )
+
+
+def test_browser_retries_transient_failures():
+    browser = make_browser([requests.ConnectionError(), requests.Timeout()], failure_threshold=10)
+    url = 'https://www.worldometers.info/'
+
+    with pytest.raises(requests.Timeout):
+        browser.get_page_content(url)
+
+    # Without a good version of the page, the error page is returned as before.
+    browser.transport.outcomes = [503, 503]
+    assert browser.get_page_content(url).html == 'Error'
+
+    browser.transport.outcomes = [503, 200]
+    assert browser.get_page_content(url).find('p', first=True).text == 'Worldometer'
+
+
+def test_browser_serves_the_last_good_page_while_the_breaker_is_open():
+    browser = make_browser([200, 503, 503], failure_threshold=2)
+    url = 'https://www.worldometers.info/'
+
+    browser.get_page_content(url)
+    assert browser.get_page_content(url).find('p', first=True).text == 'Worldometer'
+    assert browser.transport.calls == 3
+
+    # The breaker is open, so the page is not requested.
+    assert browser.get_page_content(url).find('p', first=True).text == 'Worldometer'
+    assert browser.transport.calls == 3
+
+    with pytest.raises(CircuitOpenError):
+        browser.get_page_content('https://www.worldometers.info/other')
+
+
+class FlakyPool:
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def render(self, url, script=None, timeout=30):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return PAGE.decode(), outcome
+
+
+def test_browser_render_only_retries_timeouts():
+    browser = Browser(
+        pool=FlakyPool([TimeoutError(), 'rendered', ElementHandleError()]),
+        transport=FlakyTransport([]),
+        retry=RetryPolicy(attempts=3, backoff=0)
+    )
+    html_obj = HTML(html=PAGE, url='https://www.worldometers.info/')
+
+    assert browser.run_js_script(html_obj, '() => 1') == 'rendered'
+    assert browser.pool.calls == 2
+
+    with pytest.raises(ScriptRunnerError):
+        browser.run_js_script(html_obj, '() => undefined_variable')
+    assert browser.pool.calls == 3
+
+
+def make_async_browser(fake_async_session, outcomes, failure_threshold=5):
+    fake_async_session([
+        (outcome, PAGE if outcome == 200 else b'Error') if isinstance(outcome, int) else outcome
+        for outcome in outcomes
+    ])
+    return AsyncBrowser(
+        retry=RetryPolicy(attempts=2, backoff=0),
+        breakers=CircuitBreakers(failure_threshold=failure_threshold, reset_timeout=60.0)
+    )
+
+
+def test_async_browser_retries_transient_failures(fake_async_session):
+    browser = make_async_browser(
+        fake_async_session,
+        [requests.ConnectionError(), requests.Timeout(), 503, 503, 503, 200],
+        failure_threshold=10
+    )
+    url = 'https://www.worldometers.info/'
+
+    async def main():
+        with pytest.raises(requests.Timeout):
+            await browser.get_page_content(url)
+
+        # Without a good version of the page, the error page is returned as before.
+        error_page = await browser.get_page_content(url)
+        page = await browser.get_page_content(url)
+        return error_page, page
+
+    error_page, page = asyncio.run(main())
+
+    assert error_page.html == 'Error'
+    assert page.find('p', first=True).text == 'Worldometer'
+    assert len(browser.session.requests) == 6
+
+
+def test_async_browser_serves_the_last_good_page_while_the_breaker_is_open(fake_async_session):
+    browser = make_async_browser(fake_async_session, [200, 503, 503], failure_threshold=2)
+    url = 'https://www.worldometers.info/'
+
+    async def main():
+        pages = [await browser.get_page_content(url) for _ in range(2)]
+        assert len(browser.session.requests) == 3
+
+        # The breaker is open, so the page is not requested.
+        pages.append(await browser.get_page_content(url))
+        assert len(browser.session.requests) == 3
+
+        with pytest.raises(CircuitOpenError):
+            await browser.get_page_content('https://www.worldometers.info/other')
+
+        return pages
+
+    pages = asyncio.run(main())
+
+    assert all(page.find('p', first=True).text == 'Worldometer' for page in pages)
+
+
+def test_async_browser_serves_the_cached_page_while_the_host_is_down(fake_async_session, tmp_path):
+    browser = make_async_browser(fake_async_session, [requests.Timeout(), requests.Timeout()])
+    browser.cache = HTTPCache(str(tmp_path))
+    url = 'https://www.worldometers.info/'
+    browser.cache.set(url, body=PAGE, encoding='utf-8')
+
+    # Without a max age the cache is not used to get the page, only as a fallback.
+    page = asyncio.run(browser.get_page_content(url))
+
+    assert page.find('p', first=True).text == 'Worldometer'
+    assert len(browser.session.requests) == 2
+
+
+class RenderedHTML(HTML):
+
+    async def arender(self, script=None):
+        self.__dict__.update(HTML(html=PAGE, url=self.url).__dict__)
+        return 'rendered'
+
+
+class TimingOutHTML(HTML):
+
+    async def arender(self, script=None):
+        raise TimeoutError()
+
+
+def test_async_browser_serves_the_last_good_render(fake_async_session):
+    browser = make_async_browser(fake_async_session, [], failure_threshold=2)
+    url = 'https://www.worldometers.info/'
+
+    async def main():
+        first = await browser.run_js_script(RenderedHTML(html=b'<html></html>', url=url), '() => 1')
+
+        html_obj = TimingOutHTML(html=b'<html></html>', url=url)
+        second = await browser.run_js_script(html_obj, '() => 1')
+
+        # The breaker is open, and there is no good render of this script.
+        with pytest.raises(CircuitOpenError):
+            await browser.run_js_script(TimingOutHTML(html=b'<html></html>', url=url), '() => 2')
+
+        return first, second, html_obj
+
+    first, second, html_obj = asyncio.run(main())
+
+    assert first == second == 'rendered'
+    assert html_obj.find('p', first=True).text == 'Worldometer'
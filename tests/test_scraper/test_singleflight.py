@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from worldometer.scraper.singleflight import AsyncSingleFlight, SingleFlight, make_key
+
+
+def test_make_key():
+    assert make_key('a', [('x', 'y')], {'class': 'table'}, None) == (
+        'a', (('x', 'y'),), (('class', 'table'),), None
+    )
+    assert hash(make_key({0: {'population': 'int'}}))
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    flights = SingleFlight()
+    calls = []
+    barrier = threading.Barrier(5)
+
+    def load(key):
+        calls.append(key)
+        time.sleep(0.1)
+        return object()
+
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(flights.do('key', load, 'key'))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ['key']
+    assert len(set(map(id, results))) == 1
+    assert len(flights) == 0
+
+
+def test_single_flight_does_not_cache_results():
+    flights = SingleFlight()
+    calls = []
+
+    flights.do('key', calls.append, 1)
+    flights.do('key', calls.append, 2)
+
+    assert calls == [1, 2]
+
+
+def test_single_flight_shares_exceptions():
+    flights = SingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def load():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError('unavailable')
+
+    def waiter():
+        started.wait()
+        try:
+            flights.do('key', load)
+        except ValueError as err:
+            errors.append(err)
+
+    thread = threading.Thread(target=waiter)
+    thread.start()
+
+    with pytest.raises(ValueError):
+        flights.do('key', load)
+    thread.join()
+
+    assert len(errors) == 1
+    assert len(flights) == 0
+
+
+def test_async_single_flight_coalesces_concurrent_calls():
+    flights = AsyncSingleFlight()
+    calls = []
+
+    async def load(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return object()
+
+    async def main():
+        return await asyncio.gather(*(flights.do('key', load, 'key') for _ in range(5)))
+
+    results = asyncio.run(main())
+
+    assert calls == ['key']
+    assert len(set(map(id, results))) == 1
+    assert len(flights) == 0
+
+
+def test_async_single_flight_waiter_cancellation_does_not_cancel_the_call():
+    flights = AsyncSingleFlight()
+
+    async def load():
+        await asyncio.sleep(0.05)
+        return 'page'
+
+    async def main():
+        first = asyncio.ensure_future(flights.do('key', load))
+        second = asyncio.ensure_future(flights.do('key', load))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == 'page'
@@ -0,0 +1,193 @@
+import gzip
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from worldometer.scraper.browser import Browser
+from worldometer.scraper.resilience import RetryPolicy
+from worldometer.scraper.transport import HTTPXTransport, RequestsTransport, Response, Transport, TransportStats
+
+
+PAGE = b'<html><body><p>Worldometer</p></body></html>'
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = PAGE
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}/'
+    server.shutdown()
+    server.server_close()
+
+
+def test_requests_transport_reuses_connections(server_url):
+    transport = RequestsTransport(size=1)
+
+    responses = [transport.get(server_url) for _ in range(3)]
+
+    assert all(res.status_code == 200 for res in responses)
+    assert responses[0].content == PAGE
+    assert responses[0].encoding == 'utf-8'
+    assert responses[0].http_version == 'HTTP/1.1'
+
+    stats = transport.stats()
+    assert stats.requests == 3
+    assert stats.connections == 1
+    assert stats.reused_connections == 2
+    assert stats.http_versions == {'HTTP/1.1': 3}
+
+    transport.close()
+
+
+def test_requests_transport_without_keep_alive(server_url):
+    transport = RequestsTransport(size=1, keep_alive=False)
+
+    for _ in range(2):
+        transport.get(server_url)
+
+    assert transport.stats().connections == 2
+    transport.close()
+
+
+class FakeTransport(Transport):
+
+    def __init__(self):
+        self.urls = []
+
+    def get(self, url, timeout=30, headers=None):
+        self.urls.append(url)
+        return Response(url, 200, PAGE, 'utf-8', {}, 'HTTP/2')
+
+    def stats(self):
+        return TransportStats(len(self.urls), 1, {'HTTP/2': len(self.urls)})
+
+
+def test_browser_with_custom_transport():
+    transport = FakeTransport()
+    browser = Browser(transport=transport)
+
+    html = browser.get_page_content('https://www.worldometers.info/')
+
+    assert transport.urls == ['https://www.worldometers.info/']
+    assert html.url == 'https://www.worldometers.info/'
+    assert html.find('p', first=True).text == 'Worldometer'
+
+
+def test_transport_is_abstract():
+    class IncompleteTransport(Transport):
+
+        def get(self, url, timeout=30, headers=None):
+            return Response(url, 200, PAGE, 'utf-8', {}, 'HTTP/1.1')
+
+    with pytest.raises(TypeError):
+        IncompleteTransport()
+
+
+def test_httpx_transport(server_url):
+    pytest.importorskip('httpx')
+
+    transport = HTTPXTransport(http2=False)
+    responses = [transport.get(server_url) for _ in range(2)]
+
+    assert responses[0].content == PAGE
+    assert responses[0].encoding == 'utf-8'
+
+    stats = transport.stats()
+    assert stats.requests == 2
+    assert stats.connections == 1
+    assert stats.http_versions == {'HTTP/1.1': 2}
+    transport.close()
+
+
+class MockHTTPX:
+    # Sends the requests of the client created by HTTPXTransport
+    # to `handler`, which is set by each test.
+
+    def __init__(self, httpx):
+        self.httpx = httpx
+        self.requests = []
+        self.handler = None
+
+    def handle(self, request):
+        self.requests.append(request)
+        return self.handler(request)
+
+
+@pytest.fixture
+def mock_httpx(monkeypatch):
+    httpx = pytest.importorskip('httpx')
+    mock = MockHTTPX(httpx)
+
+    client = httpx.Client
+    monkeypatch.setattr(httpx, 'Client', lambda **kwargs: client(transport=httpx.MockTransport(mock.handle), **kwargs))
+
+    mock.transport = HTTPXTransport()
+    yield mock
+    mock.transport.close()
+
+
+def test_httpx_transport_response(mock_httpx):
+    httpx = mock_httpx.httpx
+    mock_httpx.handler = lambda request: httpx.Response(
+        200,
+        content=PAGE,
+        headers={'Content-Type': 'text/html; charset=utf-8', 'ETag': '"v1"'},
+        extensions={'http_version': b'HTTP/2'}
+    )
+
+    res = mock_httpx.transport.get('https://www.worldometers.info/', headers={'If-None-Match': '"v0"'})
+
+    assert res == Response(
+        url='https://www.worldometers.info/',
+        status_code=200,
+        content=PAGE,
+        encoding='utf-8',
+        headers=res.headers,
+        http_version='HTTP/2'
+    )
+    assert res.headers['ETag'] == '"v1"'
+
+    request = mock_httpx.requests[0]
+    assert request.headers['If-None-Match'] == '"v0"'
+    assert request.headers['User-Agent'].startswith('Mozilla')
+    assert mock_httpx.transport.stats().http_versions == {'HTTP/2': 1}
+
+
+def test_httpx_transport_errors_are_retried(mock_httpx):
+    httpx = mock_httpx.httpx
+    outcomes = [httpx.ConnectError('down'), httpx.Response(200, content=PAGE)]
+
+    def handler(request):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    mock_httpx.handler = handler
+    browser = Browser(transport=mock_httpx.transport, retry=RetryPolicy(attempts=2, backoff=0))
+
+    html = browser.get_page_content('https://www.worldometers.info/')
+
+    assert html.find('p', first=True).text == 'Worldometer'
+    assert len(mock_httpx.requests) == 2
@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+from worldometer.world.archive import CounterArchive, _decode_varints, _encode_varints
+from worldometer.world.counters import COUNTER_INDEX, CounterSnapshot
+
+
+def make_snapshot(timestamp, population, births=None):
+    snapshot = CounterSnapshot()
+    snapshot.buffer[0] = timestamp
+    snapshot._values[COUNTER_INDEX['current_population']] = population
+    if births is not None:
+        snapshot._values[COUNTER_INDEX['births_today']] = births
+    return snapshot
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'counters.wma')
+
+
+def fill(archive, n=10):
+    for i in range(n):
+        archive.append(make_snapshot(1700000000.0 + i, 8065299074 + 3 * i, births=0.5 * i))
+
+
+def test_varints_roundtrip():
+    values = np.array([0, 1, 127, 128, 300, 2 ** 35, 2 ** 63], dtype=np.uint64)
+
+    data = np.frombuffer(_encode_varints(values), dtype=np.uint8)
+
+    assert len(data) == 1 + 1 + 1 + 2 + 2 + 6 + 10
+    assert _decode_varints(data, len(values)).tolist() == values.tolist()
+
+
+def test_archive_query(path):
+    with CounterArchive(path, chunk_size=4) as archive:
+        fill(archive)
+
+        times, values = archive.query(names=['current_population', 'births_today', 'deaths_today'])
+
+    assert len(times) == 10
+    assert times[0] == 1700000000.0
+    assert values[:, 0].tolist() == [8065299074 + 3 * i for i in range(10)]
+    assert values[:, 1].tolist() == [0.5 * i for i in range(10)]
+    assert np.isnan(values[:, 2]).all()
+
+
+def test_archive_is_reopened(path):
+    with CounterArchive(path, chunk_size=4) as archive:
+        fill(archive)
+
+    with CounterArchive(path) as archive:
+        assert len(archive) == 10
+        archive.append(make_snapshot(1700000010.0, 1))
+        assert len(archive) == 11
+
+    times, _ = CounterArchive(path).query()
+    assert len(times) == 11
+
+
+def test_archive_time_range_query(path):
+    with CounterArchive(path, chunk_size=4) as archive:
+        fill(archive)
+
+        times, values = archive.query(start=1700000003.0, end=1700000006.0, names=['current_population'])
+
+    assert times.tolist() == [1700000003.0, 1700000004.0, 1700000005.0]
+    assert values.shape == (3, 1)
+
+
+def test_archive_discards_partially_written_chunk(path):
+    with CounterArchive(path, chunk_size=4) as archive:
+        fill(archive, n=8)
+
+    with open(path, 'r+b') as f:
+        f.truncate(f.seek(0, 2) - 5)
+
+    with CounterArchive(path) as archive:
+        assert len(archive) == 4
+
+
+def test_archive_to_frame(path):
+    with CounterArchive(path, chunk_size=4) as archive:
+        fill(archive)
+        df = archive.to_frame(names=['current_population'])
+
+    assert list(df.columns) == ['current_population']
+    assert len(df) == 10
+    assert str(df.index.tz) == 'UTC'
+
+
+def test_archive_is_smaller_than_raw_values(path):
+    with CounterArchive(path, chunk_size=100) as archive:
+        fill(archive, n=100)
+
+    with open(path, 'rb') as f:
+        size = len(f.read())
+
+    assert size < 100 * 8 * (len(COUNTER_INDEX) + 1) / 10
@@ -0,0 +1,183 @@
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from requests_html import HTML
+
+import worldometer.scraper.controller as controller
+
+from worldometer.scraper.exceptions import ColumnNamesLengthError, HTMLTablesNotFoundError
+from worldometer.world.base import _DataTables, _row_dataclass
+
+
+@_row_dataclass
+class FakeData:
+    name: str
+    population: int
+    world_share: float
+
+    _table_position = 0
+    _percent_columns = ('world_share',)
+
+
+@_row_dataclass
+class OtherFakeData:
+    year: int
+    value: float
+
+    _table_position = 1
+
+
+class FakeTables(_DataTables):
+
+    source_path = '/fake'
+    new_column_names = (
+        ('name', 'population', 'world_share'),
+        ('year', 'value')
+    )
+
+    _row_types = (FakeData, OtherFakeData)
+
+
+FAKE_PAGE = """
+<html>
+<body>
+    <table class="table">
+        <tr><th>Name</th><th>Population</th><th>World Share</th></tr>
+        <tr><td>A</td><td>1,000</td><td>17.8 %</td></tr>
+        <tr><td>B</td><td>N.A.</td><td>2.5 %</td></tr>
+    </table>
+    <table class="table">
+        <tr><th>Year</th><th>Value</th></tr>
+        <tr><td>2023</td><td>1.5</td></tr>
+    </table>
+</body>
+</html>
+"""
+
+
+@pytest.fixture
+def fake_page(monkeypatch):
+    page = {'html': FAKE_PAGE}
+
+    def fake_get_page_content(url, timeout=30, max_age=None):
+        return HTML(html=page['html'], url=url)
+
+    monkeypatch.setattr(controller.browser, 'get_page_content', fake_get_page_content)
+    return page
+
+
+def test_aload(fake_async_session):
+    session = fake_async_session([(200, FAKE_PAGE)])
+
+    tables = asyncio.run(FakeTables.aload())
+
+    assert [url for url, _, _ in session.requests] == ['https://www.worldometers.info/fake']
+    assert tables._get_rows(FakeData)[0] == FakeData('A', 1000, 17.8)
+    assert tables._get_rows(OtherFakeData) == (OtherFakeData(2023, 1.5),)
+
+
+def test_aload_page_without_tables_fails(fake_async_session):
+    fake_async_session([(200, '<html><body><p>No tables</p></body></html>')])
+
+    with pytest.raises(HTMLTablesNotFoundError):
+        asyncio.run(FakeTables.aload())
+
+
+def test_page_without_tables_fails_on_creation(fake_page):
+    fake_page['html'] = '<html><body><p>No tables</p></body></html>'
+
+    with pytest.raises(HTMLTablesNotFoundError):
+        FakeTables()
+
+
+@pytest.mark.parametrize('html', [
+    FAKE_PAGE.replace('<th>Value</th>', '<th>Value</th><th>Extra</th>'),
+    FAKE_PAGE + '<table class="table"><tr><td>1</td></tr></table>'
+])
+def test_page_with_unexpected_tables_fails_on_creation(fake_page, html):
+    fake_page['html'] = html
+
+    with pytest.raises(ColumnNamesLengthError):
+        FakeTables()
+
+
+def test_tables_are_parsed_once_when_shared_between_threads(fake_page, monkeypatch):
+    tables = FakeTables()
+    parsed_positions = []
+    parse_tables = tables._parse_tables
+
+    def counting_parse_tables(positions):
+        parsed_positions.extend(positions)
+        parse_tables(positions)
+
+    monkeypatch.setattr(tables, '_parse_tables', counting_parse_tables)
+
+    barrier = threading.Barrier(8)
+    results = []
+
+    def worker(row_type):
+        barrier.wait()
+        results.append(tables._get_rows(row_type))
+
+    threads = [threading.Thread(target=worker, args=((FakeData, OtherFakeData)[i % 2],)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(parsed_positions) == [0, 1]
+    assert len(results) == 8
+    assert tables._page is None
+
+
+def test_to_frame(fake_page):
+    tables = FakeTables()
+
+    frame = tables.to_frame()
+
+    assert frame.columns.tolist() == ['name', 'population', 'world_share']
+    assert str(frame['population'].dtype) == 'Int64'
+    assert frame['population'].isna().tolist() == [False, True]
+    assert frame['world_share'].dtype == np.float64
+    assert frame['world_share'].tolist() == [17.8, 2.5]
+
+    other = tables.to_frame(OtherFakeData)
+    assert other.columns.tolist() == ['year', 'value']
+    assert other['year'].dtype == np.int64
+
+
+def test_to_frame_returns_a_copy(fake_page):
+    tables = FakeTables()
+
+    frame = tables.to_frame()
+    frame.loc[0, 'population'] = 0
+    frame['extra'] = 1
+
+    assert tables.to_frame().columns.tolist() == ['name', 'population', 'world_share']
+    assert tables.to_frame().loc[0, 'population'] == 1000
+    assert tables._get_rows(FakeData)[0].population == 1000
+
+
+def test_to_numpy(fake_page):
+    tables = FakeTables()
+
+    arrays = tables.to_numpy()
+
+    assert list(arrays) == ['name', 'population', 'world_share']
+    assert arrays['name'].tolist() == ['A', 'B']
+    # Integer columns with missing values become float arrays with NaN.
+    assert arrays['population'].dtype == np.float64
+    assert arrays['population'][0] == 1000
+    assert np.isnan(arrays['population'][1])
+    assert tables.to_numpy(OtherFakeData)['year'].dtype == np.int64
+
+    arrays['world_share'][0] = 0.0
+    assert tables.to_numpy()['world_share'][0] == 17.8
+
+
+def test_to_frame_with_invalid_table(fake_page):
+    with pytest.raises(IndexError):
+        FakeTables().to_frame(2)
@@ -0,0 +1,272 @@
+import asyncio
+import gc
+import itertools
+import time
+
+from dataclasses import asdict, fields, is_dataclass
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+import worldometer.world.counters as counters
+
+from worldometer.world.counters import COUNTER_INDEX, CounterSnapshot, WorldCounters, WorldPopulation
+
+
+@pytest.fixture
+def fake_metadata():
+    return {
+        'current_population': {'last_value': 8000000000, 'rate': 100.0},
+        'births_today': {'last_value': 5.5, 'rate': 0.0}
+    }
+
+
+@pytest.fixture
+def world_counters(fake_metadata, monkeypatch):
+    calls = []
+
+    def fake_get_rts_counters_metadata(path_url):
+        calls.append(path_url)
+        return fake_metadata
+
+    async def fake_aget_rts_counters_metadata(path_url):
+        return fake_get_rts_counters_metadata(path_url)
+
+    monkeypatch.setattr(counters, 'get_rts_counters_metadata', fake_get_rts_counters_metadata)
+    monkeypatch.setattr(counters, 'aget_rts_counters_metadata', fake_aget_rts_counters_metadata)
+
+    wc = WorldCounters()
+    wc.remote_calls = calls
+    return wc
+
+
+def test_counter_snapshot_get_value():
+    snapshot = CounterSnapshot()
+    population = COUNTER_INDEX['current_population']
+    births = COUNTER_INDEX['births_today']
+
+    snapshot._values[population] = 8065299074.0
+    snapshot._is_int[population] = 1.0
+    snapshot._values[births] = 1.5
+
+    assert snapshot._get_value(population) == 8065299074
+    assert isinstance(snapshot._get_value(population), int)
+    assert snapshot._get_value(births) == 1.5
+    assert isinstance(snapshot._get_value(births), float)
+    assert snapshot.value_of('dth1s_today') is None
+
+
+def test_counter_snapshot_to_dict():
+    snapshot = CounterSnapshot()
+    snapshot._values[COUNTER_INDEX['births_today']] = 1.5
+
+    values = snapshot.to_dict()
+
+    assert list(values) == list(COUNTER_INDEX)
+    assert values['births_today'] == 1.5
+    assert all(value is None for key, value in values.items() if key != 'births_today')
+
+
+def test_counter_snapshot_copy_is_independent():
+    snapshot = CounterSnapshot()
+    snapshot._values[COUNTER_INDEX['births_today']] = 1.5
+
+    copy = snapshot.copy()
+    snapshot._values[COUNTER_INDEX['births_today']] = 2.5
+
+    assert copy.value_of('births_today') == 1.5
+    assert not np.shares_memory(copy.buffer, snapshot.buffer)
+
+
+def test_counter_snapshot_with_invalid_buffer():
+    with pytest.raises(ValueError):
+        CounterSnapshot(np.zeros(3))
+
+
+def test_world_counters_sections_are_dataclasses(world_counters):
+    world_population = world_counters.world_population
+
+    assert is_dataclass(world_population)
+    assert [f.name for f in fields(world_population)] == list(world_population.to_dict())
+    assert asdict(world_population) == world_population.to_dict()
+    assert asdict(world_population)['current_population'] == 8000000000
+
+    # asdict reads the values of the snapshot when it is called.
+    world_counters._loaded_at -= 10
+    world_counters.reload_data(local=True)
+    assert asdict(world_population)['current_population'] == 8000001000
+
+
+def test_world_counters_sections_reflect_a_reload(world_counters, fake_metadata):
+    world_population = world_counters.world_population
+    assert isinstance(world_population, WorldPopulation)
+
+    fake_metadata['current_population'] = {'last_value': 8000000500, 'rate': 100.0}
+    fake_metadata['dth1s_today'] = {'last_value': 2.5}
+    world_counters.reload_data()
+
+    assert world_counters.world_population is world_population
+    assert world_population.current_population == 8000000500
+    assert world_population.deaths_today == 2.5
+
+
+def test_world_counters_sections(world_counters):
+    assert world_counters.world_population.current_population == 8000000000
+    assert world_counters.world_population.births_today == 5.5
+    assert world_counters.world_population.deaths_today is None
+    assert world_counters.world_population.to_dict()['current_population'] == 8000000000
+
+
+def test_world_counters_aload(world_counters):
+    wc = asyncio.run(WorldCounters.aload())
+
+    assert wc.world_population.current_population == 8000000000
+    assert wc.world_population.births_today == 5.5
+    assert world_counters.remote_calls == ['/', '/']
+
+
+def test_world_counters_reload_data_locally_updates_the_sections_in_place(world_counters):
+    world_population = world_counters.world_population
+    world_counters._loaded_at -= 10
+
+    world_counters.reload_data(local=True)
+
+    assert world_population.current_population == 8000001000
+    assert world_population.births_today == 5.5
+
+
+def utc_timestamp(*args):
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    now = [utc_timestamp(2023, 12, 31, 23, 59, 50)]
+    monkeypatch.setattr(counters.time, 'time', lambda: now[0])
+    return now
+
+
+def test_reload_data_locally_resets_the_daily_counters(fake_metadata, world_counters, fake_time):
+    fake_metadata['births_today'] = {'last_value': 385000, 'rate': 4.0}
+    fake_metadata['births_this_year'] = {'last_value': 140000000, 'rate': 4.0}
+    world_counters.reload_data()
+
+    # Before midnight, the counters keep growing from the sample.
+    fake_time[0] += 5
+    world_counters.reload_data(local=True)
+    assert world_counters.world_population.births_today == 385020
+    assert world_counters.world_population.births_this_year == 140000020
+
+    # After midnight, they restart from zero, while the population does not.
+    fake_time[0] = utc_timestamp(2024, 1, 1, 0, 0, 10)
+    world_counters.reload_data(local=True)
+    assert world_counters.world_population.births_today == 40
+    assert world_counters.world_population.births_this_year == 40
+    assert world_counters.world_population.current_population == 8000000000 + 100 * 20
+
+
+def test_reload_data_locally_does_not_reset_running_totals(fake_metadata, world_counters, fake_time):
+    fake_metadata['internet_users'] = {'last_value': 5900000000, 'rate': 10.0}
+    world_counters.reload_data()
+
+    fake_time[0] = utc_timestamp(2024, 1, 1, 0, 0, 10)
+    world_counters.reload_data(local=True)
+
+    assert world_counters.society_and_media.internet_users_in_the_world_today == 5900000200
+    assert world_counters.world_population.current_population == 8000002000
+
+
+def test_reload_data_locally_resets_the_yearly_counters_only_once_a_year(
+    fake_metadata,
+    world_counters,
+    fake_time
+):
+    fake_time[0] = utc_timestamp(2024, 3, 1, 23, 59, 50)
+    fake_metadata['births_today'] = {'last_value': 385000, 'rate': 4.0}
+    fake_metadata['births_this_year'] = {'last_value': 25000000, 'rate': 4.0}
+    world_counters.reload_data()
+
+    fake_time[0] = utc_timestamp(2024, 3, 2, 0, 0, 10)
+    world_counters.reload_data(local=True)
+
+    assert world_counters.world_population.births_today == 40
+    assert world_counters.world_population.births_this_year == 25000080
+    # Missing counters are still missing after a reset.
+    assert world_counters.world_population.deaths_today is None
+
+
+def test_stream_of_snapshots(world_counters):
+    snapshots = list(itertools.islice(world_counters.stream(interval=0.01, reload_interval=None), 3))
+
+    assert len(snapshots) == 3
+    assert snapshots[0] is not snapshots[1]
+    assert all(s.value_of('current_population') >= 8000000000 for s in snapshots)
+    assert snapshots[0].timestamp <= snapshots[1].timestamp <= snapshots[2].timestamp
+    assert len(world_counters.remote_calls) == 1
+
+
+def test_stream_of_deltas(world_counters):
+    deltas = next(iter(world_counters.stream(interval=0.05, deltas=True, reload_interval=None)))
+
+    assert set(deltas) <= {'current_population'}
+    assert all(isinstance(value, int) for value in deltas.values())
+
+
+def test_async_streams_share_refreshes(world_counters):
+    async def subscribe():
+        items = []
+        async for snapshot in world_counters.stream(interval=0.05, reload_interval=0.0):
+            items.append(snapshot)
+            if len(items) == 3:
+                return items
+
+    async def main():
+        return await asyncio.gather(subscribe(), subscribe())
+
+    first, second = asyncio.run(main())
+
+    assert len(first) == len(second) == 3
+    # Each tick reloads the counters once for both subscribers.
+    assert len(world_counters.remote_calls) <= 1 + 3
+
+
+def test_stream_with_invalid_interval(world_counters):
+    with pytest.raises(ValueError):
+        world_counters.stream(interval=0)
+
+
+def test_async_stream_does_not_block_the_loop_while_a_sync_refresh_runs(world_counters):
+    ticks = []
+
+    async def tick():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def main():
+        # A sync stream holds the refresh lock, e.g. while reloading.
+        world_counters._refresh_lock.acquire()
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.1, world_counters._refresh_lock.release)
+
+        stream = world_counters.stream(interval=0.01, reload_interval=None).__aiter__()
+        snapshot, _ = await asyncio.gather(stream.__anext__(), tick())
+        await stream.aclose()
+        return snapshot
+
+    snapshot = asyncio.run(main())
+
+    assert snapshot.value_of('current_population') >= 8000000000
+    assert len(ticks) == 5
+    assert not world_counters._refresh_lock.locked()
+
+
+def test_async_refresh_locks_are_not_kept_for_closed_loops(world_counters):
+    async def refresh():
+        await world_counters._arefresh(max_age=0.0, reload_interval=None)
+
+    asyncio.run(refresh())
+    gc.collect()
+
+    assert len(world_counters._async_refresh_locks) == 0
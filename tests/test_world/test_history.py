@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from worldometer.world.counters import COUNTER_INDEX, COUNTER_NAMES, CounterSnapshot
+from worldometer.world.history import CounterHistory
+
+
+def make_snapshot(timestamp, population):
+    snapshot = CounterSnapshot()
+    snapshot.buffer[0] = timestamp
+    snapshot._values[COUNTER_INDEX['current_population']] = population
+    return snapshot
+
+
+@pytest.fixture
+def history():
+    history = CounterHistory(capacity=4)
+    for t in range(6):
+        history.append(make_snapshot(float(t), 1000 + 10 * t))
+    return history
+
+
+def test_history_memory_is_fixed():
+    history = CounterHistory(capacity=10)
+
+    assert history.nbytes == 10 * 8 * (len(COUNTER_INDEX) + 1)
+
+
+def test_history_keeps_the_last_samples(history):
+    times, values = history.window()
+
+    assert len(history) == 4
+    assert times.tolist() == [2.0, 3.0, 4.0, 5.0]
+    assert values.shape == (4, len(COUNTER_INDEX))
+    assert values[:, COUNTER_NAMES['current_population']].tolist() == [1020, 1030, 1040, 1050]
+
+
+def test_history_window(history):
+    times, _ = history.window(start=3.0, end=5.0)
+
+    assert times.tolist() == [3.0, 4.0]
+
+
+def test_history_window_without_samples(history):
+    times, values = history.window(start=10.0)
+
+    assert len(times) == 0
+    assert values.shape == (0, len(COUNTER_INDEX))
+
+
+def test_history_last(history):
+    times, _ = history.last(2)
+
+    assert times.tolist() == [4.0, 5.0]
+
+
+def test_history_series(history):
+    times, values = history.series('current_population', start=4.0)
+
+    assert times.tolist() == [4.0, 5.0]
+    assert values.tolist() == [1040, 1050]
+
+
+def test_history_rates(history):
+    rates = history.rates()
+
+    assert rates['current_population'] == 10.0
+    assert rates['births_today'] is None
+
+
+def test_history_rates_with_a_single_sample():
+    history = CounterHistory(capacity=4)
+    history.append(make_snapshot(1.0, 1000))
+
+    assert history.rates()['current_population'] is None
+
+
+def test_history_window_results_are_copies(history):
+    _, values = history.window()
+    values[:] = np.nan
+
+    assert history.last(1)[1][0, COUNTER_NAMES['current_population']] == 1050
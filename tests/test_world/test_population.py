@@ -0,0 +1,141 @@
+import os
+import threading
+import time
+
+import pytest
+
+from requests_html import HTML
+
+import worldometer.scraper.controller as controller
+
+from worldometer.scraper.cache import HTTPCache
+from worldometer.scraper.transport import RequestsTransport, Response
+
+from worldometer.world.population import AsiaPopulation
+
+
+def make_table(columns):
+    header = ''.join(f'<th>{column}</th>' for column in range(columns))
+    row = ''.join(f'<td>{value}</td>' for value in range(columns))
+    return f'<table class="table"><tr>{header}</tr><tr>{row}</tr></table>'
+
+
+FAKE_PAGE = f"""
+<html>
+<body>
+    {make_table(2)}
+    {make_table(13)}
+    {make_table(13)}
+    <script>
+        rts_counters['asia-population'] = {{"last_value": 4753079727, "rate": 1.1}};
+    </script>
+</body>
+</html>
+"""
+
+
+@pytest.fixture
+def fetched_pages(monkeypatch):
+    pages = {'last_value': 4753079727, 'urls': []}
+
+    def fake_get_page_content(url, timeout=30, max_age=None):
+        pages['urls'].append((url, max_age))
+        html = FAKE_PAGE.replace('4753079727', str(pages['last_value']))
+        return HTML(html=html, url=url)
+
+    monkeypatch.setattr(controller.browser, 'get_page_content', fake_get_page_content)
+    return pages
+
+
+def test_region_population_live_reuses_the_loaded_page(fetched_pages):
+    asia = AsiaPopulation()
+
+    assert asia.live() == 4753079727
+    assert asia.live() == 4753079727
+    assert [url for url, _ in fetched_pages['urls']] == [
+        'https://www.worldometers.info/world-population/asia-population'
+    ]
+
+
+def test_region_population_live_with_refresh(fetched_pages):
+    asia = AsiaPopulation()
+    fetched_pages['last_value'] = 4753080000
+
+    assert asia.live(refresh=True) == 4753080000
+    assert len(fetched_pages['urls']) == 2
+    # The page of the live counter is not read from the HTTP cache.
+    assert fetched_pages['urls'][1][1] is None
+
+
+def test_region_population_live_fetches_the_page_again_when_it_is_stale(fetched_pages):
+    asia = AsiaPopulation()
+    fetched_pages['last_value'] = 4753080000
+
+    asia._live_page.fetched_at -= 5
+    assert asia.live() == 4753079727
+
+    asia._live_page.fetched_at -= 5
+    assert asia.live() == 4753080000
+    assert asia.live() == 4753080000
+    assert len(fetched_pages['urls']) == 2
+
+
+def test_region_population_live_does_not_use_a_stale_cached_page(tmp_path, monkeypatch):
+    url = 'https://www.worldometers.info/world-population/asia-population'
+    cache = HTTPCache(str(tmp_path))
+    cache.set(url, body=FAKE_PAGE.encode(), encoding='utf-8')
+    old = time.time() - 50 * 60
+    os.utime(cache._get_path(url), (old, old))
+
+    class UpstreamTransport(RequestsTransport):
+
+        def __init__(self):
+            self.calls = 0
+
+        def get(self, url, timeout=30, headers=None):
+            self.calls += 1
+            html = FAKE_PAGE.replace('4753079727', '4753080000')
+            return Response(url, 200, html.encode(), 'utf-8', {}, 'HTTP/1.1')
+
+    transport = UpstreamTransport()
+    monkeypatch.setattr(controller.browser, 'cache', cache)
+    monkeypatch.setattr(controller.browser, 'transport', transport)
+
+    asia = AsiaPopulation()
+
+    # The tables are read from the cached page, the live counter is not.
+    assert transport.calls == 0
+    assert asia.live() == 4753080000
+    assert transport.calls == 1
+
+
+def test_region_population_tables_are_released_from_the_page(fetched_pages):
+    asia = AsiaPopulation()
+    asia.subregions(), asia.historical(), asia.forecast()
+
+    assert asia._page is None
+    assert asia.live() == 4753079727
+
+
+def test_region_population_live_does_not_lock_the_tables_while_fetching(fetched_pages, monkeypatch):
+    asia = AsiaPopulation()
+    get_page_content = controller.browser.get_page_content
+    locked = []
+
+    def checking_get_page_content(url, timeout=30, max_age=None):
+        # The tables can be read from another thread during the fetch.
+        def try_lock():
+            acquired = asia._lock.acquire(blocking=False)
+            if acquired:
+                asia._lock.release()
+            locked.append(not acquired)
+
+        thread = threading.Thread(target=try_lock)
+        thread.start()
+        thread.join()
+        return get_page_content(url, timeout=timeout, max_age=max_age)
+
+    monkeypatch.setattr(controller.browser, 'get_page_content', checking_get_page_content)
+
+    assert asia.live(refresh=True) == 4753079727
+    assert locked == [False]
@@ -0,0 +1,134 @@
+import threading
+import time
+
+import pytest
+
+import worldometer.world.shared as shared
+
+from worldometer.world.counters import COUNTER_INDEX, CounterSnapshot, WorldPopulation
+from worldometer.world.shared import SharedCountersPublisher, SharedWorldCounters
+
+
+@pytest.fixture
+def publisher():
+    publisher = SharedCountersPublisher()
+    yield publisher
+    publisher.close()
+
+
+@pytest.fixture
+def snapshot():
+    snapshot = CounterSnapshot()
+    snapshot.buffer[0] = 1700000000.0
+    snapshot._values[COUNTER_INDEX['current_population']] = 8065299074
+    snapshot._is_int[COUNTER_INDEX['current_population']] = 1
+    snapshot._values[COUNTER_INDEX['births_today']] = 1.5
+    return snapshot
+
+
+def test_reader_before_first_publish(publisher):
+    with SharedWorldCounters(publisher.name) as wc:
+        assert wc.world_population.current_population is None
+
+
+def test_reader_gets_published_snapshot(publisher, snapshot):
+    publisher.publish(snapshot)
+
+    with SharedWorldCounters(publisher.name) as wc:
+        assert wc.world_population == WorldPopulation(snapshot)
+        assert wc.world_population.current_population == 8065299074
+        assert wc.world_population.births_today == 1.5
+        assert wc.snapshot.timestamp == 1700000000.0
+
+
+def test_reader_reload_data(publisher, snapshot):
+    with SharedWorldCounters(publisher.name) as wc:
+        publisher.publish(snapshot)
+        assert wc.world_population.current_population is None
+
+        wc.reload_data()
+        assert wc.world_population.current_population == 8065299074
+
+
+def test_publish_leaves_an_even_sequence_number(publisher, snapshot):
+    publisher.publish(snapshot)
+    publisher.publish(snapshot)
+
+    assert publisher._header[0] == 4
+
+
+def test_reader_reload_data_with_a_write_that_never_finishes(publisher, snapshot):
+    with SharedWorldCounters(publisher.name, read_timeout=0.05) as wc:
+        publisher._header[0] += 1
+        publisher._buffer[:] = snapshot.buffer
+
+        with pytest.raises(TimeoutError):
+            wc.reload_data()
+
+        # The values of the last complete snapshot are kept.
+        assert wc.world_population.current_population is None
+
+
+class FakeWorldCounters:
+    # Fails to load the first time, as if the website were unavailable.
+    attempts = 0
+
+    def __init__(self):
+        FakeWorldCounters.attempts += 1
+        if FakeWorldCounters.attempts == 1:
+            raise ConnectionError('Website unavailable')
+
+        self.snapshot = CounterSnapshot()
+        self.snapshot._values[COUNTER_INDEX['current_population']] = 8065299074
+        self.snapshot._is_int[COUNTER_INDEX['current_population']] = 1
+
+    def reload_data(self, local=False):
+        self.snapshot._values[COUNTER_INDEX['current_population']] += 1
+
+
+@pytest.fixture
+def fake_world_counters(monkeypatch):
+    FakeWorldCounters.attempts = 0
+    monkeypatch.setattr(shared, 'WorldCounters', FakeWorldCounters)
+
+
+def wait_for_population(wc, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        wc.reload_data()
+        if wc.world_population.current_population is not None:
+            return wc.world_population.current_population
+        time.sleep(0.01)
+    raise AssertionError('The publisher did not publish a snapshot')
+
+
+def test_publisher_run_retries_the_first_load(fake_world_counters):
+    publisher = SharedCountersPublisher(interval=0.01)
+    thread = threading.Thread(target=publisher.run)
+    thread.start()
+
+    try:
+        with SharedWorldCounters(publisher.name) as wc:
+            assert wait_for_population(wc) >= 8065299074
+    finally:
+        publisher._stop_event.set()
+        thread.join()
+        publisher.close()
+
+    assert FakeWorldCounters.attempts == 2
+
+
+def test_publisher_start_and_stop(fake_world_counters):
+    publisher = SharedCountersPublisher(interval=0.01)
+    publisher.start()
+
+    try:
+        with SharedWorldCounters(publisher.name) as wc:
+            first = wait_for_population(wc)
+            time.sleep(0.1)
+            wc.reload_data()
+            assert wc.world_population.current_population > first
+    finally:
+        publisher.close()
+
+    assert publisher._process is None
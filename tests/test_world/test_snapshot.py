@@ -0,0 +1,79 @@
+import threading
+import time
+
+from dataclasses import fields
+
+import pytest
+
+from requests_html import HTML
+
+import worldometer.world.base as base
+
+from worldometer.scraper import Page
+from worldometer.world.snapshot import WorldDataSnapshot, load_all
+
+
+DATASET_CLASSES = {
+    f.type.source_path: f.type
+    for f in fields(WorldDataSnapshot)
+    if f.name != 'fetched_at'
+}
+
+
+def make_fake_page(source_path):
+    dataset_class = DATASET_CLASSES[source_path]
+    tables = []
+
+    for column_names in dataset_class._get_new_column_names(dataset_class):
+        header = ''.join(f'<th>{name}</th>' for name in column_names)
+        row = ''.join('<td>1</td>' for _ in column_names)
+        tables.append(f'<table class="table"><tr>{header}</tr><tr>{row}</tr></table>')
+
+    return Page(HTML(html=f'<html><body>{"".join(tables)}</body></html>', url=source_path))
+
+
+@pytest.fixture
+def fake_get_page(monkeypatch):
+    state = {'running': 0, 'max_running': 0, 'fail': None}
+    lock = threading.Lock()
+
+    def fake_get_page(path_url, max_age=None):
+        with lock:
+            state['running'] += 1
+            state['max_running'] = max(state['max_running'], state['running'])
+        try:
+            time.sleep(0.01)
+            if path_url == state['fail']:
+                raise RuntimeError('Page unavailable')
+            return make_fake_page(path_url)
+        finally:
+            with lock:
+                state['running'] -= 1
+
+    monkeypatch.setattr(base, 'get_page', fake_get_page)
+    return state
+
+
+def test_load_all_populates_every_dataset(fake_get_page):
+    snapshot = load_all(max_workers=4)
+
+    for f in fields(WorldDataSnapshot):
+        if f.name == 'fetched_at':
+            continue
+        dataset = getattr(snapshot, f.name)
+        assert isinstance(dataset, f.type)
+        # The tables were parsed by the workers.
+        assert len(dataset._frames) == len(dataset._row_types)
+
+
+def test_load_all_bounds_the_concurrency(fake_get_page):
+    load_all(max_workers=2)
+
+    assert 1 <= fake_get_page['max_running'] <= 2
+
+
+def test_load_all_propagates_errors(fake_get_page):
+    fake_get_page['fail'] = '/world-population/asia-population'
+
+    with pytest.raises(RuntimeError, match='Page unavailable'):
+        load_all()
@@ -0,0 +1,35 @@
+import importlib
+
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+def attach(
+    package_name: str,
+    lazy_imports: Dict[str, str],
+    public_names: Sequence[str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Create the module `__getattr__` and `__dir__` functions (PEP 562) of a
+    package whose public names are only imported when first accessed.
+
+    `lazy_imports` maps each name to the module where it is defined. When
+    the module is the subpackage (or submodule) with that name, the module
+    itself is returned.
+    """
+    package = importlib.import_module(package_name)
+
+    def __getattr__(name: str) -> Any:
+        module_name = lazy_imports.get(name)
+        if module_name is None:
+            raise AttributeError(f'module {package_name!r} has no attribute {name!r}')
+
+        module = importlib.import_module(module_name)
+        value = module if module_name == f'{package_name}.{name}' else getattr(module, name)
+
+        # Later accesses no longer go through this function.
+        setattr(package, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(package)) | set(public_names))
+
+    return __getattr__, __dir__
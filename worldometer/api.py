@@ -28,11 +28,21 @@ functions without having to decorate all labels:
 
 >>> api.tweets_sent_today()
 {'tweets_sent_today': 4539558}
+
+Several metrics can be obtained at once with ``get_metrics_of``:
+
+>>> api.get_metrics_of(['births_today', 'deaths_today'])
+{'births_today': 5676, 'deaths_today': 2383}
+
+The metrics are cached for ``CACHE_TTL`` seconds. After that, the cached
+metrics are still returned while they are refreshed in a background
+thread, so only the first call waits for the metrics to be collected.
 """
 
 
 __all__ = [
     'get_metric_of',
+    'get_metrics_of',
     'update_metrics',
     'current_world_population',
     'births_this_year',
@@ -99,11 +109,71 @@ __all__ = [
     'road_traffic_accident_fatalities_this_year'
 ]
 
+import logging
+import threading
+import time
+
+from typing import Dict, Iterable, Optional
+
 from worldometer import Worldometer
 from worldometer.core import _deprecated_api
 
 
-_cached_metrics = {}
+logger = logging.getLogger(__name__)
+
+# Seconds the cached metrics are considered fresh.
+CACHE_TTL = 60.0
+
+# The cached metrics are replaced as a whole and never mutated,
+# so they can be read without locks or copies.
+_cached_metrics: Dict[str, int] = {}
+_cached_at = 0.0
+
+_refresh_lock = threading.Lock()
+_refresh_thread: Optional[threading.Thread] = None
+
+
+def _load_metrics() -> Dict[str, int]:
+    return Worldometer().metrics_with_labels()
+
+
+def _store_metrics(metrics: Dict[str, int]) -> None:
+    global _cached_metrics, _cached_at
+    _cached_metrics = metrics
+    _cached_at = time.monotonic()
+
+
+def _refresh_metrics() -> None:
+    global _cached_at
+
+    try:
+        _store_metrics(_load_metrics())
+    except Exception:
+        # The stale metrics keep being served, and the refresh is retried
+        # after another `CACHE_TTL` seconds instead of on every call.
+        logger.warning('Could not refresh the metrics, serving the cached ones', exc_info=True)
+        _cached_at = time.monotonic()
+
+
+def _get_metrics() -> Dict[str, int]:
+    global _refresh_thread
+
+    metrics = _cached_metrics
+
+    if not metrics:
+        # Nothing to serve yet, the first call waits for the metrics.
+        with _refresh_lock:
+            if not _cached_metrics:
+                _store_metrics(_load_metrics())
+            return _cached_metrics
+
+    if time.monotonic() - _cached_at >= CACHE_TTL:
+        with _refresh_lock:
+            if _refresh_thread is None or not _refresh_thread.is_alive():
+                _refresh_thread = threading.Thread(target=_refresh_metrics, daemon=True)
+                _refresh_thread.start()
+
+    return metrics
 
 
 @_deprecated_api
@@ -126,11 +196,7 @@ def get_metric_of(label: str) -> dict:
     {'current_world_population': 7845085923}
     """
 
-    if not _cached_metrics:
-        w = Worldometer()
-        _cached_metrics.update(w.metrics_with_labels())
-
-    metrics = _cached_metrics.copy()
+    metrics = _get_metrics()
 
     if label not in metrics:
         raise Exception(f'This label "{label}" is invalid, please use a valid label.')
@@ -138,10 +204,43 @@ def get_metric_of(label: str) -> dict:
     return {label: metrics[label]}
 
 
+@_deprecated_api
+def get_metrics_of(labels: Iterable[str]) -> dict:
+    """Get metrics of labels specified.
+
+    Parameters
+    ----------
+    labels
+        Labels of metrics.
+
+    Returns
+    -------
+    dict
+        Labels with metrics in dict format.
+
+    Example
+    -------
+    >>> get_metrics_of(['births_today', 'deaths_today'])
+    {'births_today': 5676, 'deaths_today': 2383}
+    """
+
+    metrics = _get_metrics()
+    labels = list(labels)
+
+    for label in labels:
+        if label not in metrics:
+            raise Exception(f'This label "{label}" is invalid, please use a valid label.')
+
+    return {label: metrics[label] for label in labels}
+
+
 @_deprecated_api
 def update_metrics() -> None:
-    """Update metrics of worldometer."""
-    _cached_metrics.clear()
+    """Update metrics of worldometer.
+
+    The metrics are collected again on the next call.
+    """
+    _store_metrics({})
 
 
 @_deprecated_api
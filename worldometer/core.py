@@ -38,11 +38,13 @@ Get all metrics with labels in dict format:
 
 __all__ = ['Worldometer']
 
+import threading
 import warnings
 from functools import wraps
-from dataclasses import asdict
+from typing import Optional
 
 from worldometer.world import WorldCounters
+from worldometer.world.counters import COUNTER_NAMES, CounterSnapshot
 
 # Constant variables, used in the Worldometer module.
 
@@ -130,6 +132,41 @@ _METRICS_LABELS = {
     ]
 }
 
+_LABELS = tuple(label for labels in _METRICS_LABELS.values() for label in labels)
+
+# Position of the counter of each label in the snapshots of WorldCounters.
+_LABELS_COUNTER_INDEX = tuple(COUNTER_NAMES[label] for label in _LABELS)
+
+
+def _get_categories_range() -> dict:
+    # Range of the metrics of each category in the list of metrics.
+    categories_range = {}
+    start = 0
+    for category, labels in _METRICS_LABELS.items():
+        categories_range[category] = (start, start + len(labels))
+        start += len(labels)
+    return categories_range
+
+
+_CATEGORIES_RANGE = _get_categories_range()
+
+# WorldCounters instance shared by the Worldometer objects created with shared=True.
+_shared_counters: Optional[WorldCounters] = None
+_shared_counters_lock = threading.Lock()
+
+
+def _get_shared_snapshot(reload: bool = False) -> CounterSnapshot:
+    # The shared counters are reloaded in place, so their snapshot is
+    # copied under the lock to not read it while another thread reloads.
+    global _shared_counters
+
+    with _shared_counters_lock:
+        if _shared_counters is None:
+            _shared_counters = WorldCounters()
+        elif reload:
+            _shared_counters.reload_data()
+        return _shared_counters.snapshot.copy()
+
 
 def _deprecated_api(func_or_class):
     @wraps(func_or_class)
@@ -158,36 +195,47 @@ class Worldometer(object):
     >>> from worldometer import Worldometer
     >>> help(Worldometer)
     class Worldometer(builtins.object)
-    |  Worldometer(timeout: int = 30)
+    |  Worldometer(timeout: int = 30, shared: bool = False)
     |
     |  (...)
     |
     |  Methods defined here:
     |
-    |  __init__(self, timeout: int = 30)
+    |  __init__(self, timeout: int = 30, shared: bool = False)
     |      Initializer of Worldometer class.
     |
     |      Parameters
     |      ----------
     |      timeout
     |         Seconds of wait for processing.
+    |      shared
+    |         If True, use the counters shared by all objects created with it.
     |
     |   (...)
     """
 
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, shared: bool = False):
         """Initializer of Worldometer class.
 
+        The metrics are collected on the first access,
+        so creating the object does not access the website.
+
         Parameters
         ----------
         timeout
            Seconds of wait for processing.
+        shared
+           If True, the metrics are collected from a single set of counters
+           shared by all Worldometer objects created with ``shared=True``,
+           so only the first of them accesses the website. Calling
+           ``update_metrics`` reloads the shared counters.
         """
         self.__r = None  # Stores the response with html code for later rendering
 
         self.__timeout = timeout
 
-        self._metrics = self.collect_metrics()
+        self._shared = shared
+        self._metrics: Optional[list] = None
 
     def __str__(self):
         c, l, m = self.what_is_here().values()
@@ -225,7 +273,12 @@ class Worldometer(object):
             ...
         ]
         """
-        return self._metrics.copy()
+        return self._get_metrics().copy()
+
+    def _get_metrics(self) -> list:
+        if self._metrics is None:
+            self._metrics = self.collect_metrics()
+        return self._metrics
 
     def _get_html(self, url: str) -> None:
         """Get the html code from the specified url and
@@ -270,26 +323,16 @@ class Worldometer(object):
         list
             A list of metrics of int type.
         """
-        wc = WorldCounters()
-
-        metrics = {
-            **asdict(wc.world_population),
-            **asdict(wc.government_and_economics),
-            **asdict(wc.society_and_media),
-            **asdict(wc.environment),
-            **asdict(wc.food),
-            **asdict(wc.water),
-            **asdict(wc.energy),
-            **asdict(wc.health)
-        }
+        return self._collect_metrics()
 
-        metrics_values = list(metrics.values())
+    def _collect_metrics(self, reload: bool = False) -> list:
+        snapshot = _get_shared_snapshot(reload) if self._shared else WorldCounters().snapshot
 
-        return metrics_values
+        return [snapshot._get_value(index) for index in _LABELS_COUNTER_INDEX]
 
     def update_metrics(self) -> None:
         """Update metrics of worldometer."""
-        self._metrics = self.collect_metrics()
+        self._metrics = self._collect_metrics(reload=True)
 
     @staticmethod
     def metrics_labels(with_categories=False) -> list:
@@ -325,11 +368,7 @@ class Worldometer(object):
         if with_categories:
             return _METRICS_LABELS  # type: ignore
 
-        only_metrics = []
-        for metrics in _METRICS_LABELS.values():
-            only_metrics.extend(metrics)
-
-        return only_metrics
+        return list(_LABELS)
 
     @staticmethod
     def categories() -> list:
@@ -383,34 +422,15 @@ class Worldometer(object):
             ...: ...
         }
         """
-        metrics = self.metrics()
+        metrics = self._get_metrics()
 
         if with_categories:
+            return {
+                category: dict(zip(_METRICS_LABELS[category], metrics[start:end]))
+                for category, (start, end) in _CATEGORIES_RANGE.items()
+            }
 
-            m_with_l = {}  # Storage all structure of metrics with labels
-            metrics_labels = self.metrics_labels(with_categories=True).copy()
-
-            idx = 0  # Index for get metrics in idx position
-            for category in metrics_labels:
-
-                m_with_l[category] = {}  # Each category has a dict structure
-
-                for label in metrics_labels[category]:
-
-                    # Storage of a metric on the key label as the index
-                    # increases +1 to iterate through the entire list of metrics
-                    m_with_l[category][label] = metrics[idx]
-                    idx += 1
-
-            return m_with_l
-
-        else:
-
-            labels = self.metrics_labels().copy()
-
-            return dict(
-                zip(labels, metrics)
-            )
+        return dict(zip(_LABELS, metrics))
 
     def what_is_here(self) -> dict:
         """Return what is here in object.
@@ -429,6 +449,6 @@ class Worldometer(object):
         """
         return {
             'categories': len(self.categories()),
-            'labels': len(self.metrics_labels()),
-            'metrics': len(self.metrics())
+            'labels': len(_LABELS),
+            'metrics': len(_LABELS)
         }
@@ -1,9 +1,52 @@
 __all__ = [
     'get_data_tables',
-    'get_rts_counters_object'
+    'get_rts_counters_object',
+    'get_rts_counters_metadata',
+    'aget_data_tables',
+    'aget_rts_counters_object',
+    'aget_rts_counters_metadata',
+    'get_page_html',
+    'aget_page_html',
+    'get_data_tables_from_html',
+    'get_data_frames_from_html',
+    'get_page',
+    'aget_page',
+    'Page',
+    'set_http_cache',
+    'set_http_pool',
+    'set_http_transport',
+    'set_browser_pool',
+    'get_http_stats',
+    'set_retry_policy',
+    'set_circuit_breakers',
+    'HTTPCache',
+    'RetryPolicy',
+    'RequestsTransport',
+    'HTTPXTransport'
 ]
 
 from worldometer.scraper.controller import (
     get_data_tables,
-    get_rts_counters_object
+    get_rts_counters_object,
+    get_rts_counters_metadata,
+    aget_data_tables,
+    aget_rts_counters_object,
+    aget_rts_counters_metadata,
+    get_page_html,
+    aget_page_html,
+    get_data_tables_from_html,
+    get_data_frames_from_html,
+    get_page,
+    aget_page,
+    Page,
+    set_http_cache,
+    set_http_pool,
+    set_http_transport,
+    set_browser_pool,
+    get_http_stats,
+    set_retry_policy,
+    set_circuit_breakers
 )
+from worldometer.scraper.cache import HTTPCache
+from worldometer.scraper.resilience import RetryPolicy
+from worldometer.scraper.transport import HTTPXTransport, RequestsTransport
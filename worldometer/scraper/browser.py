@@ -1,35 +1,351 @@
-from typing import Any
+import asyncio
+import threading
 
-from requests_html import HTML, HTMLSession
+from typing import Any, Dict, Optional, Tuple
+
+from requests_html import DEFAULT_ENCODING, HTML, AsyncHTMLSession, HTMLSession
 
 # pyppeteer is used by requests_html internally
 from pyppeteer.errors import ElementHandleError, TimeoutError
 
-from worldometer.scraper.exceptions import ScriptRunnerError
+from worldometer.scraper.cache import CachedResponse, HTTPCache
+from worldometer.scraper.exceptions import CircuitOpenError, ScriptRunnerError
+from worldometer.scraper.pool import BrowserPool
+from worldometer.scraper.resilience import CircuitBreakers, RetryPolicy, acall_with_retries, call_with_retries
+from worldometer.scraper.transport import RequestsTransport, Response, Transport
+
+
+def _make_html_from_cache(session: Any, cached: CachedResponse) -> HTML:
+    return HTML(
+        session=session,
+        url=cached.url,
+        html=cached.body,
+        default_encoding=cached.encoding or DEFAULT_ENCODING
+    )
+
+
+def _make_html_from_response(session: Any, res: Response) -> HTML:
+    return HTML(
+        session=session,
+        url=res.url,
+        html=res.content,
+        default_encoding=res.encoding or DEFAULT_ENCODING
+    )
+
+
+def _is_server_error(res: Response) -> bool:
+    # Responses worth retrying, the server may be overloaded or restarting.
+    return res.status_code >= 500 or res.status_code == 429
+
+
+def _get_last_good_page(
+    session: Any,
+    last_good_responses: Dict[str, Any],
+    cache: Optional[HTTPCache],
+    url: str
+) -> Optional[HTML]:
+    res = last_good_responses.get(url)
+    if res is not None:
+        return _make_html_from_response(session, res)
+
+    cached = cache.get(url) if cache is not None else None
+    if cached is not None:
+        return _make_html_from_cache(session, cached)
+
+    return None
+
+
+def _replace_html_content(html_obj: HTML, content: str) -> None:
+    # Replaces the HTML content with the rendered version, as
+    # requests_html does in `HTML.render`.
+    rendered_html_obj = HTML(
+        session=html_obj.session,
+        url=html_obj.url,
+        html=content.encode(DEFAULT_ENCODING),
+        default_encoding=DEFAULT_ENCODING
+    )
+    html_obj.__dict__.update(rendered_html_obj.__dict__)
+
+
+def _store_response_in_cache(cache: HTTPCache, url: str, res: Any) -> None:
+    if res.status_code != 200:
+        return
+
+    cache.set(
+        url,
+        body=res.content,
+        encoding=res.encoding,
+        etag=res.headers.get('ETag'),
+        last_modified=res.headers.get('Last-Modified')
+    )
 
 
 class Browser:
+    # Can be used from several threads at the same time: pages are fetched
+    # by a thread-safe transport and renders check out a headless browser
+    # from the pool.
+    #
+    # Failed fetches and renders are retried following `retry`, and the
+    # circuit breaker of the host fails fast after repeated failures. While
+    # the host is unavailable, the last good version of the page is used.
+
+    def __init__(
+        self,
+        pool: Optional[BrowserPool] = None,
+        cache: Optional[HTTPCache] = None,
+        transport: Optional[Transport] = None,
+        retry: Optional[RetryPolicy] = None,
+        breakers: Optional[CircuitBreakers] = None
+    ) -> None:
+        self.transport = transport or RequestsTransport()
 
-    def __init__(self) -> None:
+        # Session of the HTML objects, only used to create their rendered version.
         self.session = HTMLSession()
 
-    def get_page_content(self, url: str, timeout: int = 30) -> HTML:
-        res = self.session.get(url, timeout=timeout)
+        # Rendering is done by a pool of warm headless browsers instead of
+        # requests_html, which renders each page in a new browser page.
+        self.pool = pool or BrowserPool()
 
-        # requests-html does not have the type hint set correctly in
-        # some modules (session.get is one of them), so type checkers
-        # report a problem. I will probably trade this package in the future.
-        html_obj = res.html  # type: ignore
-        return html_obj
+        self.cache = cache
+
+        self.retry = retry or RetryPolicy()
+        self.breakers = breakers or CircuitBreakers()
+
+        # Last good responses and renders, served while the host is unavailable.
+        self._last_good_responses: Dict[str, Response] = {}
+        self._last_good_renders: Dict[Tuple[str, Optional[str]], Tuple[str, Any]] = {}
+
+    def _fetch(self, url: str, timeout: int, headers: Optional[Dict[str, str]]) -> Response:
+        return call_with_retries(
+            lambda: self.transport.get(url, timeout=timeout, headers=headers),
+            url,
+            retry=self.retry,
+            breakers=self.breakers,
+            errors=self.transport.transient_errors,
+            is_failure=_is_server_error
+        )
+
+    def _get_last_good_page(self, url: str) -> Optional[HTML]:
+        return _get_last_good_page(self.session, self._last_good_responses, self.cache, url)
+
+    def get_page_content(
+        self,
+        url: str,
+        timeout: int = 30,
+        max_age: Optional[float] = None
+    ) -> HTML:
+        # Without a `max_age` the cache is bypassed. Otherwise a cached page
+        # is used as is while it is fresh, and then revalidated with a
+        # conditional request before being used again.
+        use_cache = self.cache is not None and max_age is not None
+
+        cached = self.cache.get(url) if use_cache else None  # type: ignore
+        if cached is not None and cached.is_fresh(max_age):  # type: ignore
+            return _make_html_from_cache(self.session, cached)
+
+        headers = cached.revalidation_headers if cached is not None else None
+
+        try:
+            res = self._fetch(url, timeout, headers)
+        except (CircuitOpenError, *self.transport.transient_errors):
+            last_good_page = self._get_last_good_page(url)
+            if last_good_page is None:
+                raise
+            return last_good_page
+
+        if _is_server_error(res):
+            last_good_page = self._get_last_good_page(url)
+            if last_good_page is not None:
+                return last_good_page
+
+        if res.status_code == 304 and cached is not None:
+            self.cache.touch(url)  # type: ignore
+            return _make_html_from_cache(self.session, cached)
+
+        if res.status_code == 200:
+            self._last_good_responses[url] = res
+
+        if use_cache:
+            _store_response_in_cache(self.cache, url, res)  # type: ignore
+
+        return _make_html_from_response(self.session, res)
+
+    def _render(self, html_obj: HTML, script: Optional[str] = None, timeout: int = 30) -> Any:
+        key = (html_obj.url, script)
+
+        try:
+            content, script_return = call_with_retries(
+                lambda: self.pool.render(html_obj.url, script=script, timeout=timeout),
+                html_obj.url,
+                retry=self.retry,
+                breakers=self.breakers,
+                # A script error is not retried, it would fail again.
+                errors=(TimeoutError,)
+            )
+        except (CircuitOpenError, TimeoutError):
+            if key not in self._last_good_renders:
+                raise
+            content, script_return = self._last_good_renders[key]
+        else:
+            self._last_good_renders[key] = (content, script_return)
+
+        _replace_html_content(html_obj, content)
+
+        return script_return
 
     def render_page(self, html_obj: HTML) -> None:
-        html_obj.render()
+        self._render(html_obj)
 
     def run_js_script(self, html_obj: HTML, script: str) -> Any:
         try:
-            script_return = html_obj.render(script=script)
+            script_return = self._render(html_obj, script=script)
 
         except (ElementHandleError, TimeoutError) as err:
             raise ScriptRunnerError('Could not evaluate provided js script in HTML.') from err
 
         return script_return  # type: ignore
+
+    def close(self) -> None:
+        self.pool.close()
+        self.transport.close()
+        self.session.close()
+
+
+class AsyncBrowser:
+    # Fetches and renders are retried and go through the circuit
+    # breakers of the hosts, and the last good version of the pages is
+    # used while a host is unavailable, as in `Browser`.
+    #
+    # AsyncHTMLSession is not a native async client: it sends each request
+    # with requests in the default ThreadPoolExecutor of the loop, so the
+    # concurrent fetches are bounded by the workers of that executor.
+
+    # AsyncHTMLSession sends the requests with requests.
+    transient_errors = RequestsTransport.transient_errors
+
+    def __init__(
+        self,
+        cache: Optional[HTTPCache] = None,
+        retry: Optional[RetryPolicy] = None,
+        breakers: Optional[CircuitBreakers] = None
+    ) -> None:
+        # The session (and the browser it launches) is bound to an event loop,
+        # so each loop (e.g. one in each thread) gets its own session.
+        self._sessions: Dict[asyncio.AbstractEventLoop, AsyncHTMLSession] = {}
+        self._sessions_lock = threading.Lock()
+
+        self.cache = cache
+
+        self.retry = retry or RetryPolicy()
+        self.breakers = breakers or CircuitBreakers()
+
+        # Last good responses and renders, served while the host is unavailable.
+        self._last_good_responses: Dict[str, Any] = {}
+        self._last_good_renders: Dict[Tuple[str, Optional[str]], Tuple[str, Any]] = {}
+
+    @property
+    def session(self) -> AsyncHTMLSession:
+        loop = asyncio.get_running_loop()
+        with self._sessions_lock:
+            session = self._sessions.get(loop)
+            if session is None:
+                # Sessions of closed loops can no longer be used.
+                for closed_loop in [other for other in self._sessions if other.is_closed()]:
+                    del self._sessions[closed_loop]
+                session = self._sessions[loop] = AsyncHTMLSession(loop=loop)
+            return session
+
+    async def _fetch(self, url: str, timeout: int, headers: Optional[Dict[str, str]] = None) -> Any:
+        session = self.session
+        return await acall_with_retries(
+            lambda: session.get(url, timeout=timeout, headers=headers),
+            url,
+            retry=self.retry,
+            breakers=self.breakers,
+            errors=self.transient_errors,
+            is_failure=_is_server_error
+        )
+
+    def _get_last_good_page(self, url: str) -> Optional[HTML]:
+        return _get_last_good_page(self.session, self._last_good_responses, self.cache, url)
+
+    async def _render(self, html_obj: HTML, script: Optional[str] = None) -> Any:
+        key = (html_obj.url, script)
+
+        try:
+            script_return = await acall_with_retries(
+                lambda: html_obj.arender(script=script),
+                html_obj.url,
+                retry=self.retry,
+                breakers=self.breakers,
+                errors=(TimeoutError,)
+            )
+        except (CircuitOpenError, TimeoutError):
+            if key not in self._last_good_renders:
+                raise
+            content, script_return = self._last_good_renders[key]
+            _replace_html_content(html_obj, content)
+        else:
+            self._last_good_renders[key] = (html_obj.html, script_return)
+
+        return script_return
+
+    async def get_page_content(
+        self,
+        url: str,
+        timeout: int = 30,
+        max_age: Optional[float] = None
+    ) -> HTML:
+        # Same as `Browser.get_page_content`.
+        use_cache = self.cache is not None and max_age is not None
+
+        cached = self.cache.get(url) if use_cache else None  # type: ignore
+        if cached is not None and cached.is_fresh(max_age):  # type: ignore
+            return _make_html_from_cache(self.session, cached)
+
+        headers = cached.revalidation_headers if cached is not None else None
+
+        try:
+            res = await self._fetch(url, timeout, headers)
+        except (CircuitOpenError, *self.transient_errors):
+            last_good_page = self._get_last_good_page(url)
+            if last_good_page is None:
+                raise
+            return last_good_page
+
+        if _is_server_error(res):
+            last_good_page = self._get_last_good_page(url)
+            if last_good_page is not None:
+                return last_good_page
+
+        if res.status_code == 304 and cached is not None:
+            self.cache.touch(url)  # type: ignore
+            return _make_html_from_cache(self.session, cached)
+
+        if res.status_code == 200:
+            self._last_good_responses[url] = res
+
+        if use_cache:
+            _store_response_in_cache(self.cache, url, res)  # type: ignore
+
+        html_obj = res.html  # type: ignore
+        return html_obj
+
+    async def render_page(self, html_obj: HTML) -> None:
+        await self._render(html_obj)
+
+    async def run_js_script(self, html_obj: HTML, script: str) -> Any:
+        try:
+            script_return = await self._render(html_obj, script=script)
+
+        except (ElementHandleError, TimeoutError) as err:
+            raise ScriptRunnerError('Could not evaluate provided js script in HTML.') from err
+
+        return script_return  # type: ignore
+
+    async def close(self) -> None:
+        # Only the session of the running loop can be closed from it.
+        with self._sessions_lock:
+            session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
@@ -0,0 +1,125 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    url: str
+    body: bytes
+    encoding: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+    def is_fresh(self, max_age: float) -> bool:
+        return self.age <= max_age
+
+    @property
+    def revalidation_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+
+    # Each entry is a single file with a JSON header line followed by the
+    # response body. Files are written to a temporary file and atomically
+    # renamed, so several processes can share the same directory safely.
+    # The file modification time is the moment the entry was last validated.
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _get_path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f'{key}.cache')
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        path = self._get_path(url)
+
+        try:
+            with open(path, 'rb') as f:
+                stored_at = os.fstat(f.fileno()).st_mtime
+                header = json.loads(f.readline())
+                body = f.read()
+
+        except (OSError, ValueError):
+            # Missing or corrupted entries are treated as cache misses.
+            return None
+
+        if header.get('url') != url:
+            return None
+
+        return CachedResponse(
+            url=url,
+            body=body,
+            encoding=header.get('encoding'),
+            etag=header.get('etag'),
+            last_modified=header.get('last_modified'),
+            stored_at=stored_at
+        )
+
+    def set(
+        self,
+        url: str,
+        body: bytes,
+        encoding: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        header = {
+            'url': url,
+            'encoding': encoding,
+            'etag': etag,
+            'last_modified': last_modified
+        }
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(json.dumps(header).encode('utf-8'))
+                f.write(b'\n')
+                f.write(body)
+            os.replace(tmp_path, self._get_path(url))
+
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def get_stored_at(self, url: str) -> Optional[float]:
+        # When the entry was last validated, without reading it.
+        try:
+            return os.stat(self._get_path(url)).st_mtime
+        except OSError:
+            return None
+
+    def touch(self, url: str) -> None:
+        # Marks the entry as revalidated (e.g. after a 304 Not Modified).
+        try:
+            os.utime(self._get_path(url))
+        except OSError:
+            pass
+
+    def delete(self, url: str) -> None:
+        try:
+            os.remove(self._get_path(url))
+        except OSError:
+            pass
@@ -1,45 +1,411 @@
-from typing import Dict, List, Optional, Tuple, Union
+import threading
+import time
 
-from worldometer.scraper.browser import Browser
+from typing import TYPE_CHECKING, Collection, Dict, List, Optional, Sequence, Tuple, Union
+
+from requests_html import HTML
+
+from worldometer.scraper.browser import AsyncBrowser, Browser
+
+from worldometer.scraper.cache import HTTPCache
+
+from worldometer.scraper.exceptions import ParserError
+
+from worldometer.scraper.pool import BrowserPool
+
+from worldometer.scraper.resilience import CircuitBreakers, RetryPolicy
+
+from worldometer.scraper.transport import RequestsTransport, Transport, TransportStats
 
 from worldometer.scraper.parser import (
+    get_rts_counters_from_html,
     get_rts_counters_only_with_last_value_key,
-    get_html_tables_data
+    get_rts_counters_with_metadata
 )
 
+from worldometer.scraper.singleflight import AsyncSingleFlight, SingleFlight, make_key
+
 from worldometer.scraper.utils import make_url
 
 from worldometer.scraper.consts import BASE_URL
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 browser = Browser()
+async_browser = AsyncBrowser(retry=browser.retry, breakers=browser.breakers)
+
+# Concurrent loads of the same page share a single fetch.
+_page_flights = SingleFlight()
+_async_page_flights = AsyncSingleFlight()
+
+
+def set_http_cache(cache: Optional[HTTPCache]) -> None:
+    # Pass None to disable the cache.
+    browser.cache = cache
+    async_browser.cache = cache
+
+
+def set_http_transport(transport: Transport) -> None:
+    # Replaces the HTTP client used to fetch the pages (e.g. with an
+    # `HTTPXTransport` for HTTP/2). Set it before loading data,
+    # the old transport is closed.
+    old_transport = browser.transport
+    browser.transport = transport
+    old_transport.close()
+
+
+def set_http_pool(size: int = 4, keep_alive: bool = True, timeout: Optional[float] = None) -> None:
+    # Uses a pool of requests sessions to fetch the pages. `size` is
+    # the maximum number of concurrent requests, the other threads
+    # wait up to `timeout` seconds for an idle session.
+    set_http_transport(RequestsTransport(size=size, keep_alive=keep_alive, timeout=timeout))
+
+
+def set_browser_pool(size: int = 1, max_renders: Optional[int] = 100, max_memory: Optional[int] = None) -> None:
+    # Uses a pool of `size` headless browsers to render the pages. Each
+    # browser is relaunched after `max_renders` renders, or once it uses
+    # `max_memory` bytes. Set it before loading data, the old pool is closed.
+    old_pool = browser.pool
+    browser.pool = BrowserPool(size=size, max_renders=max_renders, max_memory=max_memory)
+    old_pool.close()
+
+
+def set_retry_policy(retry: RetryPolicy) -> None:
+    # Pass RetryPolicy(attempts=1) to disable the retries.
+    browser.retry = retry
+    async_browser.retry = retry
+
+
+def set_circuit_breakers(failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+    # After `failure_threshold` consecutive failed attempts to fetch or
+    # render the pages of a host (retries included), its pages are not
+    # requested for `reset_timeout` seconds, and their last good version
+    # is used instead.
+    breakers = CircuitBreakers(failure_threshold=failure_threshold, reset_timeout=reset_timeout)
+    browser.breakers = breakers
+    async_browser.breakers = breakers
+
+
+def get_http_stats() -> TransportStats:
+    # Requests sent, connections opened and HTTP versions used to fetch the pages.
+    return browser.transport.stats()
+
+
+def get_data_tables_from_html(
+    html: str,
+    new_column_names: List[Tuple[str, ...]],
+    attrs: Optional[Dict[str, str]] = {'class': 'table'},
+    positions: Optional[Collection[int]] = None,
+    columns: Optional[Dict[int, Sequence[str]]] = None,
+    column_types: Optional[Dict[int, Dict[str, str]]] = None,
+    backends: Optional[Sequence[str]] = None
+) -> List[Optional[List[dict]]]:
+    # When `positions` is given, only those tables are parsed and
+    # the others are returned as None. The `tables` module (and pandas)
+    # is imported here, so the counters functions do not load it.
+    from worldometer.scraper.tables import get_html_tables_data
+
+    data = get_html_tables_data(
+        html=html,
+        new_column_names=new_column_names,
+        attrs=attrs,
+        backends=backends,
+        positions=positions,
+        columns=columns,
+        column_types=column_types
+    )
+    return data
+
+
+def get_data_frames_from_html(
+    html: str,
+    new_column_names: List[Tuple[str, ...]],
+    attrs: Optional[Dict[str, str]] = {'class': 'table'},
+    positions: Optional[Collection[int]] = None,
+    columns: Optional[Dict[int, Sequence[str]]] = None,
+    column_types: Optional[Dict[int, Dict[str, str]]] = None,
+    backends: Optional[Sequence[str]] = None
+) -> List[Optional['pd.DataFrame']]:
+    # Same as `get_data_tables_from_html`, but the tables are returned
+    # as DataFrames, without creating a Python object for each row.
+    from worldometer.scraper.tables import get_html_tables_frames
+
+    frames = get_html_tables_frames(
+        html=html,
+        new_column_names=new_column_names,
+        attrs=attrs,
+        backends=backends,
+        positions=positions,
+        columns=columns,
+        column_types=column_types
+    )
+    return frames
+
+
+class Page:
+    """A page fetched once, from which its tables and
+    rts_counters can be extracted as many times as needed.
+
+    A page may be shared by several threads: rts_counters are only
+    extracted once, and concurrent extractions of the same tables
+    share a single parse.
+
+    `fetched_at` is the Unix time the content was fetched from the
+    website, which is earlier than its load when it comes from the
+    HTTP cache.
+    """
+
+    def __init__(self, html_obj: HTML, fetched_at: Optional[float] = None) -> None:
+        self._html_obj = html_obj
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+        self._rts_counters: Optional[Dict[str, dict]] = None
+        self._rts_counters_lock = threading.Lock()
+        self._table_flights = SingleFlight()
+        self._async_flights = AsyncSingleFlight()
+
+    @property
+    def url(self) -> str:
+        return self._html_obj.url
+
+    @property
+    def html(self) -> str:
+        return self._html_obj.html
+
+    def render(self) -> None:
+        browser.render_page(self._html_obj)
+
+    async def arender(self) -> None:
+        await async_browser.render_page(self._html_obj)
+
+    def _get_rts_counters_script_return(self) -> Dict[str, dict]:
+        with self._rts_counters_lock:
+            if self._rts_counters is None:
+                try:
+                    # Reading the object straight from the inline scripts avoids
+                    # starting a headless browser, which is orders of magnitude slower.
+                    self._rts_counters = get_rts_counters_from_html(self.html)
+                except ParserError:
+                    self._rts_counters = browser.run_js_script(self._html_obj, script='() => rts_counters')
+            return self._rts_counters
+
+    async def _aget_rts_counters_script_return(self) -> Dict[str, dict]:
+        if self._rts_counters is None:
+            try:
+                self._rts_counters = get_rts_counters_from_html(self.html)
+            except ParserError:
+                self._rts_counters = await self._async_flights.do(
+                    'rts_counters',
+                    async_browser.run_js_script,
+                    self._html_obj,
+                    script='() => rts_counters'
+                )
+        return self._rts_counters
+
+    def get_rts_counters_object(self) -> Dict[str, Union[int, float, None]]:
+        script_return = self._get_rts_counters_script_return()
+        return get_rts_counters_only_with_last_value_key(rts_counters=script_return)
+
+    def get_rts_counters_metadata(self) -> Dict[str, Dict[str, Union[int, float, None]]]:
+        script_return = self._get_rts_counters_script_return()
+        return get_rts_counters_with_metadata(rts_counters=script_return)
+
+    async def aget_rts_counters_object(self) -> Dict[str, Union[int, float, None]]:
+        script_return = await self._aget_rts_counters_script_return()
+        return get_rts_counters_only_with_last_value_key(rts_counters=script_return)
+
+    async def aget_rts_counters_metadata(self) -> Dict[str, Dict[str, Union[int, float, None]]]:
+        script_return = await self._aget_rts_counters_script_return()
+        return get_rts_counters_with_metadata(rts_counters=script_return)
+
+    def validate_data_tables(
+        self,
+        new_column_names: List[Tuple[str, ...]],
+        attrs: Optional[Dict[str, str]] = {'class': 'table'},
+        backends: Optional[Sequence[str]] = None
+    ) -> None:
+        # Raises HTMLTablesNotFoundError or ColumnNamesLengthError when the
+        # tables of the page do not match the column names, without parsing them.
+        from worldometer.scraper.tables import validate_html_tables
+
+        validate_html_tables(self.html, attrs=attrs, new_column_names=new_column_names, backends=backends)
+
+    def get_data_tables(
+        self,
+        new_column_names: List[Tuple[str, ...]],
+        attrs: Optional[Dict[str, str]] = {'class': 'table'},
+        positions: Optional[Collection[int]] = None,
+        columns: Optional[Dict[int, Sequence[str]]] = None,
+        column_types: Optional[Dict[int, Dict[str, str]]] = None,
+        backends: Optional[Sequence[str]] = None
+    ) -> List[Optional[List[dict]]]:
+        return self._table_flights.do(
+            make_key('tables', new_column_names, attrs, positions, columns, column_types, backends),
+            get_data_tables_from_html,
+            self.html,
+            new_column_names=new_column_names,
+            attrs=attrs,
+            positions=positions,
+            columns=columns,
+            column_types=column_types,
+            backends=backends
+        )
+
+    def get_data_frames(
+        self,
+        new_column_names: List[Tuple[str, ...]],
+        attrs: Optional[Dict[str, str]] = {'class': 'table'},
+        positions: Optional[Collection[int]] = None,
+        columns: Optional[Dict[int, Sequence[str]]] = None,
+        column_types: Optional[Dict[int, Dict[str, str]]] = None,
+        backends: Optional[Sequence[str]] = None
+    ) -> List[Optional['pd.DataFrame']]:
+        return self._table_flights.do(
+            make_key('frames', new_column_names, attrs, positions, columns, column_types, backends),
+            get_data_frames_from_html,
+            self.html,
+            new_column_names=new_column_names,
+            attrs=attrs,
+            positions=positions,
+            columns=columns,
+            column_types=column_types,
+            backends=backends
+        )
+
+
+def _get_fetched_at(cache: Optional[HTTPCache], url: str, max_age: Optional[float]) -> Optional[float]:
+    # With a `max_age`, the page may come from the HTTP cache, whose
+    # entry is stored (or revalidated) when the page is fetched.
+    if cache is None or max_age is None:
+        return None
+    return cache.get_stored_at(url)
+
+
+def _load_page(url: str, render: bool, max_age: Optional[float]) -> Page:
+    html_obj = browser.get_page_content(url, max_age=max_age)
+    page = Page(html_obj, fetched_at=_get_fetched_at(browser.cache, url, max_age))
+
+    if render:
+        page.render()
+
+    return page
+
+
+async def _aload_page(url: str, render: bool, max_age: Optional[float]) -> Page:
+    html_obj = await async_browser.get_page_content(url, max_age=max_age)
+    page = Page(html_obj, fetched_at=_get_fetched_at(async_browser.cache, url, max_age))
+
+    if render:
+        await page.arender()
+
+    return page
+
+
+def get_page(
+    path_url: Optional[str] = None,
+    render: bool = False,
+    max_age: Optional[float] = None
+) -> Page:
+    # Threads loading the same page at the same time get the same Page.
+    url = make_url(BASE_URL, path_url)
+    return _page_flights.do((url, render, max_age), _load_page, url, render, max_age)
+
+
+async def aget_page(
+    path_url: Optional[str] = None,
+    render: bool = False,
+    max_age: Optional[float] = None
+) -> Page:
+    # Coroutines loading the same page at the same time get the same Page.
+    url = make_url(BASE_URL, path_url)
+    return await _async_page_flights.do((url, render, max_age), _aload_page, url, render, max_age)
 
 
 def get_rts_counters_object(
         path_url: Optional[str] = None
 ) -> Dict[str, Union[int, float, None]]:
-    url = make_url(BASE_URL, path_url)
-    html = browser.get_page_content(url)
-    script_return = browser.run_js_script(html, script='() => rts_counters')
-    rts_counters = get_rts_counters_only_with_last_value_key(rts_counters=script_return)
-    return rts_counters
+    return get_page(path_url).get_rts_counters_object()
+
+
+def get_rts_counters_metadata(
+        path_url: Optional[str] = None
+) -> Dict[str, Dict[str, Union[int, float, None]]]:
+    return get_page(path_url).get_rts_counters_metadata()
+
+
+async def aget_rts_counters_object(
+        path_url: Optional[str] = None
+) -> Dict[str, Union[int, float, None]]:
+    page = await aget_page(path_url)
+    return await page.aget_rts_counters_object()
+
+
+async def aget_rts_counters_metadata(
+        path_url: Optional[str] = None
+) -> Dict[str, Dict[str, Union[int, float, None]]]:
+    page = await aget_page(path_url)
+    return await page.aget_rts_counters_metadata()
+
+
+def get_page_html(
+    path_url: str,
+    render: bool = False,
+    max_age: Optional[float] = None
+) -> str:
+    return get_page(path_url, render=render, max_age=max_age).html
+
+
+async def aget_page_html(
+    path_url: str,
+    render: bool = False,
+    max_age: Optional[float] = None
+) -> str:
+    page = await aget_page(path_url, render=render, max_age=max_age)
+    return page.html
 
 
 def get_data_tables(
     path_url: str,
     new_column_names: List[Tuple[str, ...]],
     render: bool = False,
-    attrs: Optional[Dict[str, str]] = {'class': 'table'}
-) -> List[List[dict]]:
-    url = make_url(BASE_URL, path_url)
-    html = browser.get_page_content(url)
+    attrs: Optional[Dict[str, str]] = {'class': 'table'},
+    max_age: Optional[float] = None,
+    backends: Optional[Sequence[str]] = None,
+    positions: Optional[Collection[int]] = None,
+    columns: Optional[Dict[int, Sequence[str]]] = None,
+    column_types: Optional[Dict[int, Dict[str, str]]] = None
+) -> List[Optional[List[dict]]]:
+    page = get_page(path_url, render=render, max_age=max_age)
+    data = page.get_data_tables(
+        new_column_names=new_column_names,
+        attrs=attrs,
+        positions=positions,
+        columns=columns,
+        column_types=column_types,
+        backends=backends
+    )
+    return data
 
-    if render:
-        browser.render_page(html)
 
-    data = get_html_tables_data(
-        html=html.html,
+async def aget_data_tables(
+    path_url: str,
+    new_column_names: List[Tuple[str, ...]],
+    render: bool = False,
+    attrs: Optional[Dict[str, str]] = {'class': 'table'},
+    max_age: Optional[float] = None,
+    backends: Optional[Sequence[str]] = None,
+    positions: Optional[Collection[int]] = None,
+    columns: Optional[Dict[int, Sequence[str]]] = None,
+    column_types: Optional[Dict[int, Dict[str, str]]] = None
+) -> List[Optional[List[dict]]]:
+    page = await aget_page(path_url, render=render, max_age=max_age)
+    data = page.get_data_tables(
         new_column_names=new_column_names,
-        attrs=attrs
+        attrs=attrs,
+        positions=positions,
+        columns=columns,
+        column_types=column_types,
+        backends=backends
     )
     return data
@@ -20,3 +20,19 @@ class HTMLTablesNotFoundError(ParserError):
 
 class ColumnNamesLengthError(ParserError):
     """Length of column names different than expected."""
+
+
+class JSObjectParserError(ParserError):
+    """Could not parse the JavaScript object literal."""
+
+
+class RTSCountersNotFoundError(ParserError):
+    """No rts_counters object found in the inline scripts."""
+
+
+class CircuitOpenError(BrowserError):
+    """Too many failures accessing the host, requests are not sent until it recovers."""
+
+
+class PoolTimeoutError(BrowserError):
+    """No idle session of the pool was available within its timeout."""
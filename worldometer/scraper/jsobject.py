@@ -0,0 +1,221 @@
+import re
+
+from typing import Any, Dict, List, Tuple
+
+from worldometer.scraper.exceptions import JSObjectParserError
+
+
+# Only literal values are supported. Anything that needs a JavaScript
+# engine to be evaluated (calls, operators, references) raises an error,
+# so callers can fall back to rendering the page in a real browser.
+
+_NUMBER_PATTERN = re.compile(
+    r'-?(?:0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)'
+)
+_IDENTIFIER_PATTERN = re.compile(r'[A-Za-z_$][\w$]*')
+
+_JS_KEYWORD_VALUES = {
+    'true': True,
+    'false': False,
+    'null': None,
+    'undefined': None,
+    'NaN': float('nan'),
+    'Infinity': float('inf')
+}
+
+_STRING_ESCAPES = {
+    'b': '\b',
+    'f': '\f',
+    'n': '\n',
+    'r': '\r',
+    't': '\t',
+    'v': '\v',
+    '0': '\0'
+}
+
+
+class _JSObjectParser:
+
+    def __init__(self, source: str, pos: int = 0) -> None:
+        self.source = source
+        self.pos = pos
+
+    def _error(self, message: str) -> JSObjectParserError:
+        return JSObjectParserError(f'{message} at position {self.pos}')
+
+    def _skip_whitespace_and_comments(self) -> None:
+        source = self.source
+        length = len(source)
+
+        while self.pos < length:
+            char = source[self.pos]
+
+            if char.isspace():
+                self.pos += 1
+
+            elif source.startswith('//', self.pos):
+                end = source.find('\n', self.pos)
+                self.pos = length if end == -1 else end + 1
+
+            elif source.startswith('/*', self.pos):
+                end = source.find('*/', self.pos + 2)
+                if end == -1:
+                    raise self._error('Unterminated comment')
+                self.pos = end + 2
+
+            else:
+                break
+
+    def _peek(self) -> str:
+        self._skip_whitespace_and_comments()
+        if self.pos >= len(self.source):
+            raise self._error('Unexpected end of source')
+        return self.source[self.pos]
+
+    def parse_value(self) -> Any:
+        char = self._peek()
+
+        if char == '{':
+            return self._parse_object()
+
+        if char == '[':
+            return self._parse_array()
+
+        if char in ('"', "'"):
+            return self._parse_string()
+
+        if char == '-' or char == '.' or char.isdigit():
+            return self._parse_number()
+
+        identifier_match = _IDENTIFIER_PATTERN.match(self.source, self.pos)
+        if identifier_match and identifier_match.group() in _JS_KEYWORD_VALUES:
+            self.pos = identifier_match.end()
+            return _JS_KEYWORD_VALUES[identifier_match.group()]
+
+        raise self._error(f'Unsupported token {char!r}')
+
+    def _parse_object(self) -> Dict[str, Any]:
+        obj = {}
+        self.pos += 1  # skip "{"
+
+        while True:
+            char = self._peek()
+
+            if char == '}':
+                self.pos += 1
+                return obj
+
+            key = self._parse_key()
+
+            if self._peek() != ':':
+                raise self._error('Expected ":" after object key')
+            self.pos += 1
+
+            obj[key] = self.parse_value()
+
+            char = self._peek()
+            if char == ',':
+                self.pos += 1
+            elif char != '}':
+                raise self._error('Expected "," or "}" in object')
+
+    def _parse_key(self) -> str:
+        char = self._peek()
+
+        if char in ('"', "'"):
+            return self._parse_string()
+
+        if char.isdigit():
+            return str(self._parse_number())
+
+        identifier_match = _IDENTIFIER_PATTERN.match(self.source, self.pos)
+        if not identifier_match:
+            raise self._error('Invalid object key')
+
+        self.pos = identifier_match.end()
+        return identifier_match.group()
+
+    def _parse_array(self) -> List[Any]:
+        arr = []
+        self.pos += 1  # skip "["
+
+        while True:
+            if self._peek() == ']':
+                self.pos += 1
+                return arr
+
+            arr.append(self.parse_value())
+
+            char = self._peek()
+            if char == ',':
+                self.pos += 1
+            elif char != ']':
+                raise self._error('Expected "," or "]" in array')
+
+    def _parse_string(self) -> str:
+        source = self.source
+        quote = source[self.pos]
+        self.pos += 1
+
+        chars = []
+        while self.pos < len(source):
+            char = source[self.pos]
+
+            if char == quote:
+                self.pos += 1
+                return ''.join(chars)
+
+            if char == '\\':
+                self.pos += 1
+                if self.pos >= len(source):
+                    break
+
+                escaped = source[self.pos]
+                if escaped == 'u':
+                    hex_code = source[self.pos + 1:self.pos + 5]
+                    try:
+                        chars.append(chr(int(hex_code, 16)))
+                    except ValueError:
+                        raise self._error('Invalid unicode escape') from None
+                    self.pos += 5
+                    continue
+
+                if escaped == 'x':
+                    hex_code = source[self.pos + 1:self.pos + 3]
+                    try:
+                        chars.append(chr(int(hex_code, 16)))
+                    except ValueError:
+                        raise self._error('Invalid hex escape') from None
+                    self.pos += 3
+                    continue
+
+                chars.append(_STRING_ESCAPES.get(escaped, escaped))
+                self.pos += 1
+                continue
+
+            chars.append(char)
+            self.pos += 1
+
+        raise self._error('Unterminated string')
+
+    def _parse_number(self) -> Any:
+        number_match = _NUMBER_PATTERN.match(self.source, self.pos)
+        if not number_match:
+            raise self._error('Invalid number')
+
+        self.pos = number_match.end()
+        literal = number_match.group()
+
+        if literal.lstrip('-')[:2] in ('0x', '0X'):
+            return int(literal, 16)
+
+        if any(c in literal for c in '.eE'):
+            return float(literal)
+
+        return int(literal)
+
+
+def parse_js_value(source: str, pos: int = 0) -> Tuple[Any, int]:
+    parser = _JSObjectParser(source, pos)
+    value = parser.parse_value()
+    return value, parser.pos
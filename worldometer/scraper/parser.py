@@ -1,62 +1,128 @@
-from typing import Dict, List, Optional, Tuple, Union
+import re
 
-from io import StringIO
+from typing import Dict, List, Optional, Union
 
-import pandas as pd
+from worldometer._lazy import attach
+from worldometer.scraper.exceptions import JSObjectParserError, RTSCountersNotFoundError
+from worldometer.scraper.jsobject import parse_js_value
 
-from worldometer.scraper.exceptions import (
-    ColumnNamesLengthError,
-    HTMLTablesNotFoundError
+
+_INLINE_SCRIPT_PATTERN = re.compile(
+    r'<script\b(?P<attrs>[^>]*)>(?P<content>.*?)</script\s*>',
+    flags=re.DOTALL | re.IGNORECASE
+)
+_SCRIPT_SRC_PATTERN = re.compile(r'\bsrc\s*=', flags=re.IGNORECASE)
+# Any assignment to rts_counters, or to one of its properties.
+_RTS_COUNTERS_ASSIGNMENT_PATTERN = re.compile(
+    r'\brts_counters(?P<accessors>(?:\s*(?:\[[^\n]*?\]|\.\s*[A-Za-z_$][\w$]*))*)'
+    r'\s*=(?![=>])\s*'
+)
+_RTS_COUNTERS_KEY_PATTERN = re.compile(
+    r'\s*(?:\[\s*(?P<quote>[\'"])(?P<key>[^\'"]+)(?P=quote)\s*\]|\.\s*(?P<attr>[A-Za-z_$][\w$]*))\s*'
 )
 
 
-def get_rts_counters_only_with_last_value_key(
-    rts_counters: Dict[str, dict]
-) -> Dict[str, Union[int, float, None]]:
-    return {
-        key: subdict.get('last_value') or None
-        for key, subdict in rts_counters.items()
-    }
+def get_inline_scripts(html: str) -> List[str]:
+    return [
+        match.group('content')
+        for match in _INLINE_SCRIPT_PATTERN.finditer(html)
+        if not _SCRIPT_SRC_PATTERN.search(match.group('attrs'))
+    ]
 
 
-def get_html_tables_data(
-    html: str,
-    attrs: Optional[Dict[str, str]],
-    new_column_names: List[Tuple[str, ...]]
-) -> List[List[dict]]:
-    data = []
+def _get_rts_counters_key(accessors: str) -> Optional[str]:
+    # The counter assigned by `rts_counters<accessors> = ...`, None when
+    # the whole object is assigned. Keys that are not literals (e.g. a
+    # variable) can only be known by running the scripts.
+    if not accessors.strip():
+        return None
 
-    try:
-        dfs = pd.read_html(io=StringIO(html), attrs=attrs, flavor='bs4')
+    match = _RTS_COUNTERS_KEY_PATTERN.fullmatch(accessors)
+    if match is None:
+        raise JSObjectParserError(f'rts_counters{accessors.strip()} assignment has no literal key')
 
-        dfs_len = len(dfs)
-        col_names_len = len(new_column_names)
+    return match.group('key') or match.group('attr')
 
-        if dfs_len != col_names_len:
-            raise ColumnNamesLengthError(
-                f'{col_names_len} tuples of column names for {dfs_len} table'
-            )
 
-        for idx, df in enumerate(dfs):
+def get_rts_counters_from_html(html: str) -> Dict[str, dict]:
+    rts_counters: Dict[str, dict] = {}
+    found = False
+
+    for script in get_inline_scripts(html):
+        for match in _RTS_COUNTERS_ASSIGNMENT_PATTERN.finditer(script):
+            key = _get_rts_counters_key(match.group('accessors'))
+
+            if not script.startswith('{', match.end()):
+                raise JSObjectParserError('rts_counters assignment is not an object literal')
+
+            value, _ = parse_js_value(script, match.end())
+
+            if key is None:
+                # Replaces the counters assigned before.
+                rts_counters = dict(value)
+            else:
+                rts_counters[key] = value
+
+            found = True
 
-            col_len = len(df.columns)
-            new_col_len = len(new_column_names[idx])
+    if not found:
+        raise RTSCountersNotFoundError('No rts_counters object found in the inline scripts')
 
-            if col_len != new_col_len:
-                raise ColumnNamesLengthError(
-                    f'Table in position {idx} expected {col_len} column names but received {new_col_len}'
-                )
+    # The counters may be declared empty and filled by other scripts,
+    # in which case they are only available after rendering the page.
+    if not any(isinstance(value, dict) and 'last_value' in value for value in rts_counters.values()):
+        raise RTSCountersNotFoundError('The rts_counters object found in the inline scripts has no counters')
 
-            df.columns = new_column_names[idx]
+    return rts_counters
 
-            data.append(df.to_dict(orient='records'))
 
-    except ValueError as err:
-        expected_error_message = 'No tables found'
+def get_rts_counters_only_with_last_value_key(
+    rts_counters: Dict[str, dict]
+) -> Dict[str, Union[int, float, None]]:
+    return {
+        key: subdict.get('last_value') or None
+        for key, subdict in rts_counters.items()
+    }
+
+
+def get_rts_counters_with_metadata(
+    rts_counters: Dict[str, dict]
+) -> Dict[str, Dict[str, Union[int, float, None]]]:
+    # Keeps every numeric field (last_value, rate, interval, start values...)
+    # so that the counters can be extrapolated locally later.
+    return {
+        key: {
+            meta_key: meta_value
+            for meta_key, meta_value in subdict.items()
+            if meta_value is None or (
+                isinstance(meta_value, (int, float))
+                and not isinstance(meta_value, bool)
+            )
+        }
+        for key, subdict in rts_counters.items()
+    }
 
-        if expected_error_message in err.args:
-            raise HTMLTablesNotFoundError('No HTML tables found') from err
 
-        raise
+# The HTML tables are parsed with pandas, which is only imported (through
+# the `tables` module) when a table function is used, so the counters do
+# not depend on it.
+_TABLE_NAMES = (
+    'TableParserBackendType',
+    'TABLE_PARSER_BACKENDS',
+    'DEFAULT_TABLE_PARSER_BACKENDS',
+    'register_table_parser_backend',
+    'read_html_tables',
+    'COLUMN_TYPE_CONVERTERS',
+    'convert_column_types',
+    'read_selected_html_tables',
+    'frame_to_records',
+    'frame_to_arrays',
+    'get_html_tables_frames',
+    'get_html_tables_data'
+)
 
-    return data
+__getattr__, __dir__ = attach(
+    __name__,
+    dict.fromkeys(_TABLE_NAMES, 'worldometer.scraper.tables'),
+    _TABLE_NAMES
+)
@@ -0,0 +1,314 @@
+import asyncio
+import os
+import queue
+import threading
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pyppeteer
+
+from pyppeteer.errors import BrowserError as PyppeteerBrowserError, NetworkError, PageError
+from requests.adapters import HTTPAdapter
+from requests_html import HTMLSession
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+
+from worldometer.scraper.exceptions import PoolTimeoutError
+
+
+# Errors that indicate the browser (or its page) is no longer usable.
+# The pooled browser is discarded and the render is retried on a new one.
+BROWSER_CRASH_ERRORS = (PyppeteerBrowserError, NetworkError, PageError, ConnectionError)
+
+
+def _get_process_tree_rss(pid: int) -> Optional[int]:
+    # Chromium runs one process per renderer, so the memory of
+    # the whole process tree is summed. Only Linux is supported,
+    # on other platforms there is no memory ceiling.
+    try:
+        children: Dict[int, List[int]] = {}
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/stat') as f:
+                    stat = f.read()
+            except OSError:
+                continue
+            # The process name may contain spaces, so split after it.
+            ppid = int(stat[stat.rfind(')') + 2:].split()[1])
+            children.setdefault(ppid, []).append(int(entry))
+
+        rss = 0
+        pids = [pid]
+        while pids:
+            current_pid = pids.pop()
+            pids.extend(children.get(current_pid, []))
+            try:
+                with open(f'/proc/{current_pid}/statm') as f:
+                    rss += int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+            except OSError:
+                continue
+
+    except (OSError, ValueError, IndexError):
+        return None
+
+    return rss
+
+
+class PooledBrowser:
+
+    def __init__(self, launch_args: Sequence[str] = ('--no-sandbox',)) -> None:
+        self.launch_args = list(launch_args)
+        self.renders = 0
+
+        # Each pooled browser owns its loop, so different browsers
+        # can be used at the same time from different threads. It is
+        # created when the browser is launched, on the first render.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._browser: Any = None
+        self._page: Any = None
+
+    @property
+    def is_alive(self) -> bool:
+        return (
+            self._browser is not None
+            and self._browser.process is not None
+            and self._browser.process.poll() is None
+        )
+
+    @property
+    def rss(self) -> Optional[int]:
+        if not self.is_alive:
+            return None
+        return _get_process_tree_rss(self._browser.process.pid)
+
+    def _launch(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._browser = self._loop.run_until_complete(
+            pyppeteer.launch(
+                headless=True,
+                args=self.launch_args,
+                # Signal handlers can only be set up from the main thread.
+                handleSIGINT=False,
+                handleSIGTERM=False,
+                handleSIGHUP=False
+            )
+        )
+        self._page = self._loop.run_until_complete(self._browser.newPage())
+        self.renders = 0
+
+    async def _render(self, url: str, script: Optional[str], timeout: float) -> Tuple[str, Any]:
+        await self._page.goto(url, options={'timeout': int(timeout * 1000)})
+
+        result = None
+        if script:
+            result = await self._page.evaluate(script)
+
+        content = await self._page.content()
+        return content, result
+
+    def render(self, url: str, script: Optional[str] = None, timeout: float = 30) -> Tuple[str, Any]:
+        if not self.is_alive:
+            self.close()
+            self._launch()
+
+        self.renders += 1
+        return self._loop.run_until_complete(self._render(url, script, timeout))  # type: ignore
+
+    def close(self) -> None:
+        if self._browser is not None:
+            try:
+                self._loop.run_until_complete(self._browser.close())  # type: ignore
+            except Exception:
+                # The browser may have already crashed, in which case
+                # there is nothing left to close.
+                pass
+
+        if self._loop is not None:
+            self._loop.close()
+
+        self._loop = None
+        self._browser = None
+        self._page = None
+        self.renders = 0
+
+
+class BrowserPool:
+
+    def __init__(
+        self,
+        size: int = 1,
+        max_renders: Optional[int] = 100,
+        max_memory: Optional[int] = None,
+        launch_args: Sequence[str] = ('--no-sandbox',)
+    ) -> None:
+        if size < 1:
+            raise ValueError('The pool size must be at least 1')
+
+        self.size = size
+        self.max_renders = max_renders
+        self.max_memory = max_memory
+
+        # LIFO keeps reusing the most recently used (warmest) browser.
+        self._idle: 'queue.LifoQueue[PooledBrowser]' = queue.LifoQueue()
+        self._browsers = [PooledBrowser(launch_args) for _ in range(size)]
+        for pooled_browser in self._browsers:
+            self._idle.put(pooled_browser)
+
+    def _should_recycle(self, pooled_browser: PooledBrowser) -> bool:
+        if self.max_renders is not None and pooled_browser.renders >= self.max_renders:
+            return True
+
+        if self.max_memory is not None:
+            rss = pooled_browser.rss
+            if rss is not None and rss >= self.max_memory:
+                return True
+
+        return False
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator[PooledBrowser]:
+        pooled_browser = self._idle.get(timeout=timeout)
+        try:
+            yield pooled_browser
+        finally:
+            if self._should_recycle(pooled_browser):
+                pooled_browser.close()
+            self._idle.put(pooled_browser)
+
+    def render(self, url: str, script: Optional[str] = None, timeout: float = 30) -> Tuple[str, Any]:
+        with self.acquire() as pooled_browser:
+            try:
+                return pooled_browser.render(url, script=script, timeout=timeout)
+            except BROWSER_CRASH_ERRORS:
+                # Recover from a crashed browser by retrying once on a new one.
+                pooled_browser.close()
+                return pooled_browser.render(url, script=script, timeout=timeout)
+
+    def close(self) -> None:
+        for pooled_browser in self._browsers:
+            pooled_browser.close()
+
+
+class _ConnectionCountingMixin:
+    # urllib3 only counts the connection objects it creates, and reuses
+    # them to reconnect when the server closes the connection, so the
+    # requests sent without an open socket are counted instead.
+    num_opened_connections = 0
+
+    def _make_request(self, conn: Any, *args: Any, **kwargs: Any) -> Any:
+        if getattr(conn, 'sock', None) is None:
+            self.num_opened_connections += 1
+        return super()._make_request(conn, *args, **kwargs)  # type: ignore
+
+
+class _CountingHTTPConnectionPool(_ConnectionCountingMixin, HTTPConnectionPool):
+    pass
+
+
+class _CountingHTTPSConnectionPool(_ConnectionCountingMixin, HTTPSConnectionPool):
+    pass
+
+
+class _CountingHTTPAdapter(HTTPAdapter):
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _CountingHTTPConnectionPool,
+            'https': _CountingHTTPSConnectionPool
+        }
+
+
+class SessionPool:
+    # requests sessions are not guaranteed to be thread-safe, so each
+    # request checks out a session for itself. The pool size limits the
+    # number of concurrent requests (and of connections to each host),
+    # and the connections of idle sessions are kept alive for reuse.
+
+    def __init__(
+        self,
+        size: int = 4,
+        keep_alive: bool = True,
+        timeout: Optional[float] = None
+    ) -> None:
+        if size < 1:
+            raise ValueError('The pool size must be at least 1')
+
+        self.size = size
+        self.keep_alive = keep_alive
+        # Seconds to wait for an idle session, None waits indefinitely.
+        self.timeout = timeout
+
+        # LIFO keeps reusing the session with the most recently used connections.
+        self._idle: 'queue.LifoQueue[HTMLSession]' = queue.LifoQueue()
+        self._sessions: List[HTMLSession] = []
+        self._lock = threading.Lock()
+
+    def _create_session(self) -> HTMLSession:
+        session = HTMLSession()
+
+        # A session makes a single request at a time, so
+        # one connection for each host is enough.
+        adapter = _CountingHTTPAdapter(pool_maxsize=1)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+
+        return session
+
+    def _get_session(self) -> HTMLSession:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        # Sessions are created on demand, up to the pool size.
+        with self._lock:
+            if len(self._sessions) < self.size:
+                session = self._create_session()
+                self._sessions.append(session)
+                return session
+
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise PoolTimeoutError(
+                f'All the {self.size} sessions of the pool were busy for {self.timeout} seconds, '
+                'increase the pool size or its timeout with `set_http_pool`'
+            ) from None
+
+    @contextmanager
+    def acquire(self) -> Iterator[HTMLSession]:
+        session = self._get_session()
+        try:
+            yield session
+        finally:
+            self._idle.put(session)
+
+    def connection_stats(self) -> Tuple[int, int]:
+        # Number of requests sent and of connections opened by all
+        # sessions, as counted by the connection pools of each host.
+        requests = connections = 0
+
+        with self._lock:
+            sessions = list(self._sessions)
+
+        for session in sessions:
+            for adapter in set(session.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    host_pool = pools.get(key)
+                    if host_pool is not None:
+                        requests += host_pool.num_requests
+                        connections += host_pool.num_opened_connections
+
+        return requests, connections
+
+    def close(self) -> None:
+        with self._lock:
+            for session in self._sessions:
+                session.close()
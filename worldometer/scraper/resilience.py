@@ -0,0 +1,188 @@
+import asyncio
+import random
+import threading
+import time
+
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Tuple, Type, TypeVar
+from urllib.parse import urlsplit
+
+from worldometer.scraper.exceptions import CircuitOpenError
+
+
+_T = TypeVar('_T')
+
+
+class RetryPolicy:
+    # Exponential backoff with full jitter: the delay before the nth retry
+    # is a random time between 0 and min(max_backoff, backoff * 2 ** n),
+    # so clients that failed at the same time do not retry at the same time.
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 10.0,
+        jitter: bool = True
+    ) -> None:
+        if attempts < 1:
+            raise ValueError('The number of attempts must be at least 1')
+
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+
+    def delays(self) -> Iterator[float]:
+        # Seconds to wait before each retry.
+        for retry in range(self.attempts - 1):
+            delay = min(self.max_backoff, self.backoff * 2 ** retry)
+            yield random.uniform(0, delay) if self.jitter else delay
+
+
+class CircuitBreaker:
+    # Opens after `failure_threshold` consecutive failures, and then calls
+    # fail fast. Once `reset_timeout` seconds have passed, a single trial
+    # call is allowed: it closes the breaker if it succeeds, otherwise
+    # another trial is allowed after `reset_timeout` seconds.
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        if failure_threshold < 1:
+            raise ValueError('The failure threshold must be at least 1')
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return self._failures >= self.failure_threshold
+
+    def allow(self) -> bool:
+        with self._lock:
+            if not self.is_open:
+                return True
+
+            now = time.monotonic()
+            if now - self._opened_at >= self.reset_timeout:
+                self._opened_at = now
+                return True
+
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+class CircuitBreakers:
+    # A circuit breaker for each host.
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, url: str) -> CircuitBreaker:
+        host = urlsplit(url).netloc
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return breaker
+
+
+def _check_breaker(breaker: CircuitBreaker, url: str) -> None:
+    if not breaker.allow():
+        raise CircuitOpenError(f'Too many failures accessing {urlsplit(url).netloc}, not retrying yet')
+
+
+def _record_failed_attempt(breaker: CircuitBreaker, delays: Iterator[float]) -> Optional[float]:
+    # Each failed attempt counts as a failure of the host. Returns the
+    # delay before the next attempt, or None when there are no attempts
+    # left or the breaker opened.
+    breaker.record_failure()
+    if breaker.is_open:
+        return None
+    return next(delays, None)
+
+
+def call_with_retries(
+    func: Callable[[], _T],
+    url: str,
+    retry: RetryPolicy,
+    breakers: CircuitBreakers,
+    errors: Tuple[Type[BaseException], ...],
+    is_failure: Callable[[_T], bool] = lambda result: False
+) -> _T:
+    # Calls `func` until it neither raises one of `errors` nor returns a
+    # result for which `is_failure` is true, up to the attempts of the
+    # retry policy. Every failed attempt is recorded in the circuit breaker
+    # of the host, and the attempts stop as soon as it opens. Then the
+    # last error is raised (or the last result returned), and later calls
+    # raise CircuitOpenError while the breaker is open.
+    breaker = breakers.get(url)
+    _check_breaker(breaker, url)
+
+    delays = retry.delays()
+
+    while True:
+        try:
+            result: Any = func()
+        except errors:
+            delay = _record_failed_attempt(breaker, delays)
+            if delay is None:
+                raise
+        else:
+            if not is_failure(result):
+                breaker.record_success()
+                return result
+
+            delay = _record_failed_attempt(breaker, delays)
+            if delay is None:
+                return result
+
+        time.sleep(delay)
+
+
+async def acall_with_retries(
+    func: Callable[[], Awaitable[_T]],
+    url: str,
+    retry: RetryPolicy,
+    breakers: CircuitBreakers,
+    errors: Tuple[Type[BaseException], ...],
+    is_failure: Callable[[_T], bool] = lambda result: False
+) -> _T:
+    # Same as `call_with_retries` for coroutine functions.
+    breaker = breakers.get(url)
+    _check_breaker(breaker, url)
+
+    delays = retry.delays()
+
+    while True:
+        try:
+            result: Any = await func()
+        except errors:
+            delay = _record_failed_attempt(breaker, delays)
+            if delay is None:
+                raise
+        else:
+            if not is_failure(result):
+                breaker.record_success()
+                return result
+
+            delay = _record_failed_attempt(breaker, delays)
+            if delay is None:
+                return result
+
+        await asyncio.sleep(delay)
@@ -0,0 +1,92 @@
+import asyncio
+import threading
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+def make_key(*values: Any) -> Hashable:
+    # Converts the arguments of a call (which may contain
+    # dicts and lists) into a hashable key.
+    if len(values) != 1:
+        return tuple(make_key(value) for value in values)
+
+    value = values[0]
+    if isinstance(value, dict):
+        return tuple((key, make_key(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(make_key(item) for item in value)
+    return value
+
+
+class _Call:
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    # Concurrent calls with the same key are coalesced: the first one
+    # runs the function and the others wait for and share its result
+    # (or exception). Results are not cached, a call made after the
+    # function returns runs it again.
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = _Call()
+
+        if not is_leader:
+            call.done.wait()  # type: ignore
+            if call.error is not None:  # type: ignore
+                raise call.error  # type: ignore
+            return call.result  # type: ignore
+
+        try:
+            call.result = func(*args, **kwargs)  # type: ignore
+        except BaseException as err:
+            call.error = err  # type: ignore
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()  # type: ignore
+
+        return call.result  # type: ignore
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+class AsyncSingleFlight:
+    # Same as `SingleFlight` for coroutines. Calls are only coalesced
+    # within the same event loop. The shared call runs in a task, so
+    # it is not cancelled when one of the waiters is cancelled.
+
+    def __init__(self) -> None:
+        self._calls: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], 'asyncio.Future[Any]'] = {}
+
+    async def do(self, key: Hashable, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        call_key = (asyncio.get_running_loop(), key)
+
+        task = self._calls.get(call_key)
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self._calls[call_key] = task
+            task.add_done_callback(lambda _: self._calls.pop(call_key, None))
+            # Marks the exception as retrieved when every waiter was cancelled.
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+        return await asyncio.shield(task)
+
+    def __len__(self) -> int:
+        return len(self._calls)
@@ -0,0 +1,303 @@
+from typing import Callable, Collection, Dict, List, Optional, Sequence, Tuple
+
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+
+from lxml import etree, html as lxml_html
+
+from worldometer.scraper.exceptions import ColumnNamesLengthError, HTMLTablesNotFoundError
+
+
+TableParserBackendType = Callable[[str, Optional[Dict[str, str]]], List[pd.DataFrame]]
+
+
+def _read_html_tables_with_lxml(html: str, attrs: Optional[Dict[str, str]]) -> List[pd.DataFrame]:
+    return pd.read_html(io=StringIO(html), attrs=attrs, flavor='lxml')
+
+
+def _read_html_tables_with_bs4(html: str, attrs: Optional[Dict[str, str]]) -> List[pd.DataFrame]:
+    return pd.read_html(io=StringIO(html), attrs=attrs, flavor='bs4')
+
+
+TABLE_PARSER_BACKENDS: Dict[str, TableParserBackendType] = {
+    'lxml': _read_html_tables_with_lxml,
+    'bs4': _read_html_tables_with_bs4
+}
+
+# lxml is an order of magnitude faster than bs4 (with html5lib), which
+# is kept as a fallback for documents that lxml fails to parse.
+DEFAULT_TABLE_PARSER_BACKENDS = ('lxml', 'bs4')
+
+
+def register_table_parser_backend(name: str, backend: TableParserBackendType) -> None:
+    TABLE_PARSER_BACKENDS[name] = backend
+
+
+def _is_no_tables_error(err: ValueError) -> bool:
+    # pandas raises a ValueError when the document has no (matching) tables.
+    return any(str(arg).startswith('No tables found') for arg in err.args)
+
+
+def read_html_tables(
+    html: str,
+    attrs: Optional[Dict[str, str]],
+    backends: Optional[Sequence[str]] = None
+) -> List[pd.DataFrame]:
+    *fallback_backends, last_backend = backends or DEFAULT_TABLE_PARSER_BACKENDS
+
+    for backend in fallback_backends:
+        try:
+            return TABLE_PARSER_BACKENDS[backend](html, attrs)
+        except ValueError as err:
+            # Another backend would not find tables either, only
+            # parsing errors fall back to the next backend.
+            if _is_no_tables_error(err):
+                raise
+        except (ImportError, SyntaxError):
+            # lxml raises a SyntaxError subclass on documents it can't parse.
+            continue
+
+    return TABLE_PARSER_BACKENDS[last_backend](html, attrs)
+
+
+def _to_numeric(series: pd.Series) -> pd.Series:
+    if series.dtype != object:
+        return series.astype('float64')
+
+    cleaned = (
+        series
+        .astype(str)
+        .str.replace(',', '', regex=False)
+        .str.replace('%', '', regex=False)
+        .str.replace('\u2212', '-', regex=False)  # unicode minus sign
+        .str.strip()
+    )
+    # Values such as "N.A." or empty cells become NaN.
+    return pd.to_numeric(cleaned, errors='coerce')
+
+
+def _convert_to_int(series: pd.Series) -> pd.Series:
+    numbers = _to_numeric(series)
+    if not numbers.isna().any():
+        return numbers.astype('int64')
+    # Columns with missing values use the nullable integer type.
+    return numbers.round().astype('Int64')
+
+
+def _convert_to_float(series: pd.Series) -> pd.Series:
+    return _to_numeric(series)
+
+
+# Percentages keep the value shown on the page, e.g. "17.8 %" becomes 17.8.
+COLUMN_TYPE_CONVERTERS: Dict[str, Callable[[pd.Series], pd.Series]] = {
+    'int': _convert_to_int,
+    'float': _convert_to_float,
+    'percent': _convert_to_float
+}
+
+
+def convert_column_types(df: pd.DataFrame, column_types: Dict[str, str]) -> pd.DataFrame:
+    for column, column_type in column_types.items():
+        if column in df.columns:
+            df[column] = COLUMN_TYPE_CONVERTERS[column_type](df[column])
+    return df
+
+
+def _select_html_tables(html: str, attrs: Optional[Dict[str, str]]) -> List[etree._Element]:
+    # Mirrors the table selection of pandas (non-empty and visible tables
+    # matching the attributes), so positions are the same as in `read_html`.
+    document = lxml_html.fromstring(html)
+
+    xpath_expr = "//table[.//text()[re:test(., '.+')]]"
+    if attrs:
+        xpath_expr += '[' + ' and '.join(f'@{k}={v!r}' for k, v in attrs.items()) + ']'
+
+    tables = document.xpath(xpath_expr, namespaces={'re': 'http://exslt.org/regular-expressions'})
+
+    return [
+        table
+        for table in tables
+        if 'display:none' not in table.attrib.get('style', '').replace(' ', '')
+    ]
+
+
+def read_selected_html_tables(
+    html: str,
+    attrs: Optional[Dict[str, str]],
+    positions: Collection[int],
+    backends: Optional[Sequence[str]] = None
+) -> List[Optional[pd.DataFrame]]:
+    # Only the tables in `positions` are converted to DataFrames,
+    # the others are kept as None placeholders.
+    try:
+        tables = _select_html_tables(html, attrs)
+    except (ValueError, SyntaxError, etree.LxmlError):
+        dfs = read_html_tables(html, attrs=attrs, backends=backends)
+        return [df if idx in positions else None for idx, df in enumerate(dfs)]
+
+    if not tables:
+        raise ValueError('No tables found')
+
+    dfs: List[Optional[pd.DataFrame]] = []
+    for idx, table in enumerate(tables):
+        if idx not in positions:
+            dfs.append(None)
+            continue
+
+        table_html = lxml_html.tostring(table, encoding='unicode')
+        dfs.append(read_html_tables(table_html, attrs=None, backends=backends)[0])
+
+    return dfs
+
+
+def _count_table_columns(table: etree._Element) -> int:
+    # Widest row of the table, as pandas creates a column for each cell.
+    return max(
+        (
+            sum(int(cell.get('colspan', '1') or 1) for cell in row.xpath('./th|./td'))
+            for row in table.iter('tr')
+        ),
+        default=0
+    )
+
+
+def validate_html_tables(
+    html: str,
+    attrs: Optional[Dict[str, str]],
+    new_column_names: List[Tuple[str, ...]],
+    backends: Optional[Sequence[str]] = None
+) -> None:
+    # Checks the number of tables and of columns of each table without
+    # converting them to DataFrames, raising the same errors as
+    # `get_html_tables_frames`.
+    try:
+        tables = _select_html_tables(html, attrs)
+    except (ValueError, SyntaxError, etree.LxmlError):
+        # Documents that lxml can't parse are validated by parsing them.
+        get_html_tables_frames(html, attrs=attrs, new_column_names=new_column_names, backends=backends)
+        return
+
+    if not tables:
+        raise HTMLTablesNotFoundError('No HTML tables found')
+
+    if len(tables) != len(new_column_names):
+        raise ColumnNamesLengthError(
+            f'{len(new_column_names)} tuples of column names for {len(tables)} table'
+        )
+
+    for idx, table in enumerate(tables):
+        col_len = _count_table_columns(table)
+        new_col_len = len(new_column_names[idx])
+
+        if col_len != new_col_len:
+            raise ColumnNamesLengthError(
+                f'Table in position {idx} expected {col_len} column names but received {new_col_len}'
+            )
+
+
+def frame_to_records(df: pd.DataFrame) -> List[dict]:
+    # Missing values are represented by None in every column,
+    # as they were before the column types were converted.
+    missing = df.isna().any()
+    if missing.any():
+        df = df.astype({column: object for column in df.columns[missing]})
+        df = df.where(df.notna(), None)
+    return df.to_dict(orient='records')
+
+
+def frame_to_arrays(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    arrays = {}
+    for column in df.columns:
+        series = df[column]
+        if isinstance(series.dtype, pd.Int64Dtype):
+            # Nullable integers have no NumPy equivalent, so
+            # missing values are represented by NaN.
+            arrays[column] = series.to_numpy(dtype='float64', na_value=np.nan)
+        else:
+            arrays[column] = series.to_numpy(copy=True)
+    return arrays
+
+
+def get_html_tables_frames(
+    html: str,
+    attrs: Optional[Dict[str, str]],
+    new_column_names: List[Tuple[str, ...]],
+    backends: Optional[Sequence[str]] = None,
+    positions: Optional[Collection[int]] = None,
+    columns: Optional[Dict[int, Sequence[str]]] = None,
+    column_types: Optional[Dict[int, Dict[str, str]]] = None
+) -> List[Optional[pd.DataFrame]]:
+    frames: List[Optional[pd.DataFrame]] = []
+
+    try:
+        if positions is None:
+            dfs = read_html_tables(html, attrs=attrs, backends=backends)
+        else:
+            dfs = read_selected_html_tables(html, attrs=attrs, positions=positions, backends=backends)
+
+        dfs_len = len(dfs)
+        col_names_len = len(new_column_names)
+
+        if dfs_len != col_names_len:
+            raise ColumnNamesLengthError(
+                f'{col_names_len} tuples of column names for {dfs_len} table'
+            )
+
+        for idx, df in enumerate(dfs):
+
+            if df is None:
+                frames.append(None)
+                continue
+
+            col_len = len(df.columns)
+            new_col_len = len(new_column_names[idx])
+
+            if col_len != new_col_len:
+                raise ColumnNamesLengthError(
+                    f'Table in position {idx} expected {col_len} column names but received {new_col_len}'
+                )
+
+            df.columns = new_column_names[idx]
+
+            if columns and idx in columns:
+                df = df[list(columns[idx])].copy()
+
+            if column_types and idx in column_types:
+                df = convert_column_types(df, column_types[idx])
+
+            frames.append(df)
+
+    except ValueError as err:
+        if _is_no_tables_error(err):
+            raise HTMLTablesNotFoundError('No HTML tables found') from err
+
+        raise
+
+    return frames
+
+
+def get_html_tables_data(
+    html: str,
+    attrs: Optional[Dict[str, str]],
+    new_column_names: List[Tuple[str, ...]],
+    backends: Optional[Sequence[str]] = None,
+    positions: Optional[Collection[int]] = None,
+    columns: Optional[Dict[int, Sequence[str]]] = None,
+    column_types: Optional[Dict[int, Dict[str, str]]] = None
+) -> List[Optional[List[dict]]]:
+    frames = get_html_tables_frames(
+        html,
+        attrs=attrs,
+        new_column_names=new_column_names,
+        backends=backends,
+        positions=positions,
+        columns=columns,
+        column_types=column_types
+    )
+
+    return [
+        frame_to_records(df) if df is not None else None
+        for df in frames
+    ]
@@ -0,0 +1,194 @@
+import threading
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple, Type
+
+import requests
+
+from requests_html import DEFAULT_USER_AGENT
+
+from worldometer.scraper.pool import SessionPool
+
+
+class Response(NamedTuple):
+    url: str
+    status_code: int
+    content: bytes
+    encoding: Optional[str]
+    headers: Mapping[str, str]
+    http_version: str
+
+
+class TransportStats(NamedTuple):
+    requests: int
+    connections: int
+    http_versions: Dict[str, int]
+
+    @property
+    def reused_connections(self) -> int:
+        # Requests sent over a connection opened for a previous request.
+        return max(0, self.requests - self.connections)
+
+
+class Transport(ABC):
+    # Base class of the HTTP clients used by `Browser` to fetch pages.
+    # Transports must be safe to use from several threads at the same time.
+
+    # Errors after which the request can be retried.
+    transient_errors: Tuple[Type[BaseException], ...] = (ConnectionError, TimeoutError)
+
+    @abstractmethod
+    def get(
+        self,
+        url: str,
+        timeout: float = 30,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Response:
+        ...
+
+    @abstractmethod
+    def stats(self) -> TransportStats:
+        ...
+
+    def close(self) -> None:
+        pass
+
+
+class _HTTPVersionsCounter:
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._http_versions: Dict[str, int] = {}
+
+    def add(self, http_version: str) -> None:
+        with self._lock:
+            self._http_versions[http_version] = self._http_versions.get(http_version, 0) + 1
+
+    def get(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._http_versions)
+
+
+class RequestsTransport(Transport):
+    # HTTP/1.1 transport based on a pool of requests sessions. Responses
+    # compressed with gzip or deflate are decoded, and with brotli when
+    # the brotli package is installed.
+
+    # PoolTimeoutError is not retried: the pool is busy with other requests,
+    # which is not a failure of the host to count in its circuit breaker.
+    transient_errors = (requests.ConnectionError, requests.Timeout)
+
+    def __init__(
+        self,
+        size: int = 4,
+        keep_alive: bool = True,
+        timeout: Optional[float] = None
+    ) -> None:
+        self.sessions = SessionPool(size=size, keep_alive=keep_alive, timeout=timeout)
+        self._http_versions = _HTTPVersionsCounter()
+
+    def get(
+        self,
+        url: str,
+        timeout: float = 30,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Response:
+        with self.sessions.acquire() as session:
+            res = session.get(url, timeout=timeout, headers=headers)
+
+        http_version = {10: 'HTTP/1.0', 11: 'HTTP/1.1'}.get(res.raw.version, 'HTTP/1.1')
+        self._http_versions.add(http_version)
+
+        return Response(
+            url=res.url,
+            status_code=res.status_code,
+            content=res.content,
+            encoding=res.encoding,
+            headers=res.headers,
+            http_version=http_version
+        )
+
+    def stats(self) -> TransportStats:
+        sent, connections = self.sessions.connection_stats()
+        return TransportStats(sent, connections, self._http_versions.get())
+
+    def close(self) -> None:
+        self.sessions.close()
+
+
+class HTTPXTransport(Transport):
+    # HTTP/2 transport based on httpx, an optional dependency:
+    #
+    #     pip install "worldometer[http2]"
+    #
+    # A single client is shared by all threads, so the requests made at
+    # the same time (e.g. by `load_all`) are multiplexed over the same
+    # connection when the server supports HTTP/2.
+
+    def __init__(
+        self,
+        http2: bool = True,
+        max_connections: int = 10,
+        keep_alive: bool = True,
+        keepalive_expiry: float = 5.0
+    ) -> None:
+        try:
+            import httpx
+        except ImportError as err:
+            raise ImportError(
+                'HTTPXTransport requires httpx, install it with `pip install "worldometer[http2]"`'
+            ) from err
+
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections if keep_alive else 0,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.transient_errors = (httpx.TransportError,)
+        self._client = httpx.Client(
+            http2=http2,
+            limits=limits,
+            headers={'User-Agent': DEFAULT_USER_AGENT},
+            follow_redirects=True
+        )
+
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._connections = 0
+        self._http_versions = _HTTPVersionsCounter()
+
+    def _trace(self, event_name: str, info: Any) -> None:
+        # httpcore reports an event for each step of a request,
+        # new connections are counted when they are established.
+        if event_name == 'connection.connect_tcp.complete':
+            with self._lock:
+                self._connections += 1
+
+    def get(
+        self,
+        url: str,
+        timeout: float = 30,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Response:
+        res = self._client.get(url, timeout=timeout, headers=headers, extensions={'trace': self._trace})
+
+        with self._lock:
+            self._requests += 1
+        self._http_versions.add(res.http_version)
+
+        return Response(
+            url=str(res.url),
+            status_code=res.status_code,
+            content=res.content,
+            encoding=res.charset_encoding,
+            headers=res.headers,
+            http_version=res.http_version
+        )
+
+    def stats(self) -> TransportStats:
+        with self._lock:
+            requests, connections = self._requests, self._connections
+        return TransportStats(requests, connections, self._http_versions.get())
+
+    def close(self) -> None:
+        self._client.close()
@@ -12,10 +12,44 @@ __all__ = [
     'geography',
     'population',
     'CountryCodes',
-    'WorldCounters'
+    'WorldCounters',
+    'CounterSnapshot',
+    'CounterHistory',
+    'CounterArchive',
+    'SharedCountersPublisher',
+    'SharedWorldCounters',
+    'WorldDataSnapshot',
+    'load_all'
 ]
 
-from worldometer.world import geography
-from worldometer.world import population
-from worldometer.world.country_codes import CountryCodes
-from worldometer.world.counters import WorldCounters
+from typing import TYPE_CHECKING
+
+from worldometer._lazy import attach
+
+# The public names are only imported when first accessed, so importing
+# the package does not load the scraper and its dependencies.
+_LAZY_IMPORTS = {
+    'geography': 'worldometer.world.geography',
+    'population': 'worldometer.world.population',
+    'CountryCodes': 'worldometer.world.country_codes',
+    'WorldCounters': 'worldometer.world.counters',
+    'CounterSnapshot': 'worldometer.world.counters',
+    'CounterHistory': 'worldometer.world.history',
+    'CounterArchive': 'worldometer.world.archive',
+    'SharedCountersPublisher': 'worldometer.world.shared',
+    'SharedWorldCounters': 'worldometer.world.shared',
+    'WorldDataSnapshot': 'worldometer.world.snapshot',
+    'load_all': 'worldometer.world.snapshot'
+}
+
+__getattr__, __dir__ = attach(__name__, _LAZY_IMPORTS, __all__)
+
+if TYPE_CHECKING:
+    from worldometer.world import geography
+    from worldometer.world import population
+    from worldometer.world.country_codes import CountryCodes
+    from worldometer.world.counters import CounterSnapshot, WorldCounters
+    from worldometer.world.archive import CounterArchive
+    from worldometer.world.history import CounterHistory
+    from worldometer.world.shared import SharedCountersPublisher, SharedWorldCounters
+    from worldometer.world.snapshot import WorldDataSnapshot, load_all
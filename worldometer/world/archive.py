@@ -0,0 +1,369 @@
+import json
+import mmap
+import os
+import struct
+
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from worldometer.world.counters import COUNTER_NAMES, CounterSnapshot, WorldCounters
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# File layout
+# -----------
+# The file starts with a header (magic, length of the JSON list of counter
+# names, the JSON list) followed by chunks. Each chunk has a header (magic,
+# number of samples, first and last times, payload size) and a payload
+# with a table of (encoding, size) for each column followed by the encoded
+# columns. The first column is the sample times, in microseconds.
+#
+# Integer columns (the times and most counters) are stored as the
+# zigzag-encoded varint of the difference between consecutive values.
+# Other columns are stored as raw float64 values.
+
+_FILE_MAGIC = b'WMARCHV1'
+_FILE_HEADER = struct.Struct('<8sI')
+_CHUNK_MAGIC = b'WMCH'
+_CHUNK_HEADER = struct.Struct('<4sIddI')
+_COLUMN_ENTRY = struct.Struct('<BI')
+
+_EMPTY = 0
+_DELTA_VARINT = 1
+_FLOAT64 = 2
+
+# Largest integer that float64 represents exactly.
+_MAX_EXACT_INT = 2 ** 53
+
+
+def _encode_varints(values: np.ndarray) -> bytes:
+    # Vectorized LEB128 encoding of unsigned integers.
+    lengths = np.ones(len(values), dtype=np.int64)
+    remaining = values >> np.uint64(7)
+    while remaining.any():
+        lengths += remaining > 0
+        remaining >>= np.uint64(7)
+
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+    output = np.empty(int(ends[-1]) if len(ends) else 0, dtype=np.uint8)
+
+    for k in range(int(lengths.max()) if len(lengths) else 0):
+        mask = lengths > k
+        groups = (values[mask] >> np.uint64(7 * k)) & np.uint64(0x7F)
+        continuation = np.where(lengths[mask] > k + 1, 0x80, 0).astype(np.uint64)
+        output[starts[mask] + k] = (groups | continuation).astype(np.uint8)
+
+    return output.tobytes()
+
+
+def _decode_varints(data: np.ndarray, count: int) -> np.ndarray:
+    ends = np.flatnonzero((data & 0x80) == 0)[:count]
+    if len(ends) != count:
+        raise ValueError('Truncated varint column')
+
+    starts = np.empty(count, dtype=np.int64)
+    starts[0:1] = 0
+    starts[1:] = ends[:-1] + 1
+    lengths = ends - starts + 1
+
+    values = np.zeros(count, dtype=np.uint64)
+    for k in range(int(lengths.max()) if count else 0):
+        mask = lengths > k
+        groups = (data[starts[mask] + k] & 0x7F).astype(np.uint64)
+        values[mask] |= groups << np.uint64(7 * k)
+
+    return values
+
+
+def _encode_column(values: np.ndarray) -> Tuple[int, bytes]:
+    finite = np.isfinite(values)
+
+    if not finite.any():
+        return _EMPTY, b''
+
+    if finite.all() and (np.abs(values) < _MAX_EXACT_INT).all() and (values == np.floor(values)).all():
+        integers = values.astype(np.int64)
+        deltas = np.diff(integers, prepend=np.int64(0))
+        zigzag = ((deltas << 1) ^ (deltas >> 63)).astype(np.uint64)
+        return _DELTA_VARINT, _encode_varints(zigzag)
+
+    return _FLOAT64, values.astype('<f8').tobytes()
+
+
+def _decode_column(encoding: int, data: np.ndarray, count: int) -> np.ndarray:
+    if encoding == _EMPTY:
+        return np.full(count, np.nan)
+
+    if encoding == _DELTA_VARINT:
+        zigzag = _decode_varints(data, count)
+        deltas = (zigzag >> np.uint64(1)).astype(np.int64) ^ -(zigzag & np.uint64(1)).astype(np.int64)
+        return np.cumsum(deltas).astype(np.float64)
+
+    if encoding == _FLOAT64:
+        return np.frombuffer(data, dtype='<f8', count=count).astype(np.float64)
+
+    raise ValueError(f'Unknown column encoding {encoding}')
+
+
+class _Chunk(NamedTuple):
+    offset: int
+    count: int
+    start: float
+    end: float
+
+
+class CounterArchive:
+    """Append-only on-disk archive of counter samples.
+
+    Samples are grouped in chunks of `chunk_size` samples, stored by
+    column, with each integer column encoded as the varint of the
+    difference between consecutive values. The first and last times of
+    each chunk are kept in an index, so time-range queries only decode
+    the chunks (and columns) they need, read from a memory map of the file.
+
+    Parameters
+    ----------
+    path : str
+        The archive file. It is created if it does not exist.
+    chunk_size : int, optional
+        The number of samples of each chunk. Samples are kept in memory
+        until a chunk is complete or `flush` is called.
+
+    Notes
+    -----
+    Only a single process should append to an archive at a time.
+    Times are stored with a precision of microseconds.
+
+    Examples
+    --------
+    >>> from worldometer.world import CounterArchive, WorldCounters
+    >>> wc = WorldCounters()
+    >>> with CounterArchive('counters.wma') as archive:
+    ...     for snapshot in wc.stream(interval=60.0):
+    ...         archive.append(snapshot)
+
+    >>> archive = CounterArchive('counters.wma')
+    >>> df = archive.to_frame(start=time.time() - 24 * 60 * 60, names=['current_population'])
+    """
+
+    def __init__(self, path: str, chunk_size: int = 1024) -> None:
+        if chunk_size < 1:
+            raise ValueError('The chunk size must be at least 1')
+
+        self.path = path
+        self.chunk_size = chunk_size
+
+        self._file = open(path, 'a+b')
+        self._map: Optional[mmap.mmap] = None
+        self._chunks: List[_Chunk] = []
+
+        self._pending_times: List[float] = []
+        self._pending_values: List[np.ndarray] = []
+
+        if os.fstat(self._file.fileno()).st_size == 0:
+            self.names = tuple(COUNTER_NAMES)
+            self._write_file_header()
+        else:
+            self._load_index()
+
+        self._column_index = {name: index for index, name in enumerate(self.names)}
+
+    def _write_file_header(self) -> None:
+        names = json.dumps(self.names).encode('utf-8')
+        self._file.write(_FILE_HEADER.pack(_FILE_MAGIC, len(names)) + names)
+        self._file.flush()
+        self._data_offset = self._file.tell()
+
+    def _load_index(self) -> None:
+        size = os.fstat(self._file.fileno()).st_size
+        buffer = self._get_map()
+
+        magic, names_size = _FILE_HEADER.unpack_from(buffer, 0)
+        if magic != _FILE_MAGIC:
+            raise ValueError(f'{self.path} is not a counter archive')
+
+        self._data_offset = _FILE_HEADER.size + names_size
+        self.names = tuple(json.loads(buffer[_FILE_HEADER.size:self._data_offset]))
+
+        offset = self._data_offset
+        while offset + _CHUNK_HEADER.size <= size:
+            magic, count, start, end, payload_size = _CHUNK_HEADER.unpack_from(buffer, offset)
+            if magic != _CHUNK_MAGIC or offset + _CHUNK_HEADER.size + payload_size > size:
+                break
+            self._chunks.append(_Chunk(offset, count, start, end))
+            offset += _CHUNK_HEADER.size + payload_size
+
+        if offset != size:
+            # A chunk was partially written (e.g. the process was killed),
+            # it is discarded so that new chunks are appended after the last
+            # complete one.
+            self._close_map()
+            self._file.truncate(offset)
+
+    def _get_map(self) -> mmap.mmap:
+        size = os.fstat(self._file.fileno()).st_size
+        if self._map is None or len(self._map) != size:
+            self._close_map()
+            self._map = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ)
+        return self._map
+
+    def _close_map(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def __len__(self) -> int:
+        return sum(chunk.count for chunk in self._chunks) + len(self._pending_times)
+
+    def append(self, sample: Union[CounterSnapshot, WorldCounters]) -> None:
+        """Add a sample of the counters. Samples are expected in chronological order."""
+        if self.names != tuple(COUNTER_NAMES):
+            raise ValueError('The archive was created with a different set of counters')
+
+        snapshot = sample if isinstance(sample, CounterSnapshot) else sample.snapshot
+
+        self._pending_times.append(snapshot.timestamp)
+        self._pending_values.append(snapshot._values.copy())
+
+        if len(self._pending_times) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the samples kept in memory as a new chunk."""
+        if not self._pending_times:
+            return
+
+        times = np.array(self._pending_times, dtype=np.float64)
+        values = np.vstack(self._pending_values)
+
+        columns = [_encode_column(np.round(times * 1e6))]
+        columns.extend(_encode_column(values[:, index]) for index in range(values.shape[1]))
+
+        table = b''.join(_COLUMN_ENTRY.pack(encoding, len(data)) for encoding, data in columns)
+        payload = table + b''.join(data for _, data in columns)
+
+        self._file.seek(0, os.SEEK_END)
+        offset = self._file.tell()
+        self._file.write(
+            _CHUNK_HEADER.pack(_CHUNK_MAGIC, len(times), times[0], times[-1], len(payload))
+            + payload
+        )
+        self._file.flush()
+
+        self._chunks.append(_Chunk(offset, len(times), float(times[0]), float(times[-1])))
+        self._pending_times.clear()
+        self._pending_values.clear()
+
+    def _read_chunk(self, chunk: _Chunk, columns: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+        buffer = self._get_map()
+        table_offset = chunk.offset + _CHUNK_HEADER.size
+        entries = [
+            _COLUMN_ENTRY.unpack_from(buffer, table_offset + i * _COLUMN_ENTRY.size)
+            for i in range(len(self.names) + 1)
+        ]
+
+        data_offsets = np.cumsum([0] + [size for _, size in entries])
+        data_offsets += table_offset + len(entries) * _COLUMN_ENTRY.size
+
+        def decode(i: int) -> np.ndarray:
+            encoding, size = entries[i]
+            data = np.frombuffer(buffer, dtype=np.uint8, count=size, offset=int(data_offsets[i]))
+            return _decode_column(encoding, data, chunk.count)
+
+        times = decode(0) / 1e6
+        values = np.empty((chunk.count, len(columns)), dtype=np.float64)
+        for position, index in enumerate(columns):
+            values[:, position] = decode(index + 1)
+
+        return times, values
+
+    def query(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        names: Optional[Sequence[str]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the samples taken between two moments.
+
+        Parameters
+        ----------
+        start : float, optional
+            The Unix time of the first sample (inclusive).
+        end : float, optional
+            The Unix time of the last sample (exclusive).
+        names : sequence of str, optional
+            The attribute names of the counters to read
+            (e.g. ``'current_population'``). All by default.
+
+        Returns
+        -------
+        tuple
+            The times of the samples and a matrix with a row for
+            each sample and a column for each counter in `names`.
+        """
+        names = self.names if names is None else tuple(names)
+        columns = [self._column_index[name] for name in names]
+
+        low = -np.inf if start is None else start
+        high = np.inf if end is None else end
+
+        parts = [
+            self._read_chunk(chunk, columns)
+            for chunk in self._chunks
+            if chunk.end >= low and chunk.start < high
+        ]
+
+        if self._pending_times:
+            parts.append((
+                np.array(self._pending_times, dtype=np.float64),
+                np.vstack(self._pending_values)[:, columns]
+            ))
+
+        if not parts:
+            return np.empty(0), np.empty((0, len(columns)))
+
+        times = np.concatenate([part[0] for part in parts])
+        values = np.concatenate([part[1] for part in parts])
+
+        mask = (times >= low) & (times < high)
+        return times[mask], values[mask]
+
+    def to_frame(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        names: Optional[Sequence[str]] = None
+    ) -> 'pd.DataFrame':
+        """Get the samples taken between two moments as a DataFrame.
+
+        The parameters are the same as in `query`. The DataFrame has a
+        column for each counter, indexed by the time (UTC) of the samples.
+        """
+        import pandas as pd
+
+        names = self.names if names is None else tuple(names)
+        times, values = self.query(start, end, names)
+
+        index = pd.to_datetime(times, unit='s', utc=True)
+        index.name = 'time'
+
+        return pd.DataFrame(values, index=index, columns=list(names))
+
+    def close(self) -> None:
+        """Write the samples kept in memory and close the file."""
+        if self._file.closed:
+            return
+        self.flush()
+        self._close_map()
+        self._file.close()
+
+    def __enter__(self) -> 'CounterArchive':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
@@ -0,0 +1,216 @@
+import sys
+import threading
+
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any, Collection, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+from worldometer.scraper import Page, aget_page, get_page
+
+# pandas is only imported when the first table is parsed.
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+_DataTablesType = TypeVar('_DataTablesType', bound='_DataTables')
+
+
+# Data rows are immutable, so the same objects can be returned by every
+# accessor call instead of copies. Dataclasses support slots since Python 3.10.
+if sys.version_info >= (3, 10):
+    _row_dataclass = dataclass(frozen=True, slots=True)
+else:
+    _row_dataclass = dataclass(frozen=True)
+
+
+class _DataTables:
+    """Base class of the classes that represent the data tables of a page.
+
+    Subclasses define the `source_path` and `new_column_names` of the
+    page tables, and in `_row_types` the class that represents the data
+    rows of each table (in the same order as the tables in the page).
+
+    The columns are converted to the types annotated in the data row
+    classes, and those listed in their `_percent_columns` are converted
+    from percentage strings (e.g. "17.8 %") to floats (17.8).
+
+    The page is loaded and its tables are checked against the column
+    names when the instance is created, but each table is only parsed
+    the first time its data is requested. The tables are kept as
+    DataFrames, and the data row objects are only created when they are
+    requested through the accessors of the subclasses. Instances can be
+    shared between threads.
+    """
+
+    source_path = '[override]'
+    new_column_names: Tuple[Any, ...] = ()
+
+    _row_types: Tuple[type, ...] = ()
+    _attrs: Optional[Dict[str, str]] = {'class': 'table'}
+
+    # Seconds a cached page can be used without revalidation,
+    # when an HTTP cache is set with `worldometer.scraper.set_http_cache`.
+    _cache_max_age: float = 60 * 60
+
+    def __init__(self) -> None:
+        self._init_page(self._load_page())
+
+    @classmethod
+    async def aload(cls: Type[_DataTablesType]) -> _DataTablesType:
+        """Create an instance loading the data asynchronously.
+
+        Use it instead of the class constructor inside an event loop,
+        so that several pages can be loaded concurrently.
+
+        Notes
+        -----
+        The page is fetched with ``requests_html.AsyncHTMLSession``, which
+        sends each request with requests in the default ``ThreadPoolExecutor``
+        of the loop. The fetches do not block the loop, but the number of
+        pages fetched at the same time is bounded by the workers of that
+        executor.
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> from worldometer.world import CountryCodes
+        >>> from worldometer.world.population import LargestCities
+        >>> async def main():
+        ...     return await asyncio.gather(CountryCodes.aload(), LargestCities.aload())
+        >>> cc, lc = asyncio.run(main())
+        """
+        obj = cls.__new__(cls)
+        obj._init_page(await obj._aload_page())
+        return obj
+
+    def _get_new_column_names(self) -> List[Tuple[str, ...]]:
+        # Classes with a single table define a single tuple of column names.
+        if self.new_column_names and isinstance(self.new_column_names[0], str):
+            return [self.new_column_names]
+        return [*self.new_column_names]
+
+    def _get_column_types(self) -> Dict[int, Dict[str, str]]:
+        column_types = {}
+
+        for position, row_type in enumerate(self._row_types):
+            percent_columns = getattr(row_type, '_percent_columns', ())
+            column_types[position] = {
+                f.name: 'percent' if f.name in percent_columns else f.type.__name__
+                for f in fields(row_type)
+                if f.name in percent_columns or f.type in (int, float)
+            }
+
+        return column_types
+
+    def _load_page(self) -> Page:
+        return get_page(self.source_path, max_age=self._cache_max_age)
+
+    async def _aload_page(self) -> Page:
+        return await aget_page(self.source_path, max_age=self._cache_max_age)
+
+    def _init_page(self, page: Page) -> None:
+        # Errors in the page (e.g. a missing table) are raised when the
+        # instance is created, not on the first access to its data.
+        page.validate_data_tables(self._get_new_column_names(), attrs=self._attrs)
+        self._set_page(page)
+
+    def _set_page(self, page: Optional[Page]) -> None:
+        self._page: Optional[Page] = page
+        self._frames: Dict[int, 'pd.DataFrame'] = {}
+        self._tables: Dict[int, Tuple[Any, ...]] = {}
+        # Guards the parsing of the tables and the release of the page.
+        self._lock = threading.RLock()
+
+    def _parse_tables(self, positions: Collection[int]) -> None:
+        frames = self._page.get_data_frames(  # type: ignore
+            new_column_names=self._get_new_column_names(),
+            attrs=self._attrs,
+            positions=positions,
+            column_types=self._get_column_types()
+        )
+
+        for position in positions:
+            self._frames[position] = frames[position]  # type: ignore
+
+        # Once every table is parsed, the page is no longer needed.
+        if len(self._frames) == len(self._row_types):
+            self._page = None
+
+    def _get_frame(self, table: Union[int, type]) -> 'pd.DataFrame':
+        position = table if isinstance(table, int) else table._table_position  # type: ignore
+        if not 0 <= position < len(self._row_types):
+            raise IndexError(f'There is no table in position {position}')
+        with self._lock:
+            if position not in self._frames:
+                self._parse_tables([position])
+            return self._frames[position]
+
+    def _get_rows(self, row_type: type) -> Tuple[Any, ...]:
+        from worldometer.scraper.tables import frame_to_records
+
+        position = row_type._table_position  # type: ignore
+        with self._lock:
+            if position not in self._tables:
+                self._tables[position] = tuple(
+                    row_type(**data_row)
+                    for data_row in frame_to_records(self._get_frame(position))
+                )
+            return self._tables[position]
+
+    def to_frame(self, table: Union[int, type] = 0) -> 'pd.DataFrame':
+        """Get the data of a table as a pandas DataFrame.
+
+        No data row objects are created, so it is the most efficient
+        way to get the data for analysis.
+
+        Parameters
+        ----------
+        table : int or type, optional
+            The position of the table in the page, or the class that
+            represents its data rows. The first table by default.
+
+        Returns
+        -------
+        pd.DataFrame
+            A copy of the table data, with one column for each field
+            of the data row class.
+
+        Examples
+        --------
+        >>> from worldometer.world.population import WorldPopulationByRegion
+        >>> from worldometer.world.population.by_region import PastWorldPopulationByRegionData
+        >>> wpr = WorldPopulationByRegion()
+        >>> df = wpr.to_frame(PastWorldPopulationByRegionData)
+        >>> df.columns.tolist()
+        ['idx', 'region', 'population', 'world_share']
+        """
+        return self._get_frame(table).copy()
+
+    def to_numpy(self, table: Union[int, type] = 0) -> Dict[str, 'np.ndarray']:
+        """Get the data of a table as a dict of NumPy arrays.
+
+        Integer columns with missing values are converted to float
+        arrays, with NaN in place of the missing values.
+
+        Parameters
+        ----------
+        table : int or type, optional
+            The position of the table in the page, or the class that
+            represents its data rows. The first table by default.
+
+        Returns
+        -------
+        dict
+            A dict with the column names as keys and a copy
+            of the column data as values.
+
+        Examples
+        --------
+        >>> from worldometer.world.population import CountriesByPopulation
+        >>> cp = CountriesByPopulation()
+        >>> arrays = cp.to_numpy()
+        >>> arrays['population'].sum()
+        """
+        from worldometer.scraper.tables import frame_to_arrays
+
+        return frame_to_arrays(self._get_frame(table))
@@ -1,11 +1,150 @@
-from dataclasses import InitVar, dataclass, field
-from typing import Dict, Union
+import asyncio
+import contextlib
+import threading
+import time
+import weakref
 
-from worldometer.scraper import get_rts_counters_object
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+from worldometer.scraper import aget_rts_counters_metadata, get_rts_counters_metadata
 
 
 CounterValueType = Union[int, float, None]
 CounterValuesType = Dict[str, CounterValueType]
+CounterMetadataType = Dict[str, Dict[str, CounterValueType]]
+
+
+# Position of each counter (by its key in the page) in the snapshot buffers.
+# It is filled in when the section classes are defined, in their order.
+COUNTER_INDEX: Dict[str, int] = {}
+
+# Position of each counter by its attribute name in the sections.
+COUNTER_NAMES: Dict[str, int] = {}
+
+
+class CounterSnapshot:
+    """Contains the values of all counters in a single float64 buffer.
+
+    The buffer layout is ``[timestamp, values..., is_int...]``, with the
+    counters in the order of `COUNTER_INDEX`. Missing values are NaN, and
+    `is_int` holds 1.0 for the counters whose values are integers.
+
+    Since it is a single contiguous buffer, a snapshot can be sent to
+    other processes as bytes (`to_bytes`) and read back without copies
+    (`from_buffer`).
+
+    Attributes
+    ----------
+    buffer : np.ndarray
+        The float64 buffer with the snapshot data.
+    """
+    __slots__ = ('buffer', '_values', '_is_int')
+
+    def __init__(self, buffer: Optional[np.ndarray] = None) -> None:
+        size = len(COUNTER_INDEX)
+
+        if buffer is None:
+            buffer = np.full(2 * size + 1, np.nan, dtype=np.float64)
+            buffer[size + 1:] = 0.0
+
+        if buffer.dtype != np.float64 or buffer.shape != (2 * size + 1,):
+            raise ValueError(f'The snapshot buffer must be a float64 array of length {2 * size + 1}')
+
+        self.buffer = buffer
+        self._values = buffer[1:size + 1]
+        self._is_int = buffer[size + 1:]
+
+    @classmethod
+    def from_buffer(cls, data: Any) -> 'CounterSnapshot':
+        """Create a snapshot that reads from the given bytes-like object, without copying it."""
+        return cls(np.frombuffer(data, dtype=np.float64))
+
+    @property
+    def timestamp(self) -> float:
+        """The Unix time of the counter values."""
+        return float(self.buffer[0])
+
+    def _get_value(self, index: int) -> CounterValueType:
+        value = self._values[index]
+        if value != value:
+            return None
+        return int(value) if self._is_int[index] else float(value)
+
+    def value_of(self, key: str) -> CounterValueType:
+        """Get the value of a counter by its key in the page (e.g. ``'births_today'``)."""
+        return self._get_value(COUNTER_INDEX[key])
+
+    def to_dict(self) -> CounterValuesType:
+        return {key: self._get_value(index) for key, index in COUNTER_INDEX.items()}
+
+    def to_bytes(self) -> bytes:
+        return self.buffer.tobytes()
+
+    def copy(self) -> 'CounterSnapshot':
+        return CounterSnapshot(self.buffer.copy())
+
+
+class _Counter:
+
+    # Reads a counter value from the snapshot of a section.
+
+    __slots__ = ('index',)
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+    def __get__(self, obj: Any, objtype: Any = None) -> Any:
+        if obj is None:
+            return self
+        return obj._snapshot._get_value(self.index)
+
+
+class _CounterSection:
+    """Base class of the counter sections.
+
+    A section is a view over a `CounterSnapshot`: its attributes are read
+    from the snapshot buffer, mapped by `_counters` (attribute name to
+    counter key in the page), so a section always shows the current
+    values of its snapshot.
+
+    The sections are dataclasses with a field for each counter, so
+    ``dataclasses.fields`` and ``dataclasses.asdict`` can be used on them.
+    """
+    __slots__ = ('_snapshot',)
+
+    _counters: Dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for name, key in cls._counters.items():
+            index = COUNTER_INDEX.setdefault(key, len(COUNTER_INDEX))
+            COUNTER_NAMES[name] = index
+            setattr(cls, name, _Counter(index))
+
+        # The fields keep the counters as class attributes, which read
+        # their values from the snapshot.
+        cls.__annotations__ = dict.fromkeys(cls._counters, CounterValueType)
+        dataclass(init=False, repr=False, eq=False)(cls)
+
+    def __init__(self, snapshot: CounterSnapshot) -> None:
+        self._snapshot = snapshot
+
+    def to_dict(self) -> CounterValuesType:
+        """Get the section counters as a dict, in the order of the attributes."""
+        return {name: getattr(self, name) for name in self._counters}
+
+    def __repr__(self) -> str:
+        values = ', '.join(f'{name}={value!r}' for name, value in self.to_dict().items())
+        return f'{type(self).__name__}({values})'
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
 
 
 class WorldCounters:
@@ -44,35 +183,356 @@ class WorldCounters:
     -----
     For precise and up-to-date information on each section and its counters,
     please check the `worldometers homepage <https://www.worldometers.info/>`_.
+
+    The rate metadata of each counter is kept along with its last value,
+    so ``reload_data(local=True)`` can estimate the current values from the
+    time elapsed since the last sample, without accessing the website.
+
+    All counter values are stored in a single `CounterSnapshot`, and the
+    sections are views over it. Reloading the data updates the snapshot in
+    place, so the sections always show the latest values. Use
+    ``snapshot.copy()`` to keep the values of a given moment.
     """
     source_path = '/'
 
     def __init__(self) -> None:
-        self._data = self._load_data()
+        self._snapshot = CounterSnapshot()
+        self._load_data()
         self._init_counters()
-
-    def _load_data(self) -> CounterValuesType:
-        rts_counters = get_rts_counters_object(path_url=self.source_path)
-        return rts_counters
+        self._init_refresh_locks()
+
+    @classmethod
+    async def aload(cls) -> 'WorldCounters':
+        """Create an instance loading the counters asynchronously.
+
+        Use it instead of the class constructor inside an event loop,
+        so that other pages can be loaded concurrently.
+
+        Notes
+        -----
+        The page is fetched with ``requests_html.AsyncHTMLSession``, which
+        sends each request with requests in the default ``ThreadPoolExecutor``
+        of the loop. The fetches do not block the loop, but the number of
+        pages fetched at the same time is bounded by the workers of that
+        executor.
+        """
+        obj = cls.__new__(cls)
+        obj._snapshot = CounterSnapshot()
+        await obj._aload_data()
+        obj._init_counters()
+        obj._init_refresh_locks()
+        return obj
+
+    @property
+    def snapshot(self) -> CounterSnapshot:
+        """The snapshot with the values of all counters."""
+        return self._snapshot
+
+    def _load_data(self) -> None:
+        metadata = get_rts_counters_metadata(path_url=self.source_path)
+        self._set_metadata(metadata)
+
+    async def _aload_data(self) -> None:
+        metadata = await aget_rts_counters_metadata(path_url=self.source_path)
+        self._set_metadata(metadata)
+
+    def _set_metadata(self, metadata: CounterMetadataType) -> None:
+        self._loaded_at = time.time()
+        self._last_values, self._rates, self._is_int = _vectorize_metadata(metadata)
+
+        snapshot = self._snapshot
+        snapshot.buffer[0] = self._loaded_at
+        np.copyto(snapshot._values, self._last_values)
+        np.copyto(snapshot._is_int, self._is_int)
+
+    def _extrapolate_data(self) -> None:
+        # Computed in place, in the snapshot buffer.
+        snapshot = self._snapshot
+        now = time.time()
+
+        np.multiply(self._rates, now - self._loaded_at, out=snapshot._values)
+        snapshot._values += self._last_values
+
+        # The "today" and "this year" counters restart from zero when a new
+        # day or year starts after the sample was loaded.
+        for counters, period_start in zip((_DAILY_COUNTERS, _YEARLY_COUNTERS), _get_period_starts(now)):
+            if self._loaded_at < period_start:
+                np.copyto(
+                    snapshot._values,
+                    self._rates * (now - period_start),
+                    where=counters & ~np.isnan(snapshot._values)
+                )
+
+        np.rint(snapshot._values, out=snapshot._values, where=self._is_int)
+        snapshot.buffer[0] = now
 
     def _init_counters(self) -> None:
-        self.world_population = WorldPopulation(self._data)
-        self.government_and_economics = GovernmentAndEconomics(self._data)
-        self.society_and_media = SocietyAndMedia(self._data)
-        self.environment = Environment(self._data)
-        self.food = Food(self._data)
-        self.water = Water(self._data)
-        self.energy = Energy(self._data)
-        self.health = Health(self._data)
-
-    def reload_data(self) -> None:
-        """Reload all counters data. This loads the available updated data."""
-        self._data = self._load_data()
-        self._init_counters()
+        self.world_population = WorldPopulation(self._snapshot)
+        self.government_and_economics = GovernmentAndEconomics(self._snapshot)
+        self.society_and_media = SocietyAndMedia(self._snapshot)
+        self.environment = Environment(self._snapshot)
+        self.food = Food(self._snapshot)
+        self.water = Water(self._snapshot)
+        self.energy = Energy(self._snapshot)
+        self.health = Health(self._snapshot)
+
+    def reload_data(self, local: bool = False) -> None:
+        """Reload all counters data. This loads the available updated data.
+
+        Parameters
+        ----------
+        local : bool, optional
+            If True, the counters are extrapolated from the last loaded
+            sample and the elapsed wall-clock time, without accessing the
+            website. Counters without rate metadata keep their last value.
+            The counters of the current day and year restart from zero
+            at midnight UTC and on January 1st, respectively.
+        """
+        if local:
+            self._extrapolate_data()
+        else:
+            self._load_data()
+
+    def _init_refresh_locks(self) -> None:
+        self._refresh_lock = threading.Lock()
+        self._async_refresh_locks: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]' = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @contextlib.asynccontextmanager
+    async def _ahold_refresh_lock(self) -> AsyncIterator[None]:
+        # The refresh lock may be held by a sync stream reloading the
+        # counters from the website, so it is not waited for in the
+        # event loop thread but in the default executor.
+        lock = self._refresh_lock
+        if not lock.acquire(blocking=False):
+            acquired = asyncio.get_running_loop().run_in_executor(None, lock.acquire)
+            try:
+                await asyncio.shield(acquired)
+            except asyncio.CancelledError:
+                # The lock is still acquired by the executor, and released then.
+                acquired.add_done_callback(lambda _: lock.release())
+                raise
+        try:
+            yield
+        finally:
+            lock.release()
+
+    def _get_async_refresh_lock(self) -> asyncio.Lock:
+        # An asyncio lock is bound to the loop where it is first used.
+        loop = asyncio.get_running_loop()
+        lock = self._async_refresh_locks.get(loop)
+        if lock is None:
+            lock = self._async_refresh_locks[loop] = asyncio.Lock()
+        return lock
+
+    def _needs_refresh(self, max_age: float) -> bool:
+        return time.time() - self._snapshot.timestamp >= max_age
+
+    def _needs_reload(self, reload_interval: Optional[float]) -> bool:
+        return reload_interval is not None and time.time() - self._loaded_at >= reload_interval
+
+    def _refresh(self, max_age: float, reload_interval: Optional[float]) -> None:
+        # Streams sharing this instance coalesce their refreshes: when the
+        # snapshot was refreshed by another stream within `max_age`, it is
+        # used as is.
+        with self._refresh_lock:
+            if not self._needs_refresh(max_age):
+                return
+            self.reload_data(local=not self._needs_reload(reload_interval))
+
+    async def _arefresh(self, max_age: float, reload_interval: Optional[float]) -> None:
+        async with self._get_async_refresh_lock():
+            if not self._needs_refresh(max_age):
+                return
+            if self._needs_reload(reload_interval):
+                metadata = await aget_rts_counters_metadata(path_url=self.source_path)
+                async with self._ahold_refresh_lock():
+                    self._set_metadata(metadata)
+            else:
+                async with self._ahold_refresh_lock():
+                    self._extrapolate_data()
+
+    def stream(
+        self,
+        interval: float = 1.0,
+        deltas: bool = False,
+        reload_interval: Optional[float] = 60.0
+    ) -> 'CounterStream':
+        """Get a stream of the counter values, refreshed every `interval` seconds.
+
+        The stream can be used both in a ``for`` loop and in an
+        ``async for`` loop. Several streams of the same instance share
+        their refreshes, so subscribers do not multiply the work.
+
+        Parameters
+        ----------
+        interval : float, optional
+            Seconds between each item of the stream.
+        deltas : bool, optional
+            If True, the stream yields a dict with the difference of each
+            counter (by its attribute name) that changed since the previous
+            item. Otherwise, it yields a copy of the `CounterSnapshot`.
+        reload_interval : float, optional
+            Seconds between each reload of the counters from the website.
+            Between reloads, the counters are extrapolated locally. If None,
+            the counters are never reloaded from the website.
+
+        Returns
+        -------
+        CounterStream
+            An iterable and async iterable of snapshots or deltas.
+
+        Examples
+        --------
+        >>> from worldometer.world import WorldCounters
+        >>> wc = WorldCounters()
+        >>> for snapshot in wc.stream(interval=1.0):
+        ...     print(snapshot.value_of('current_population'))
+        8065299074
+        8065299077
+
+        >>> async def main():
+        ...     async for deltas in wc.stream(interval=1.0, deltas=True):
+        ...         print(deltas['current_population'])
+        >>> asyncio.run(main())
+        3
+        2
+        """
+        return CounterStream(self, interval=interval, deltas=deltas, reload_interval=reload_interval)
+
+
+class CounterStream:
+    """Iterable (sync and async) of the counters of a `WorldCounters` instance.
+
+    Created by `WorldCounters.stream`.
+    """
+
+    def __init__(
+        self,
+        counters: WorldCounters,
+        interval: float,
+        deltas: bool,
+        reload_interval: Optional[float]
+    ) -> None:
+        if interval <= 0:
+            raise ValueError('The stream interval must be greater than 0')
+
+        self.counters = counters
+        self.interval = interval
+        self.deltas = deltas
+        self.reload_interval = reload_interval
+
+        # A refresh made by another stream up to half an interval
+        # ago is recent enough to be shared.
+        self._max_age = interval / 2
+
+    def _make_item(
+        self,
+        snapshot: CounterSnapshot,
+        previous: Optional[CounterSnapshot]
+    ) -> Tuple[Any, CounterSnapshot]:
+        if not self.deltas:
+            return snapshot, snapshot
+
+        changes = snapshot._values - previous._values  # type: ignore
+        is_int = snapshot._is_int
+
+        deltas: Dict[str, CounterValueType] = {}
+        for name, index in COUNTER_NAMES.items():
+            change = changes[index]
+            if change != 0 and change == change:
+                deltas[name] = int(change) if is_int[index] else float(change)
+
+        return deltas, snapshot
+
+    def __iter__(self) -> Iterator[Any]:
+        previous = self.counters.snapshot.copy() if self.deltas else None
+        next_tick = time.monotonic()
+
+        if self.deltas:
+            next_tick += self.interval
+
+        while True:
+            time.sleep(max(0.0, next_tick - time.monotonic()))
+            next_tick += self.interval
+
+            self.counters._refresh(self._max_age, self.reload_interval)
+            with self.counters._refresh_lock:
+                snapshot = self.counters.snapshot.copy()
+
+            item, previous = self._make_item(snapshot, previous)
+            yield item
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        previous = self.counters.snapshot.copy() if self.deltas else None
+        next_tick = time.monotonic()
+
+        if self.deltas:
+            next_tick += self.interval
+
+        while True:
+            await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+            next_tick += self.interval
+
+            await self.counters._arefresh(self._max_age, self.reload_interval)
+            async with self.counters._ahold_refresh_lock():
+                snapshot = self.counters.snapshot.copy()
+
+            item, previous = self._make_item(snapshot, previous)
+            yield item
+
+
+def _get_metadata_array(metadata: CounterMetadataType, meta_key: str) -> np.ndarray:
+    # The values are in the order of `COUNTER_INDEX`, NaN when missing.
+    return np.array(
+        [
+            np.nan if metadata.get(key, {}).get(meta_key) is None else metadata[key][meta_key]
+            for key in COUNTER_INDEX
+        ],
+        dtype=np.float64
+    )
+
+
+def _get_counters_mask(keys: Tuple[str, ...]) -> np.ndarray:
+    # Mask of the counters with the given keys, in the order of `COUNTER_INDEX`.
+    mask = np.zeros(len(COUNTER_INDEX), dtype=bool)
+    mask[[COUNTER_INDEX[key] for key in keys]] = True
+    return mask
 
 
-@dataclass
-class WorldPopulation:
+def _get_period_starts(timestamp: float) -> Tuple[float, float]:
+    # Unix times of the start of the UTC day and year of `timestamp`.
+    day = datetime.fromtimestamp(timestamp, tz=timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    year = day.replace(month=1, day=1)
+    return day.timestamp(), year.timestamp()
+
+
+def _vectorize_metadata(metadata: CounterMetadataType) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    last_values = _get_metadata_array(metadata, 'last_value')
+    last_values[last_values == 0] = np.nan  # same as the `or None` of the last value
+
+    # `rate` is given in units per second. When missing, it is derived from
+    # the `increment` applied every `interval` milliseconds, if available.
+    rates = _get_metadata_array(metadata, 'rate')
+    increments = _get_metadata_array(metadata, 'increment')
+    intervals = _get_metadata_array(metadata, 'interval')
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        derived_rates = increments / (intervals / 1000)
+
+    rates = np.where(np.isnan(rates), derived_rates, rates)
+    rates[~np.isfinite(rates)] = 0.0
+
+    is_int = np.array(
+        [isinstance(metadata.get(key, {}).get('last_value'), int) for key in COUNTER_INDEX],
+        dtype=bool
+    )
+
+    return last_values, rates, is_int
+
+
+class WorldPopulation(_CounterSection):
     """Counters related to world population data.
 
     Attributes
@@ -85,27 +545,20 @@ class WorldPopulation:
     net_population_growth_today : Union[int, float, None]
     net_population_growth_this_year : Union[int, float, None]
     """
-    _data: InitVar[CounterValuesType]
-    current_population: CounterValueType = field(init=False)
-    births_today: CounterValueType = field(init=False)
-    births_this_year: CounterValueType = field(init=False)
-    deaths_today: CounterValueType = field(init=False)
-    deaths_this_year: CounterValueType = field(init=False)
-    net_population_growth_today: CounterValueType = field(init=False)
-    net_population_growth_this_year: CounterValueType = field(init=False)
-
-    def __post_init__(self, _data: CounterValuesType) -> None:
-        self.current_population = _data.get('current_population')
-        self.births_today = _data.get('births_today')
-        self.births_this_year = _data.get('births_this_year')
-        self.deaths_today = _data.get('dth1s_today')
-        self.deaths_this_year = _data.get('dth1s_this_year')
-        self.net_population_growth_today = _data.get('absolute_growth')
-        self.net_population_growth_this_year = _data.get('absolute_growth_year')
-
-
-@dataclass
-class GovernmentAndEconomics:
+    __slots__ = ()
+
+    _counters = {
+        'current_population': 'current_population',
+        'births_today': 'births_today',
+        'births_this_year': 'births_this_year',
+        'deaths_today': 'dth1s_today',
+        'deaths_this_year': 'dth1s_this_year',
+        'net_population_growth_today': 'absolute_growth',
+        'net_population_growth_this_year': 'absolute_growth_year'
+    }
+
+
+class GovernmentAndEconomics(_CounterSection):
     """Counters related to government and economic data.
 
     Attributes
@@ -117,25 +570,19 @@ class GovernmentAndEconomics:
     bicycles_produced_this_year : Union[int, float, None]
     computers_produced_this_year : Union[int, float, None]
     """
-    _data: InitVar[CounterValuesType]
-    public_healthcare_expenditure_today: CounterValueType = field(init=False)
-    public_education_expenditure_today: CounterValueType = field(init=False)
-    public_military_expenditure_today: CounterValueType = field(init=False)
-    cars_produced_this_year: CounterValueType = field(init=False)
-    bicycles_produced_this_year: CounterValueType = field(init=False)
-    computers_produced_this_year: CounterValueType = field(init=False)
-
-    def __post_init__(self, _data: CounterValuesType) -> None:
-        self.public_healthcare_expenditure_today = _data.get('gov_expenditures_health')
-        self.public_education_expenditure_today = _data.get('gov_expenditures_education')
-        self.public_military_expenditure_today = _data.get('gov_expenditures_military')
-        self.cars_produced_this_year = _data.get('automobile_produced')
-        self.bicycles_produced_this_year = _data.get('bicycle_produced')
-        self.computers_produced_this_year = _data.get('computers_sold')
-
-
-@dataclass
-class SocietyAndMedia:
+    __slots__ = ()
+
+    _counters = {
+        'public_healthcare_expenditure_today': 'gov_expenditures_health',
+        'public_education_expenditure_today': 'gov_expenditures_education',
+        'public_military_expenditure_today': 'gov_expenditures_military',
+        'cars_produced_this_year': 'automobile_produced',
+        'bicycles_produced_this_year': 'bicycle_produced',
+        'computers_produced_this_year': 'computers_sold'
+    }
+
+
+class SocietyAndMedia(_CounterSection):
     """Counters related to society and media data.
 
     Attributes
@@ -151,33 +598,23 @@ class SocietyAndMedia:
     tweets_sent_today : Union[int, float, None]
     google_searches_today : Union[int, float, None]
     """
-    _data: InitVar[CounterValuesType]
-    new_book_titles_published_this_year: CounterValueType = field(init=False)
-    newspapers_circulated_today: CounterValueType = field(init=False)
-    tv_sets_sold_worldwide_today: CounterValueType = field(init=False)
-    cellular_phones_sold_today: CounterValueType = field(init=False)
-    money_spent_on_videogames_today: CounterValueType = field(init=False)
-    internet_users_in_the_world_today: CounterValueType = field(init=False)
-    emails_sent_today: CounterValueType = field(init=False)
-    blog_posts_written_today: CounterValueType = field(init=False)
-    tweets_sent_today: CounterValueType = field(init=False)
-    google_searches_today: CounterValueType = field(init=False)
-
-    def __post_init__(self, _data: CounterValuesType) -> None:
-        self.new_book_titles_published_this_year = _data.get('books_published')
-        self.newspapers_circulated_today = _data.get('newspapers_circulated')
-        self.tv_sets_sold_worldwide_today = _data.get('tv')
-        self.cellular_phones_sold_today = _data.get('cellular')
-        self.money_spent_on_videogames_today = _data.get('videogames')
-        self.internet_users_in_the_world_today = _data.get('internet_users')
-        self.emails_sent_today = _data.get('em')
-        self.blog_posts_written_today = _data.get('blog_posts')
-        self.tweets_sent_today = _data.get('tweets')
-        self.google_searches_today = _data.get('google_searches')
-
-
-@dataclass
-class Environment:
+    __slots__ = ()
+
+    _counters = {
+        'new_book_titles_published_this_year': 'books_published',
+        'newspapers_circulated_today': 'newspapers_circulated',
+        'tv_sets_sold_worldwide_today': 'tv',
+        'cellular_phones_sold_today': 'cellular',
+        'money_spent_on_videogames_today': 'videogames',
+        'internet_users_in_the_world_today': 'internet_users',
+        'emails_sent_today': 'em',
+        'blog_posts_written_today': 'blog_posts',
+        'tweets_sent_today': 'tweets',
+        'google_searches_today': 'google_searches'
+    }
+
+
+class Environment(_CounterSection):
     """Counters related to environmental data.
 
     Attributes
@@ -188,23 +625,18 @@ class Environment:
     desertification_this_year : Union[int, float, None]
     toxic_chemicals_released_in_the_environment_this_year : Union[int, float, None]
     """
-    _data: InitVar[CounterValuesType]
-    forest_loss_this_year: CounterValueType = field(init=False)
-    land_lost_to_soil_erosion_this_year: CounterValueType = field(init=False)
-    co2_emissions_this_year: CounterValueType = field(init=False)
-    desertification_this_year: CounterValueType = field(init=False)
-    toxic_chemicals_released_in_the_environment_this_year: CounterValueType = field(init=False)
-
-    def __post_init__(self, _data: CounterValuesType) -> None:
-        self.forest_loss_this_year = _data.get('forest_loss')
-        self.land_lost_to_soil_erosion_this_year = _data.get('soil_erosion')
-        self.co2_emissions_this_year = _data.get('co2_emissions')
-        self.desertification_this_year = _data.get('desert_land_formed')
-        self.toxic_chemicals_released_in_the_environment_this_year = _data.get('tox_chem')
-
-
-@dataclass
-class Food:
+    __slots__ = ()
+
+    _counters = {
+        'forest_loss_this_year': 'forest_loss',
+        'land_lost_to_soil_erosion_this_year': 'soil_erosion',
+        'co2_emissions_this_year': 'co2_emissions',
+        'desertification_this_year': 'desert_land_formed',
+        'toxic_chemicals_released_in_the_environment_this_year': 'tox_chem'
+    }
+
+
+class Food(_CounterSection):
     """Counters related to food data.
 
     Attributes
@@ -216,25 +648,19 @@ class Food:
     money_spent_for_obesity_related_diseases_in_the_usa_today : Union[int, float, None]
     money_spent_on_weight_loss_programs_in_the_usa_today : Union[int, float, None]
     """
-    _data: InitVar[CounterValuesType]
-    undernourished_people_in_the_world: CounterValueType = field(init=False)
-    overweight_people_in_the_world: CounterValueType = field(init=False)
-    obese_people_in_the_world: CounterValueType = field(init=False)
-    people_who_died_of_hunger_today: CounterValueType = field(init=False)
-    money_spent_for_obesity_related_diseases_in_the_usa_today: CounterValueType = field(init=False)
-    money_spent_on_weight_loss_programs_in_the_usa_today: CounterValueType = field(init=False)
-
-    def __post_init__(self, _data: CounterValuesType) -> None:
-        self.undernourished_people_in_the_world = _data.get('undernourished')
-        self.overweight_people_in_the_world = _data.get('overweight')
-        self.obese_people_in_the_world = _data.get('obese')
-        self.people_who_died_of_hunger_today = _data.get('dth1_hunger')
-        self.money_spent_for_obesity_related_diseases_in_the_usa_today = _data.get('obesity_spending')
-        self.money_spent_on_weight_loss_programs_in_the_usa_today = _data.get('spending_on_weight_loss')
-
-
-@dataclass
-class Water:
+    __slots__ = ()
+
+    _counters = {
+        'undernourished_people_in_the_world': 'undernourished',
+        'overweight_people_in_the_world': 'overweight',
+        'obese_people_in_the_world': 'obese',
+        'people_who_died_of_hunger_today': 'dth1_hunger',
+        'money_spent_for_obesity_related_diseases_in_the_usa_today': 'obesity_spending',
+        'money_spent_on_weight_loss_programs_in_the_usa_today': 'spending_on_weight_loss'
+    }
+
+
+class Water(_CounterSection):
     """Counters related to water data.
 
     Attributes
@@ -243,19 +669,16 @@ class Water:
     deaths_caused_by_water_related_diseases_this_year : Union[int, float, None]
     people_with_no_access_to_a_safe_drinking_water_source : Union[int, float, None]
     """
-    _data: InitVar[CounterValuesType]
-    water_used_this_year: CounterValueType = field(init=False)
-    deaths_caused_by_water_related_diseases_this_year: CounterValueType = field(init=False)
-    people_with_no_access_to_a_safe_drinking_water_source: CounterValueType = field(init=False)
+    __slots__ = ()
 
-    def __post_init__(self, _data: CounterValuesType) -> None:
-        self.water_used_this_year = _data.get('water_consumed')
-        self.deaths_caused_by_water_related_diseases_this_year = _data.get('water_disax')
-        self.people_with_no_access_to_a_safe_drinking_water_source = _data.get('nowater_population')
+    _counters = {
+        'water_used_this_year': 'water_consumed',
+        'deaths_caused_by_water_related_diseases_this_year': 'water_disax',
+        'people_with_no_access_to_a_safe_drinking_water_source': 'nowater_population'
+    }
 
 
-@dataclass
-class Energy:
+class Energy(_CounterSection):
     """Counters related to energy data.
 
     Attributes
@@ -272,35 +695,24 @@ class Energy:
     coal_left : Union[int, float, None]
     days_to_the_end_of_coal : Union[int, float, None]
     """
-    _data: InitVar[CounterValuesType]
-    energy_used_today: CounterValueType = field(init=False)
-    non_renewable_sources: CounterValueType = field(init=False)
-    renewable_sources: CounterValueType = field(init=False)
-    solar_energy_striking_earth_today: CounterValueType = field(init=False)
-    oil_pumped_today: CounterValueType = field(init=False)
-    oil_left: CounterValueType = field(init=False)
-    days_to_the_end_of_oil: CounterValueType = field(init=False)
-    natural_gas_left: CounterValueType = field(init=False)
-    days_to_the_end_of_natural_gas: CounterValueType = field(init=False)
-    coal_left: CounterValueType = field(init=False)
-    days_to_the_end_of_coal: CounterValueType = field(init=False)
-
-    def __post_init__(self, _data: CounterValuesType) -> None:
-        self.energy_used_today = _data.get('energy_used')
-        self.non_renewable_sources = _data.get('energy_nonren')
-        self.renewable_sources = _data.get('energy_ren')
-        self.solar_energy_striking_earth_today = _data.get('solar_energy')
-        self.oil_pumped_today = _data.get('oil_consumption')
-        self.oil_left = _data.get('oil_reserves')
-        self.days_to_the_end_of_oil = _data.get('oil_days')
-        self.natural_gas_left = _data.get('gas_reserves')
-        self.days_to_the_end_of_natural_gas = _data.get('gas_days')
-        self.coal_left = _data.get('coal_reserves')
-        self.days_to_the_end_of_coal = _data.get('coal_days')
-
-
-@dataclass
-class Health:
+    __slots__ = ()
+
+    _counters = {
+        'energy_used_today': 'energy_used',
+        'non_renewable_sources': 'energy_nonren',
+        'renewable_sources': 'energy_ren',
+        'solar_energy_striking_earth_today': 'solar_energy',
+        'oil_pumped_today': 'oil_consumption',
+        'oil_left': 'oil_reserves',
+        'days_to_the_end_of_oil': 'oil_days',
+        'natural_gas_left': 'gas_reserves',
+        'days_to_the_end_of_natural_gas': 'gas_days',
+        'coal_left': 'coal_reserves',
+        'days_to_the_end_of_coal': 'coal_days'
+    }
+
+
+class Health(_CounterSection):
     """Counters related to health data.
 
     Attributes
@@ -321,36 +733,84 @@ class Health:
     money_spent_on_illegal_drugs_this_year : Union[int, float, None]
     road_traffic_accident_fatalities_this_year : Union[int, float, None]
     """
-    _data: InitVar[CounterValuesType]
-    communicable_disease_deaths_this_year: CounterValueType = field(init=False)
-    seasonal_flu_deaths_this_year: CounterValueType = field(init=False)
-    deaths_of_children_under_5_this_year: CounterValueType = field(init=False)
-    abortions_this_year: CounterValueType = field(init=False)
-    deaths_of_mothers_during_birth_this_year: CounterValueType = field(init=False)
-    hiv_aids_infected_people: CounterValueType = field(init=False)
-    deaths_caused_by_hiv_aids_this_year: CounterValueType = field(init=False)
-    deaths_caused_by_cancer_this_year: CounterValueType = field(init=False)
-    deaths_caused_by_malaria_this_year: CounterValueType = field(init=False)
-    cigarettes_smoked_today: CounterValueType = field(init=False)
-    deaths_caused_by_smoking_this_year: CounterValueType = field(init=False)
-    deaths_caused_by_alcohol_this_year: CounterValueType = field(init=False)
-    suicides_this_year: CounterValueType = field(init=False)
-    money_spent_on_illegal_drugs_this_year: CounterValueType = field(init=False)
-    road_traffic_accident_fatalities_this_year: CounterValueType = field(init=False)
-
-    def __post_init__(self, _data: CounterValuesType) -> None:
-        self.communicable_disease_deaths_this_year = _data.get('dth1s_communicable_disaxs')
-        self.seasonal_flu_deaths_this_year = _data.get('dth1s_flu')
-        self.deaths_of_children_under_5_this_year = _data.get('dth1s_children')
-        self.abortions_this_year = _data.get('ab')
-        self.deaths_of_mothers_during_birth_this_year = _data.get('dth1s_maternal')
-        self.hiv_aids_infected_people = _data.get('infections_hiv')
-        self.deaths_caused_by_hiv_aids_this_year = _data.get('dth1s_ads')
-        self.deaths_caused_by_cancer_this_year = _data.get('dth1s_cancer')
-        self.deaths_caused_by_malaria_this_year = _data.get('dth1s_malarial')
-        self.cigarettes_smoked_today = _data.get('cigarettes_smoked')
-        self.deaths_caused_by_smoking_this_year = _data.get('dth1s_cigarettes')
-        self.deaths_caused_by_alcohol_this_year = _data.get('dth1s_alchool')
-        self.suicides_this_year = _data.get('sui')
-        self.money_spent_on_illegal_drugs_this_year = _data.get('drug_spending')
-        self.road_traffic_accident_fatalities_this_year = _data.get('dth1s_cars')
+    __slots__ = ()
+
+    _counters = {
+        'communicable_disease_deaths_this_year': 'dth1s_communicable_disaxs',
+        'seasonal_flu_deaths_this_year': 'dth1s_flu',
+        'deaths_of_children_under_5_this_year': 'dth1s_children',
+        'abortions_this_year': 'ab',
+        'deaths_of_mothers_during_birth_this_year': 'dth1s_maternal',
+        'hiv_aids_infected_people': 'infections_hiv',
+        'deaths_caused_by_hiv_aids_this_year': 'dth1s_ads',
+        'deaths_caused_by_cancer_this_year': 'dth1s_cancer',
+        'deaths_caused_by_malaria_this_year': 'dth1s_malarial',
+        'cigarettes_smoked_today': 'cigarettes_smoked',
+        'deaths_caused_by_smoking_this_year': 'dth1s_cigarettes',
+        'deaths_caused_by_alcohol_this_year': 'dth1s_alchool',
+        'suicides_this_year': 'sui',
+        'money_spent_on_illegal_drugs_this_year': 'drug_spending',
+        'road_traffic_accident_fatalities_this_year': 'dth1s_cars'
+    }
+
+
+
+# Keys of the counters that restart from zero at the start of each day
+# and year. Other counters, such as the current population or the
+# internet users, are running totals even if their name ends in "today".
+# Defined after the sections, which fill in `COUNTER_INDEX`.
+_DAILY_COUNTER_KEYS = (
+    'births_today',
+    'dth1s_today',
+    'absolute_growth',
+    'gov_expenditures_health',
+    'gov_expenditures_education',
+    'gov_expenditures_military',
+    'newspapers_circulated',
+    'tv',
+    'cellular',
+    'videogames',
+    'em',
+    'blog_posts',
+    'tweets',
+    'google_searches',
+    'dth1_hunger',
+    'obesity_spending',
+    'spending_on_weight_loss',
+    'energy_used',
+    'solar_energy',
+    'oil_consumption',
+    'cigarettes_smoked'
+)
+_YEARLY_COUNTER_KEYS = (
+    'births_this_year',
+    'dth1s_this_year',
+    'absolute_growth_year',
+    'automobile_produced',
+    'bicycle_produced',
+    'computers_sold',
+    'books_published',
+    'forest_loss',
+    'soil_erosion',
+    'co2_emissions',
+    'desert_land_formed',
+    'tox_chem',
+    'water_consumed',
+    'water_disax',
+    'dth1s_communicable_disaxs',
+    'dth1s_flu',
+    'dth1s_children',
+    'ab',
+    'dth1s_maternal',
+    'dth1s_ads',
+    'dth1s_cancer',
+    'dth1s_malarial',
+    'dth1s_cigarettes',
+    'dth1s_alchool',
+    'sui',
+    'drug_spending',
+    'dth1s_cars'
+)
+
+_DAILY_COUNTERS = _get_counters_mask(_DAILY_COUNTER_KEYS)
+_YEARLY_COUNTERS = _get_counters_mask(_YEARLY_COUNTER_KEYS)
@@ -1,11 +1,9 @@
-from copy import deepcopy
-from dataclasses import dataclass
-from typing import List
+from typing import Tuple
 
-from worldometer.scraper import get_data_tables
+from worldometer.world.base import _DataTables, _row_dataclass
 
 
-@dataclass
+@_row_dataclass
 class CountryCodesData:
     """Represents a data row from the respective table.
 
@@ -26,7 +24,7 @@ class CountryCodesData:
     _table_position = 0
 
 
-class CountryCodes:
+class CountryCodes(_DataTables):
     """Represents the data table of some codes used by each country.
 
     Attributes
@@ -51,26 +49,15 @@ class CountryCodes:
         'three_digit_iso_numeric'
     )
 
-    def __init__(self) -> None:
-        self._data = self._load_data()
+    _cache_max_age = 60 * 60 * 24 * 30
 
-    def _load_data(self) -> List[CountryCodesData]:
-        dts = get_data_tables(
-            path_url=self.source_path,
-            new_column_names=[
-                self.new_column_names
-            ]
-        )
-        return [
-            CountryCodesData(**data_row)
-            for data_row in dts[CountryCodesData._table_position]
-        ]
+    _row_types = (CountryCodesData,)
 
     @property
-    def data(self) -> List[CountryCodesData]:
-        """Get a list of all the data from the table.
+    def data(self) -> Tuple[CountryCodesData, ...]:
+        """Get a tuple of all the data from the table.
 
-        Each index in the list contains an object representing
+        Each index in the tuple contains an object representing
         a data row of the table.
         """
-        return deepcopy(self._data)
+        return self._get_rows(CountryCodesData)
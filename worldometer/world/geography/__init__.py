@@ -21,13 +21,25 @@ __all__ = [
     'OceaniaCountries'
 ]
 
-from worldometer.world.geography.largest_countries import LargestCountries
-from worldometer.world.geography.countries import (
-    WorldCountries,
-    AsiaCountries,
-    AfricaCountries,
-    EuropeCountries,
-    LatinAmericanAndTheCaribbeanCountries,
-    NorthernAmericanCountries,
-    OceaniaCountries
-)
+from typing import TYPE_CHECKING
+
+from worldometer._lazy import attach
+
+_LAZY_IMPORTS = {
+    'LargestCountries': 'worldometer.world.geography.largest_countries',
+    **dict.fromkeys(__all__[1:], 'worldometer.world.geography.countries')
+}
+
+__getattr__, __dir__ = attach(__name__, _LAZY_IMPORTS, __all__)
+
+if TYPE_CHECKING:
+    from worldometer.world.geography.largest_countries import LargestCountries
+    from worldometer.world.geography.countries import (
+        WorldCountries,
+        AsiaCountries,
+        AfricaCountries,
+        EuropeCountries,
+        LatinAmericanAndTheCaribbeanCountries,
+        NorthernAmericanCountries,
+        OceaniaCountries
+    )
@@ -1,11 +1,10 @@
-from copy import deepcopy
-from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Tuple
 
-from worldometer.scraper import get_data_tables
+from worldometer.scraper import Page
+from worldometer.world.base import _DataTables, _row_dataclass
 
 
-@dataclass
+@_row_dataclass
 class WorldCountriesData:
     """Represents a data row from the respective table.
 
@@ -14,19 +13,20 @@ class WorldCountriesData:
     idx: int
     country: str
     population: int
-    world_share: str
+    world_share: float
     land_area: int
     """
     idx: int
     country: str
     population: int
-    world_share: str
+    world_share: float
     land_area: int
 
     _table_position = 0
+    _percent_columns = ('world_share',)
 
 
-@dataclass
+@_row_dataclass
 class CountryData:
     """Represents a data row from the respective table.
 
@@ -45,7 +45,7 @@ class CountryData:
     _table_position = 0
 
 
-@dataclass
+@_row_dataclass
 class DependencyData:
     """Represents a data row from the respective table.
 
@@ -64,7 +64,7 @@ class DependencyData:
     _table_position = 1
 
 
-class WorldCountries:
+class WorldCountries(_DataTables):
     """Represents the data table of a list of countries in the world.
 
     Attributes
@@ -92,32 +92,22 @@ class WorldCountries:
         'land_area'
     )
 
-    def __init__(self) -> None:
-        self._data = self._load_data()
-        self.total = len(self._data)
+    _row_types = (WorldCountriesData,)
 
-    def _load_data(self) -> List[WorldCountriesData]:
-        dts = get_data_tables(
-            path_url=self.source_path,
-            new_column_names=[
-                self.new_column_names
-            ]
-        )
-        return [
-            WorldCountriesData(**data_row)
-            for data_row in dts[WorldCountriesData._table_position]
-        ]
+    def _init_page(self, page: Page) -> None:
+        super()._init_page(page)
+        self.total = len(self._get_rows(WorldCountriesData))
 
-    def countries(self) -> List[WorldCountriesData]:
-        """Get a list of all the countries' data from the table.
+    def countries(self) -> Tuple[WorldCountriesData, ...]:
+        """Get a tuple of all the countries' data from the table.
 
-        Each index in the list contains an object representing
+        Each index in the tuple contains an object representing
         a data row of the table.
         """
-        return deepcopy(self._data)
+        return self._get_rows(WorldCountriesData)
 
 
-class _RegionCountries:
+class _RegionCountries(_DataTables):
 
     source_path = '[override]'
     new_column_names = (
@@ -135,51 +125,32 @@ class _RegionCountries:
         )
     )
 
-    def __init__(self) -> None:
-        self._data = self._load_data()
-        self.total = len(self._data[CountryData._table_position])
-
-    def _load_data(
-            self
-    ) -> Tuple[
-            List[CountryData],
-            List[DependencyData]
-    ]:
-        dts = get_data_tables(
-            path_url=self.source_path,
-            new_column_names=[
-                *self.new_column_names
-            ]
-        )
+    _row_types = (
+        CountryData,
+        DependencyData
+    )
 
-        return (
-            [
-                CountryData(**data_row)
-                for data_row in dts[CountryData._table_position]
-            ],
-            [
-                DependencyData(**data_row)
-                for data_row in dts[DependencyData._table_position]
-            ]
-        )
+    def _init_page(self, page: Page) -> None:
+        super()._init_page(page)
+        self.total = len(self._get_rows(CountryData))
 
-    def countries(self) -> List[CountryData]:
-        """Get a list of all the data for countries in the
+    def countries(self) -> Tuple[CountryData, ...]:
+        """Get a tuple of all the data for countries in the
         region from the table.
 
-        Each index in the list contains an object representing
+        Each index in the tuple contains an object representing
         a data row of the table.
         """
-        return deepcopy(self._data[CountryData._table_position])  # type: ignore
+        return self._get_rows(CountryData)
 
-    def dependencies(self) -> List[DependencyData]:
-        """Get a list of all the data for dependencies in the
+    def dependencies(self) -> Tuple[DependencyData, ...]:
+        """Get a tuple of all the data for dependencies in the
         region from the table.
 
-        Each index in the list contains an object representing
+        Each index in the tuple contains an object representing
         a data row of the table.
         """
-        return deepcopy(self._data[DependencyData._table_position])  # type: ignore
+        return self._get_rows(DependencyData)
 
 
 class AsiaCountries(_RegionCountries):
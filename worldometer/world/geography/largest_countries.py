@@ -1,11 +1,9 @@
-from copy import deepcopy
-from dataclasses import dataclass
-from typing import List
+from typing import Tuple
 
-from worldometer.scraper import get_data_tables
+from worldometer.world.base import _DataTables, _row_dataclass
 
 
-@dataclass
+@_row_dataclass
 class LargestCountriesData:
     """Represents a data row from the respective table.
 
@@ -17,7 +15,7 @@ class LargestCountriesData:
     total_area_mi2: int
     land_area_km2: int
     land_area_mi2: int
-    percentage_of_world_landmass: str
+    percentage_of_world_landmass: float
     """
     idx: int
     country: str
@@ -25,12 +23,13 @@ class LargestCountriesData:
     total_area_mi2: int
     land_area_km2: int
     land_area_mi2: int
-    percentage_of_world_landmass: str
+    percentage_of_world_landmass: float
 
     _table_position = 0
+    _percent_columns = ('percentage_of_world_landmass',)
 
 
-class LargestCountries:
+class LargestCountries(_DataTables):
     """Represents the data table of the largest countries in the world (by area).
 
     Attributes
@@ -57,26 +56,15 @@ class LargestCountries:
         'percentage_of_world_landmass'
     )
 
-    def __init__(self) -> None:
-        self._data = self._load_data()
+    _cache_max_age = 60 * 60 * 24 * 30
 
-    def _load_data(self) -> List[LargestCountriesData]:
-        dts = get_data_tables(
-            path_url=self.source_path,
-            new_column_names=[
-                self.new_column_names
-            ]
-        )
-        return [
-            LargestCountriesData(**data_row)
-            for data_row in dts[LargestCountriesData._table_position]
-        ]
+    _row_types = (LargestCountriesData,)
 
     @property
-    def data(self) -> List[LargestCountriesData]:
-        """Get a list of all the data from the table.
+    def data(self) -> Tuple[LargestCountriesData, ...]:
+        """Get a tuple of all the data from the table.
 
-        Each index in the list contains an object representing
+        Each index in the tuple contains an object representing
         a data row of the table.
         """
-        return deepcopy(self._data)
+        return self._get_rows(LargestCountriesData)
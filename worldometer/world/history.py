@@ -0,0 +1,171 @@
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from worldometer.world.counters import COUNTER_INDEX, COUNTER_NAMES, CounterSnapshot, WorldCounters
+
+
+class CounterHistory:
+    """Stores the last samples of the counters in a fixed-size ring buffer.
+
+    The samples are kept in preallocated NumPy arrays, a time column and
+    a matrix of time by counter, so the memory used is known when the
+    history is created (see `nbytes`) and appending a sample is O(1).
+    When the history is full, each new sample replaces the oldest one.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of samples stored.
+
+    Examples
+    --------
+    >>> from worldometer.world import CounterHistory, WorldCounters
+    >>> wc = WorldCounters()
+    >>> history = CounterHistory(capacity=3600)
+    >>> for snapshot in wc.stream(interval=1.0):
+    ...     history.append(snapshot)
+    ...     if len(history) == 60:
+    ...         break
+    >>> history.rates()['births_today']
+    4.3
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError('The history capacity must be at least 1')
+
+        self.capacity = capacity
+
+        self._times = np.full(capacity, np.nan, dtype=np.float64)
+        self._values = np.full((capacity, len(COUNTER_INDEX)), np.nan, dtype=np.float64)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """The memory used by the samples, in bytes."""
+        return self._times.nbytes + self._values.nbytes
+
+    def append(self, sample: Union[CounterSnapshot, WorldCounters]) -> None:
+        """Add a sample of the counters, replacing the oldest if the history is full.
+
+        Samples are expected in chronological order.
+        """
+        snapshot = sample if isinstance(sample, CounterSnapshot) else sample.snapshot
+
+        if self._size < self.capacity:
+            position = (self._start + self._size) % self.capacity
+            self._size += 1
+        else:
+            position = self._start
+            self._start = (self._start + 1) % self.capacity
+
+        self._times[position] = snapshot.timestamp
+        self._values[position] = snapshot._values
+
+    def clear(self) -> None:
+        self._start = 0
+        self._size = 0
+
+    def _get_positions(self, first: int, last: int) -> Union[slice, np.ndarray]:
+        # Physical positions of the samples between two logical indexes
+        # (0 is the oldest sample), a slice when they are contiguous.
+        begin = self._start + first
+        end = self._start + last
+        if end <= self.capacity:
+            return slice(begin, end)
+        if begin >= self.capacity:
+            return slice(begin - self.capacity, end - self.capacity)
+        return np.arange(begin, end) % self.capacity
+
+    def _search(self, timestamp: float) -> int:
+        # Binary search of the first sample at or after `timestamp`.
+        low, high = 0, self._size
+        while low < high:
+            middle = (low + high) // 2
+            if self._times[(self._start + middle) % self.capacity] < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _get_window(self, start: Optional[float], end: Optional[float]) -> Union[slice, np.ndarray]:
+        first = 0 if start is None else self._search(start)
+        last = self._size if end is None else self._search(end)
+        return self._get_positions(first, max(first, last))
+
+    def window(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the samples taken between two moments.
+
+        Parameters
+        ----------
+        start : float, optional
+            The Unix time of the first sample (inclusive).
+            The oldest sample by default.
+        end : float, optional
+            The Unix time of the last sample (exclusive).
+            The newest sample by default.
+
+        Returns
+        -------
+        tuple
+            The times of the samples and a matrix with a row for each
+            sample and a column for each counter (in the order of
+            `COUNTER_INDEX`), both in chronological order. They are
+            copies, so they are not changed by new samples.
+        """
+        positions = self._get_window(start, end)
+        return self._times[positions].copy(), self._values[positions].copy()
+
+    def last(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the last `n` samples, as returned by `window`."""
+        positions = self._get_positions(max(0, self._size - n), self._size)
+        return self._times[positions].copy(), self._values[positions].copy()
+
+    def series(
+        self,
+        name: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the times and values of a counter, by its attribute name
+        (e.g. ``'current_population'``), between two moments.
+        """
+        positions = self._get_window(start, end)
+        return self._times[positions].copy(), self._values[positions, COUNTER_NAMES[name]].copy()
+
+    def rates(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None
+    ) -> Dict[str, Optional[float]]:
+        """Get the average rate (units per second) of each counter between two moments.
+
+        The rate is computed from the first and last samples in the
+        window, and is None when there are not enough samples or
+        values to compute it.
+        """
+        first = 0 if start is None else self._search(start)
+        last = (self._size if end is None else self._search(end)) - 1
+
+        first_position = (self._start + first) % self.capacity
+        last_position = (self._start + last) % self.capacity
+        elapsed = self._times[last_position] - self._times[first_position]
+
+        if last <= first or not elapsed > 0:
+            return dict.fromkeys(COUNTER_NAMES)
+
+        rates = (self._values[last_position] - self._values[first_position]) / elapsed
+
+        return {
+            name: float(rates[index]) if rates[index] == rates[index] else None
+            for name, index in COUNTER_NAMES.items()
+        }
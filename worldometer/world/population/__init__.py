@@ -27,17 +27,34 @@ __all__ = [
     'OceaniaPopulation'
 ]
 
-from worldometer.world.population.countries_by_population import CountriesByPopulation
-from worldometer.world.population.largest_cities import LargestCities
-from worldometer.world.population.most_populous_countries import MostPopulousCountries
-from worldometer.world.population.by_region import WorldPopulationByRegion
-from worldometer.world.population.by_year import WorldPopulationByYear
-from worldometer.world.population.projections import WorldPopulationProjections
-from worldometer.world.population.regions import (
-    AsiaPopulation,
-    AfricaPopulation,
-    EuropePopulation,
-    LatinAmericanAndTheCaribbeanPopulation,
-    NorthernAmericanPopulation,
-    OceaniaPopulation
-)
+from typing import TYPE_CHECKING
+
+from worldometer._lazy import attach
+
+_LAZY_IMPORTS = {
+    'CountriesByPopulation': 'worldometer.world.population.countries_by_population',
+    'LargestCities': 'worldometer.world.population.largest_cities',
+    'MostPopulousCountries': 'worldometer.world.population.most_populous_countries',
+    'WorldPopulationByRegion': 'worldometer.world.population.by_region',
+    'WorldPopulationByYear': 'worldometer.world.population.by_year',
+    'WorldPopulationProjections': 'worldometer.world.population.projections',
+    **dict.fromkeys(__all__[6:], 'worldometer.world.population.regions')
+}
+
+__getattr__, __dir__ = attach(__name__, _LAZY_IMPORTS, __all__)
+
+if TYPE_CHECKING:
+    from worldometer.world.population.countries_by_population import CountriesByPopulation
+    from worldometer.world.population.largest_cities import LargestCities
+    from worldometer.world.population.most_populous_countries import MostPopulousCountries
+    from worldometer.world.population.by_region import WorldPopulationByRegion
+    from worldometer.world.population.by_year import WorldPopulationByYear
+    from worldometer.world.population.projections import WorldPopulationProjections
+    from worldometer.world.population.regions import (
+        AsiaPopulation,
+        AfricaPopulation,
+        EuropePopulation,
+        LatinAmericanAndTheCaribbeanPopulation,
+        NorthernAmericanPopulation,
+        OceaniaPopulation
+    )
@@ -1,11 +1,9 @@
-from copy import deepcopy
-from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Tuple
 
-from worldometer.scraper import get_data_tables
+from worldometer.world.base import _DataTables, _row_dataclass
 
 
-@dataclass
+@_row_dataclass
 class CurrentWorldPopulationByRegionData:
     """Represents a data row from the respective table.
 
@@ -14,33 +12,34 @@ class CurrentWorldPopulationByRegionData:
     idx: int
     region: str
     population: int
-    yearly_change: str
+    yearly_change: float
     net_change: int
     density: int
     area: int
     migrants: int
     fertility_rate: float
     median_age: int
-    urban_population: str
-    world_share: str
+    urban_population: float
+    world_share: float
     """
     idx: int
     region: str
     population: int
-    yearly_change: str
+    yearly_change: float
     net_change: int
     density: int
     area: int
     migrants: int
     fertility_rate: float
     median_age: int
-    urban_population: str
-    world_share: str
+    urban_population: float
+    world_share: float
 
     _table_position = 0
+    _percent_columns = ('yearly_change', 'urban_population', 'world_share')
 
 
-@dataclass
+@_row_dataclass
 class PastWorldPopulationByRegionData:
     """Represents a data row from the respective table.
 
@@ -49,17 +48,18 @@ class PastWorldPopulationByRegionData:
     idx: int
     region: str
     population: int
-    world_share: str
+    world_share: float
     """
     idx: int
     region: str
     population: int
-    world_share: str
+    world_share: float
 
     _table_position = 1
+    _percent_columns = ('world_share',)
 
 
-@dataclass
+@_row_dataclass
 class FutureWorldPopulationByRegionData:
     """Represents a data row from the respective table.
 
@@ -68,17 +68,18 @@ class FutureWorldPopulationByRegionData:
     idx: int
     region: str
     population: int
-    world_share: str
+    world_share: float
     """
     idx: int
     region: str
     population: int
-    world_share: str
+    world_share: float
 
     _table_position = 2
+    _percent_columns = ('world_share',)
 
 
-class WorldPopulationByRegion:
+class WorldPopulationByRegion(_DataTables):
     """Represents the data table of regions in the world by population.
 
     Attributes
@@ -124,64 +125,38 @@ class WorldPopulationByRegion:
         )
     )
 
-    def __init__(self) -> None:
-        self._data = self._load_data()
-
-    def _load_data(
-            self
-    ) -> Tuple[
-            List[CurrentWorldPopulationByRegionData],
-            List[PastWorldPopulationByRegionData],
-            List[FutureWorldPopulationByRegionData]
-    ]:
-        dts = get_data_tables(
-            path_url=self.source_path,
-            new_column_names=[
-                *self.new_column_names
-            ]
-        )
-
-        return (
-            [
-                CurrentWorldPopulationByRegionData(**data_row)
-                for data_row in dts[CurrentWorldPopulationByRegionData._table_position]
-            ],
-            [
-                PastWorldPopulationByRegionData(**data_row)
-                for data_row in dts[PastWorldPopulationByRegionData._table_position]
-            ],
-            [
-                FutureWorldPopulationByRegionData(**data_row)
-                for data_row in dts[FutureWorldPopulationByRegionData._table_position]
-            ]
-        )
+    _row_types = (
+        CurrentWorldPopulationByRegionData,
+        PastWorldPopulationByRegionData,
+        FutureWorldPopulationByRegionData
+    )
 
-    def current(self) -> List[CurrentWorldPopulationByRegionData]:
-        """Get a list of all the current data from the table.
+    def current(self) -> Tuple[CurrentWorldPopulationByRegionData, ...]:
+        """Get a tuple of all the current data from the table.
 
         These data are related to the current year.
 
-        Each index in the list contains an object representing
+        Each index in the tuple contains an object representing
         a data row of the table.
         """
-        return deepcopy(self._data[CurrentWorldPopulationByRegionData._table_position])  # type: ignore
+        return self._get_rows(CurrentWorldPopulationByRegionData)
 
-    def past(self) -> List[PastWorldPopulationByRegionData]:
-        """Get a list of all historical data from the table.
+    def past(self) -> Tuple[PastWorldPopulationByRegionData, ...]:
+        """Get a tuple of all historical data from the table.
 
         These data pertain to the year 1950.
 
-        Each index in the list contains an object representing
+        Each index in the tuple contains an object representing
         a data row of the table.
         """
-        return deepcopy(self._data[PastWorldPopulationByRegionData._table_position])  # type: ignore
+        return self._get_rows(PastWorldPopulationByRegionData)
 
-    def future(self) -> List[FutureWorldPopulationByRegionData]:
-        """Get a list of all future data from the table.
+    def future(self) -> Tuple[FutureWorldPopulationByRegionData, ...]:
+        """Get a tuple of all future data from the table.
 
         These data are an estimate for the year 2050.
 
-        Each index in the list contains an object representing
+        Each index in the tuple contains an object representing
         a data row of the table.
         """
-        return deepcopy(self._data[FutureWorldPopulationByRegionData._table_position])  # type: ignore
+        return self._get_rows(FutureWorldPopulationByRegionData)
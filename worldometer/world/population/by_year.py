@@ -1,11 +1,9 @@
-from copy import deepcopy
-from dataclasses import dataclass
-from typing import List
+from typing import Tuple
 
-from worldometer.scraper import get_data_tables
+from worldometer.world.base import _DataTables, _row_dataclass
 
 
-@dataclass
+@_row_dataclass
 class WorldPopulationByYearData:
     """Represents a data row from the respective table.
 
@@ -13,20 +11,21 @@ class WorldPopulationByYearData:
     ----------
     year: int
     world_population: int
-    yearly_change: str
+    yearly_change: float
     net_change: float
     density: float
     """
     year: int
     world_population: int
-    yearly_change: str
+    yearly_change: float
     net_change: float
     density: float
 
     _table_position = 0
+    _percent_columns = ('yearly_change',)
 
 
-class WorldPopulationByYear:
+class WorldPopulationByYear(_DataTables):
     """Represents the data table of the world population by year.
 
     Attributes
@@ -51,26 +50,15 @@ class WorldPopulationByYear:
         'density'
     )
 
-    def __init__(self) -> None:
-        self._data = self._load_data()
+    _cache_max_age = 60 * 60 * 24 * 7
 
-    def _load_data(self) -> List[WorldPopulationByYearData]:
-        dts = get_data_tables(
-            path_url=self.source_path,
-            new_column_names=[
-                self.new_column_names
-            ]
-        )
-        return [
-            WorldPopulationByYearData(**data_row)
-            for data_row in dts[WorldPopulationByYearData._table_position]
-        ]
+    _row_types = (WorldPopulationByYearData,)
 
     @property
-    def data(self) -> List[WorldPopulationByYearData]:
-        """Get a list of all the data from the table.
+    def data(self) -> Tuple[WorldPopulationByYearData, ...]:
+        """Get a tuple of all the data from the table.
 
-        Each index in the list contains an object representing
+        Each index in the tuple contains an object representing
         a data row of the table.
         """
-        return deepcopy(self._data)
+        return self._get_rows(WorldPopulationByYearData)
@@ -1,11 +1,9 @@
-from copy import deepcopy
-from dataclasses import dataclass
-from typing import List
+from typing import Tuple
 
-from worldometer.scraper import get_data_tables
+from worldometer.world.base import _DataTables, _row_dataclass
 
 
-@dataclass
+@_row_dataclass
 class CountriesByPopulationData:
     """Represents a data row from the respective table.
 
@@ -14,33 +12,34 @@ class CountriesByPopulationData:
     idx: int
     country: str
     population: int
-    yearly_change: str
+    yearly_change: float
     net_change: int
     density: int
     land_area: int
     migrants: int
     fertility_rate: float
     median_age: float
-    urban_population: str
-    world_share: str
+    urban_population: float
+    world_share: float
     """
     idx: int
     country: str
     population: int
-    yearly_change: str
+    yearly_change: float
     net_change: int
     density: int
     land_area: int
     migrants: int
     fertility_rate: float
     median_age: float
-    urban_population: str
-    world_share: str
+    urban_population: float
+    world_share: float
 
     _table_position = 0
+    _percent_columns = ('yearly_change', 'urban_population', 'world_share')
 
 
-class CountriesByPopulation:
+class CountriesByPopulation(_DataTables):
     """Represents the data table of countries in the world by population.
 
     Attributes
@@ -72,26 +71,13 @@ class CountriesByPopulation:
         'world_share'
     )
 
-    def __init__(self) -> None:
-        self._data = self._load_data()
-
-    def _load_data(self) -> List[CountriesByPopulationData]:
-        dts = get_data_tables(
-            path_url=self.source_path,
-            new_column_names=[
-                self.new_column_names
-            ]
-        )
-        return [
-            CountriesByPopulationData(**data_row)
-            for data_row in dts[CountriesByPopulationData._table_position]
-        ]
+    _row_types = (CountriesByPopulationData,)
 
     @property
-    def data(self) -> List[CountriesByPopulationData]:
-        """Get a list of all the data from the table.
+    def data(self) -> Tuple[CountriesByPopulationData, ...]:
+        """Get a tuple of all the data from the table.
 
-        Each index in the list contains an object representing
+        Each index in the tuple contains an object representing
         a data row of the table.
         """
-        return deepcopy(self._data)
+        return self._get_rows(CountriesByPopulationData)
@@ -1,11 +1,9 @@
-from copy import deepcopy
-from dataclasses import dataclass
-from typing import List
+from typing import Tuple
 
-from worldometer.scraper import get_data_tables
+from worldometer.world.base import _DataTables, _row_dataclass
 
 
-@dataclass
+@_row_dataclass
 class LargestCitiesData:
     """Represents a data row from the respective table.
 
@@ -13,14 +11,14 @@ class LargestCitiesData:
     ----------
     rank: int
     urban_area: str
-    population_estimate: str
+    population_estimate: int
     country: str
     land_area: int
     density: int
     """
     rank: int
     urban_area: str
-    population_estimate: str
+    population_estimate: int
     country: str
     land_area: int
     density: int
@@ -28,7 +26,7 @@ class LargestCitiesData:
     _table_position = 0
 
 
-class LargestCities:
+class LargestCities(_DataTables):
     """Represents the data table of the largest cities in the world.
 
     Attributes
@@ -54,27 +52,15 @@ class LargestCities:
         'density'
     )
 
-    def __init__(self) -> None:
-        self._data = self._load_data()
+    _attrs = None
 
-    def _load_data(self) -> List[LargestCitiesData]:
-        dts = get_data_tables(
-            path_url=self.source_path,
-            new_column_names=[
-                self.new_column_names
-            ],
-            attrs=None
-        )
-        return [
-            LargestCitiesData(**data_row)
-            for data_row in dts[LargestCitiesData._table_position]
-        ]
+    _row_types = (LargestCitiesData,)
 
     @property
-    def data(self) -> List[LargestCitiesData]:
-        """Get a list of all the data from the table.
+    def data(self) -> Tuple[LargestCitiesData, ...]:
+        """Get a tuple of all the data from the table.
 
-        Each index in the list contains an object representing
+        Each index in the tuple contains an object representing
         a data row of the table.
         """
-        return deepcopy(self._data)
+        return self._get_rows(LargestCitiesData)
@@ -1,11 +1,9 @@
-from copy import deepcopy
-from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Tuple
 
-from worldometer.scraper import get_data_tables
+from worldometer.world.base import _DataTables, _row_dataclass
 
 
-@dataclass
+@_row_dataclass
 class CurrentMostPopulousCountriesData:
     """Represents a data row from the respective table.
 
@@ -14,19 +12,20 @@ class CurrentMostPopulousCountriesData:
     idx: int
     country: str
     population: int
-    yearly_change: str
-    world_share: str
+    yearly_change: float
+    world_share: float
     """
     idx: int
     country: str
     population: int
-    yearly_change: str
-    world_share: str
+    yearly_change: float
+    world_share: float
 
     _table_position = 0
+    _percent_columns = ('yearly_change', 'world_share')
 
 
-@dataclass
+@_row_dataclass
 class PastMostPopulousCountriesData:
     """Represents a data row from the respective table.
 
@@ -35,19 +34,20 @@ class PastMostPopulousCountriesData:
     idx: int
     country: str
     population: int
-    world_share: str
+    world_share: float
     rank: str
     """
     idx: int
     country: str
     population: int
-    world_share: str
+    world_share: float
     rank: str
 
     _table_position = 1
+    _percent_columns = ('world_share',)
 
 
-@dataclass
+@_row_dataclass
 class FutureMostPopulousCountriesData:
     """Represents a data row from the respective table.
 
@@ -56,19 +56,20 @@ class FutureMostPopulousCountriesData:
     idx: int
     country: str
     population: int
-    world_share: str
+    world_share: float
     rank: str
     """
     idx: int
     country: str
     population: int
-    world_share: str
+    world_share: float
     rank: str
 
     _table_position = 2
+    _percent_columns = ('world_share',)
 
 
-class MostPopulousCountries:
+class MostPopulousCountries(_DataTables):
     """Represents the data table of most populous countries in the world.
 
     Attributes
@@ -109,64 +110,38 @@ class MostPopulousCountries:
         )
     )
 
-    def __init__(self) -> None:
-        self._data = self._load_data()
-
-    def _load_data(
-            self
-    ) -> Tuple[
-            List[CurrentMostPopulousCountriesData],
-            List[PastMostPopulousCountriesData],
-            List[FutureMostPopulousCountriesData]
-    ]:
-        dts = get_data_tables(
-            path_url=self.source_path,
-            new_column_names=[
-                *self.new_column_names
-            ]
-        )
-
-        return (
-            [
-                CurrentMostPopulousCountriesData(**data_row)
-                for data_row in dts[CurrentMostPopulousCountriesData._table_position]
-            ],
-            [
-                PastMostPopulousCountriesData(**data_row)
-                for data_row in dts[PastMostPopulousCountriesData._table_position]
-            ],
-            [
-                FutureMostPopulousCountriesData(**data_row)
-                for data_row in dts[FutureMostPopulousCountriesData._table_position]
-            ]
-        )
+    _row_types = (
+        CurrentMostPopulousCountriesData,
+        PastMostPopulousCountriesData,
+        FutureMostPopulousCountriesData
+    )
 
-    def current(self) -> List[CurrentMostPopulousCountriesData]:
-        """Get a list of all the current data from the table.
+    def current(self) -> Tuple[CurrentMostPopulousCountriesData, ...]:
+        """Get a tuple of all the current data from the table.
 
         These data are related to the current year.
 
-        Each index in the list contains an object representing
+        Each index in the tuple contains an object representing
         a data row of the table.
         """
-        return deepcopy(self._data[CurrentMostPopulousCountriesData._table_position])  # type: ignore
+        return self._get_rows(CurrentMostPopulousCountriesData)
 
-    def past(self) -> List[PastMostPopulousCountriesData]:
-        """Get a list of all historical data from the table.
+    def past(self) -> Tuple[PastMostPopulousCountriesData, ...]:
+        """Get a tuple of all historical data from the table.
 
         These data pertain to the year 1950.
 
-        Each index in the list contains an object representing
+        Each index in the tuple contains an object representing
         a data row of the table.
         """
-        return deepcopy(self._data[PastMostPopulousCountriesData._table_position])  # type: ignore
+        return self._get_rows(PastMostPopulousCountriesData)
 
-    def future(self) -> List[FutureMostPopulousCountriesData]:
-        """Get a list of all future data from the table.
+    def future(self) -> Tuple[FutureMostPopulousCountriesData, ...]:
+        """Get a tuple of all future data from the table.
 
         These data are an estimate for the year 2050.
 
-        Each index in the list contains an object representing
+        Each index in the tuple contains an object representing
         a data row of the table.
         """
-        return deepcopy(self._data[FutureMostPopulousCountriesData._table_position])  # type: ignore
+        return self._get_rows(FutureMostPopulousCountriesData)
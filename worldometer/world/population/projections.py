@@ -1,11 +1,9 @@
-from copy import deepcopy
-from dataclasses import dataclass
-from typing import List
+from typing import Tuple
 
-from worldometer.scraper import get_data_tables
+from worldometer.world.base import _DataTables, _row_dataclass
 
 
-@dataclass
+@_row_dataclass
 class WorldPopulationProjectionsData:
     """Represents a data row from the respective table.
 
@@ -13,20 +11,21 @@ class WorldPopulationProjectionsData:
     ----------
     year: int
     world_population: int
-    yearly_change: str
+    yearly_change: float
     net_change: int
     density: int
     """
     year: int
     world_population: int
-    yearly_change: str
+    yearly_change: float
     net_change: int
     density: int
 
     _table_position = 0
+    _percent_columns = ('yearly_change',)
 
 
-class WorldPopulationProjections:
+class WorldPopulationProjections(_DataTables):
     """Represents the data table of the world population projections.
 
     Attributes
@@ -51,26 +50,15 @@ class WorldPopulationProjections:
         'density'
     )
 
-    def __init__(self) -> None:
-        self._data = self._load_data()
+    _cache_max_age = 60 * 60 * 24 * 7
 
-    def _load_data(self) -> List[WorldPopulationProjectionsData]:
-        dts = get_data_tables(
-            path_url=self.source_path,
-            new_column_names=[
-                self.new_column_names
-            ]
-        )
-        return [
-            WorldPopulationProjectionsData(**data_row)
-            for data_row in dts[WorldPopulationProjectionsData._table_position]
-        ]
+    _row_types = (WorldPopulationProjectionsData,)
 
     @property
-    def data(self) -> List[WorldPopulationProjectionsData]:
-        """Get a list of all the data from the table.
+    def data(self) -> Tuple[WorldPopulationProjectionsData, ...]:
+        """Get a tuple of all the data from the table.
 
-        Each index in the list contains an object representing
+        Each index in the tuple contains an object representing
         a data row of the table.
         """
-        return deepcopy(self._data)
+        return self._get_rows(WorldPopulationProjectionsData)
@@ -1,11 +1,12 @@
-from copy import deepcopy
-from dataclasses import dataclass
-from typing import List, Tuple, Union
+import time
 
-from worldometer.scraper import get_data_tables, get_rts_counters_object
+from typing import Tuple, Union
 
+from worldometer.scraper import Page, get_page
+from worldometer.world.base import _DataTables, _row_dataclass
 
-@dataclass
+
+@_row_dataclass
 class SubregionData:
     """Represents a data row from the respective table.
 
@@ -20,7 +21,7 @@ class SubregionData:
     _table_position = 0
 
 
-@dataclass
+@_row_dataclass
 class HistoricalData:
     """Represents a data row from the respective table.
 
@@ -28,36 +29,37 @@ class HistoricalData:
     ----------
     year: int
     population: int
-    yearly_change_percent: str
+    yearly_change_percent: float
     yearly_change: int
     migrants: int
     median_age: float
     fertility_rate: float
     density: int
-    urban_population_percent: str
+    urban_population_percent: float
     urban_population: int
-    world_share: str
+    world_share: float
     world_population: int
     rank: int
     """
     year: int
     population: int
-    yearly_change_percent: str
+    yearly_change_percent: float
     yearly_change: int
     migrants: int
     median_age: float
     fertility_rate: float
     density: int
-    urban_population_percent: str
+    urban_population_percent: float
     urban_population: int
-    world_share: str
+    world_share: float
     world_population: int
     rank: int
 
     _table_position = 1
+    _percent_columns = ('yearly_change_percent', 'urban_population_percent', 'world_share')
 
 
-@dataclass
+@_row_dataclass
 class ForecastData:
     """Represents a data row from the respective table.
 
@@ -65,36 +67,37 @@ class ForecastData:
     ----------
     year: int
     population: int
-    yearly_change_percent: str
+    yearly_change_percent: float
     yearly_change: int
     migrants: int
     median_age: float
     fertility_rate: float
     density: int
-    urban_population_percent: str
+    urban_population_percent: float
     urban_population: int
-    world_share: str
+    world_share: float
     world_population: int
     rank: int
     """
     year: int
     population: int
-    yearly_change_percent: str
+    yearly_change_percent: float
     yearly_change: int
     migrants: int
     median_age: float
     fertility_rate: float
     density: int
-    urban_population_percent: str
+    urban_population_percent: float
     urban_population: int
-    world_share: str
+    world_share: float
     world_population: int
     rank: int
 
     _table_position = 2
+    _percent_columns = ('yearly_change_percent', 'urban_population_percent', 'world_share')
 
 
-class _RegionPopulation:
+class _RegionPopulation(_DataTables):
 
     _key_rts_counters = '[override]'
     source_path = '[override]'
@@ -135,66 +138,68 @@ class _RegionPopulation:
         )
     )
 
-    def __init__(self) -> None:
-        self._data = self._load_data()
-
-    def _load_data(
-            self
-    ) -> Tuple[
-            List[SubregionData],
-            List[HistoricalData],
-            List[ForecastData]
-    ]:
-        dts = get_data_tables(
-            path_url=self.source_path,
-            new_column_names=[
-                *self.new_column_names
-            ]
-        )
+    _row_types = (
+        SubregionData,
+        HistoricalData,
+        ForecastData
+    )
 
-        return (
-            [
-                SubregionData(**data_row)
-                for data_row in dts[SubregionData._table_position]
-            ],
-            [
-                HistoricalData(**data_row)
-                for data_row in dts[HistoricalData._table_position]
-            ],
-            [
-                ForecastData(**data_row)
-                for data_row in dts[ForecastData._table_position]
-            ]
-        )
+    # Seconds the page of the live counter is used before fetching it again.
+    _live_max_age: float = 10.0
+
+    def _init_page(self, page: Page) -> None:
+        super()._init_page(page)
+        # The first live counter is extracted from the same page as the
+        # tables, if it was fetched recently (it may come from the HTTP cache).
+        self._live_page = page
+
+    def live(self, refresh: bool = False) -> Union[int, float, None]:
+        """Get a live population counter for the respective region.
+
+        The counter is read from the page loaded with the instance while
+        it is recent, and from a new fetch of the page once it is older
+        than a few seconds.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            If True, the page is fetched again even if it is recent.
+        """
+        with self._lock:
+            page = self._live_page
+
+        if refresh or time.time() - page.fetched_at >= self._live_max_age:
+            # Fetched without holding the lock, which guards the tables.
+            page = get_page(self.source_path)
+            with self._lock:
+                self._live_page = page
 
-    def live(self) -> Union[int, float, None]:
-        """Get a live population counter for the respective region."""
-        rts_counters = get_rts_counters_object(path_url=self.source_path)
+        rts_counters = page.get_rts_counters_object()
         return rts_counters.get(self._key_rts_counters)
 
-    def subregions(self) -> List[SubregionData]:
-        """Get a list of all the subregions' data from the table.
+    def subregions(self) -> Tuple[SubregionData, ...]:
+        """Get a tuple of all the subregions' data from the table.
 
-        Each index in the list contains an object representing
+        Each index in the tuple contains an object representing
         a data row of the table.
         """
-        return deepcopy(self._data[SubregionData._table_position])  # type: ignore
+        return self._get_rows(SubregionData)
 
-    def historical(self) -> List[HistoricalData]:
-        """Get a list of all historical data from the table.
+    def historical(self) -> Tuple[HistoricalData, ...]:
+        """Get a tuple of all historical data from the table.
 
-        Each index in the list contains an object representing
+        Each index in the tuple contains an object representing
         a data row of the table.
         """
-        return deepcopy(self._data[HistoricalData._table_position])  # type: ignore
+        return self._get_rows(HistoricalData)
 
-    def forecast(self) -> List[ForecastData]:
-        """Get a list of all forecast data from the table.
+    def forecast(self) -> Tuple[ForecastData, ...]:
+        """Get a tuple of all forecast data from the table.
 
-        Each index in the list contains an object representing
+        Each index in the tuple contains an object representing
         a data row of the table.
         """
-        return deepcopy(self._data[ForecastData._table_position])  # type: ignore
+        return self._get_rows(ForecastData)
 
 
 class AsiaPopulation(_RegionPopulation):
@@ -0,0 +1,288 @@
+import multiprocessing
+import time
+
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+from worldometer.world.counters import (
+    COUNTER_INDEX,
+    CounterSnapshot,
+    Energy,
+    Environment,
+    Food,
+    GovernmentAndEconomics,
+    Health,
+    SocietyAndMedia,
+    Water,
+    WorldCounters,
+    WorldPopulation
+)
+
+
+# The shared memory block starts with a header of two int64 values, the
+# sequence number of the seqlock and the number of counters, followed by
+# the snapshot buffer (see `CounterSnapshot`).
+_HEADER_SIZE = 2
+
+
+def _get_block_size() -> int:
+    return (_HEADER_SIZE + 2 * len(COUNTER_INDEX) + 1) * 8
+
+
+def _get_block_views(shm: SharedMemory) -> Tuple[np.ndarray, np.ndarray]:
+    header = np.ndarray((_HEADER_SIZE,), dtype=np.int64, buffer=shm.buf)
+    buffer = np.ndarray(
+        (2 * len(COUNTER_INDEX) + 1,),
+        dtype=np.float64,
+        buffer=shm.buf,
+        offset=_HEADER_SIZE * 8
+    )
+    return header, buffer
+
+
+class SharedCountersPublisher:
+    """Publishes the counters in shared memory for other processes.
+
+    The publisher refreshes a `WorldCounters` instance and writes its
+    snapshot in a shared memory block, from which any number of
+    `SharedWorldCounters` instances can read it without accessing the
+    website. Writes are protected by a seqlock, so readers never block
+    the publisher and never see a partially written snapshot.
+
+    Parameters
+    ----------
+    name : str, optional
+        The name of the shared memory block. A unique name is
+        generated when not given.
+    interval : float, optional
+        Seconds between each published snapshot. Between reloads from
+        the website, the counters are extrapolated locally.
+    reload_interval : float, optional
+        Seconds between each reload of the counters from the website.
+
+    Attributes
+    ----------
+    name : str
+        The name of the shared memory block, used by the readers.
+
+    Examples
+    --------
+    In the main process of the server, before the workers are forked:
+
+    >>> from worldometer.world import SharedCountersPublisher
+    >>> publisher = SharedCountersPublisher(name='worldometer')
+    >>> publisher.start()
+
+    In each worker:
+
+    >>> from worldometer.world import SharedWorldCounters
+    >>> wc = SharedWorldCounters('worldometer')
+    >>> wc.world_population.current_population
+    8065299074
+    """
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        interval: float = 1.0,
+        reload_interval: float = 60.0
+    ) -> None:
+        self.interval = interval
+        self.reload_interval = reload_interval
+
+        self._shm = SharedMemory(name=name, create=True, size=_get_block_size())
+        self._header, self._buffer = _get_block_views(self._shm)
+        self._header[:] = (0, len(COUNTER_INDEX))
+        self._buffer[:] = CounterSnapshot().buffer
+
+        self._stop_event = multiprocessing.Event()
+        self._process: Optional[multiprocessing.Process] = None
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def publish(self, snapshot: CounterSnapshot) -> None:
+        """Write a snapshot in the shared memory block."""
+        header = self._header
+        # An odd sequence number tells readers a write is in progress.
+        header[0] += 1
+        np.copyto(self._buffer, snapshot.buffer)
+        header[0] += 1
+
+    def run(self) -> None:
+        """Refresh and publish the counters until `stop` is called.
+
+        It blocks the caller, `start` runs it in a new process.
+        """
+        wc = None
+        while wc is None:
+            try:
+                wc = WorldCounters()
+            except Exception:
+                # The website may be temporarily unavailable at startup,
+                # the load is retried until it succeeds or `stop` is called.
+                if self._stop_event.wait(self.interval):
+                    return
+
+        self.publish(wc.snapshot)
+        last_reload = time.monotonic()
+
+        while not self._stop_event.wait(self.interval):
+            if time.monotonic() - last_reload >= self.reload_interval:
+                try:
+                    wc.reload_data()
+                    last_reload = time.monotonic()
+                except Exception:
+                    # The website may be temporarily unavailable. The readers
+                    # keep getting extrapolated values until the next reload.
+                    wc.reload_data(local=True)
+            else:
+                wc.reload_data(local=True)
+
+            self.publish(wc.snapshot)
+
+    def start(self) -> None:
+        """Run the publisher in a new daemon process."""
+        self._process = multiprocessing.Process(target=self.run, daemon=True)
+        self._process.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._process is not None:
+            self._process.join()
+            self._process = None
+
+    def close(self) -> None:
+        """Stop the publisher and release the shared memory block."""
+        self.stop()
+        self._header = self._buffer = None  # type: ignore
+        self._shm.close()
+        self._shm.unlink()
+
+    def __getstate__(self) -> dict:
+        # The publisher process attaches to the block by its name.
+        state = self.__dict__.copy()
+        del state['_header'], state['_buffer'], state['_process']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._header, self._buffer = _get_block_views(self._shm)
+        self._process = None
+
+
+class SharedWorldCounters:
+    """Contains the counters published by a `SharedCountersPublisher`.
+
+    It has the same sections as `WorldCounters`, but the values are read
+    from shared memory, so it never accesses the website. Reads are
+    lock-free: the snapshot is copied and discarded if the publisher
+    wrote to it in the meantime.
+
+    Parameters
+    ----------
+    name : str
+        The name of the shared memory block of the publisher.
+    read_timeout : float, optional
+        Seconds `reload_data` waits for a write in progress to finish.
+        A write takes microseconds, so it is only exceeded when the
+        publisher stopped in the middle of a write.
+
+    Attributes
+    ----------
+    world_population : WorldPopulation
+    government_and_economics : GovernmentAndEconomics
+    society_and_media : SocietyAndMedia
+    environment : Environment
+    food : Food
+    water : Water
+    energy : Energy
+    health : Health
+
+    Notes
+    -----
+    Until the publisher writes its first snapshot, all values are None.
+
+    Readers must run in processes forked or spawned from the process that
+    created the publisher (e.g. the workers of a pre-fork server), which
+    share its resource tracker. Otherwise, the shared memory block would
+    be released when the first reader process exits.
+    """
+
+    def __init__(self, name: str, read_timeout: float = 1.0) -> None:
+        self.read_timeout = read_timeout
+
+        self._shm = SharedMemory(name=name)
+        self._header, self._buffer = _get_block_views(self._shm)
+        if self._header[1] != len(COUNTER_INDEX):
+            raise ValueError(
+                f'The shared memory block has {self._header[1]} counters, '
+                f'but {len(COUNTER_INDEX)} are expected'
+            )
+
+        self._snapshot = CounterSnapshot()
+        self._read_buffer = self._snapshot.buffer.copy()
+        self.reload_data()
+
+        self.world_population = WorldPopulation(self._snapshot)
+        self.government_and_economics = GovernmentAndEconomics(self._snapshot)
+        self.society_and_media = SocietyAndMedia(self._snapshot)
+        self.environment = Environment(self._snapshot)
+        self.food = Food(self._snapshot)
+        self.water = Water(self._snapshot)
+        self.energy = Energy(self._snapshot)
+        self.health = Health(self._snapshot)
+
+    @property
+    def snapshot(self) -> CounterSnapshot:
+        """The snapshot with the values of all counters."""
+        return self._snapshot
+
+    def reload_data(self, local: bool = False) -> None:
+        """Copy the latest snapshot written by the publisher.
+
+        Parameters
+        ----------
+        local : bool, optional
+            Accepted for compatibility with `WorldCounters.reload_data`.
+            The data is always read from shared memory.
+
+        Raises
+        ------
+        TimeoutError
+            If no complete snapshot could be read within `read_timeout`.
+            The counters keep the values of the last complete snapshot.
+        """
+        header = self._header
+        deadline = time.monotonic() + self.read_timeout
+
+        while True:
+            sequence = header[0]
+            # An odd sequence number means a write is in progress.
+            if not sequence % 2:
+                np.copyto(self._read_buffer, self._buffer)
+
+                if header[0] == sequence:
+                    np.copyto(self._snapshot.buffer, self._read_buffer)
+                    return
+
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    'Could not read a complete snapshot, the publisher '
+                    'may have stopped in the middle of a write'
+                )
+
+            time.sleep(0)
+
+    def close(self) -> None:
+        self._header = self._buffer = None  # type: ignore
+        self._shm.close()
+
+    def __enter__(self) -> 'SharedWorldCounters':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
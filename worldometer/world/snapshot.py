@@ -0,0 +1,143 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from typing import Type
+
+from worldometer.world.base import _DataTablesType
+
+from worldometer.world.country_codes import CountryCodes
+from worldometer.world.geography import (
+    LargestCountries,
+    WorldCountries,
+    AsiaCountries,
+    AfricaCountries,
+    EuropeCountries,
+    LatinAmericanAndTheCaribbeanCountries,
+    NorthernAmericanCountries,
+    OceaniaCountries
+)
+from worldometer.world.population import (
+    CountriesByPopulation,
+    LargestCities,
+    MostPopulousCountries,
+    WorldPopulationByRegion,
+    WorldPopulationByYear,
+    WorldPopulationProjections,
+    AsiaPopulation,
+    AfricaPopulation,
+    EuropePopulation,
+    LatinAmericanAndTheCaribbeanPopulation,
+    NorthernAmericanPopulation,
+    OceaniaPopulation
+)
+
+
+def _load_dataset(dataset_class: Type[_DataTablesType]) -> _DataTablesType:
+    # Datasets only parse their tables on first access, so they are
+    # parsed here to do it in the worker thread instead of the caller's.
+    dataset = dataset_class()
+    for row_type in dataset._row_types:
+        dataset._get_frame(row_type)
+    return dataset
+
+
+@dataclass(frozen=True)
+class WorldDataSnapshot:
+    """Contains an instance of each dataset, all loaded at the same time.
+
+    Attributes
+    ----------
+    fetched_at : datetime
+        The moment (in UTC) the loading of the datasets started.
+    country_codes : CountryCodes
+    largest_countries : LargestCountries
+    world_countries : WorldCountries
+    asia_countries : AsiaCountries
+    africa_countries : AfricaCountries
+    europe_countries : EuropeCountries
+    latin_american_and_the_caribbean_countries : LatinAmericanAndTheCaribbeanCountries
+    northern_american_countries : NorthernAmericanCountries
+    oceania_countries : OceaniaCountries
+    countries_by_population : CountriesByPopulation
+    largest_cities : LargestCities
+    most_populous_countries : MostPopulousCountries
+    world_population_by_region : WorldPopulationByRegion
+    world_population_by_year : WorldPopulationByYear
+    world_population_projections : WorldPopulationProjections
+    asia_population : AsiaPopulation
+    africa_population : AfricaPopulation
+    europe_population : EuropePopulation
+    latin_american_and_the_caribbean_population : LatinAmericanAndTheCaribbeanPopulation
+    northern_american_population : NorthernAmericanPopulation
+    oceania_population : OceaniaPopulation
+    """
+    fetched_at: datetime
+    country_codes: CountryCodes
+    largest_countries: LargestCountries
+    world_countries: WorldCountries
+    asia_countries: AsiaCountries
+    africa_countries: AfricaCountries
+    europe_countries: EuropeCountries
+    latin_american_and_the_caribbean_countries: LatinAmericanAndTheCaribbeanCountries
+    northern_american_countries: NorthernAmericanCountries
+    oceania_countries: OceaniaCountries
+    countries_by_population: CountriesByPopulation
+    largest_cities: LargestCities
+    most_populous_countries: MostPopulousCountries
+    world_population_by_region: WorldPopulationByRegion
+    world_population_by_year: WorldPopulationByYear
+    world_population_projections: WorldPopulationProjections
+    asia_population: AsiaPopulation
+    africa_population: AfricaPopulation
+    europe_population: EuropePopulation
+    latin_american_and_the_caribbean_population: LatinAmericanAndTheCaribbeanPopulation
+    northern_american_population: NorthernAmericanPopulation
+    oceania_population: OceaniaPopulation
+
+
+def load_all(max_workers: int = 8) -> WorldDataSnapshot:
+    """Load every dataset concurrently and return them in a single snapshot.
+
+    The pages are fetched and parsed on a bounded thread pool, so the
+    total loading time is close to that of the slowest page.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        The maximum number of pages loaded at the same time.
+
+    Returns
+    -------
+    WorldDataSnapshot
+        An immutable object with an instance of each dataset.
+
+    Examples
+    --------
+    >>> from worldometer.world import load_all
+
+    >>> snapshot = load_all()
+
+    >>> snapshot.country_codes.data[0]
+    CountryCodesData(
+        country='Afghanistan',
+        calling_code='93',
+        three_letter_iso='AF',
+        two_letter_iso='AFG',
+        three_digit_iso_numeric=4
+    )
+    """
+    fetched_at = datetime.now(timezone.utc)
+
+    dataset_fields = [f for f in fields(WorldDataSnapshot) if f.name != 'fetched_at']
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            f.name: executor.submit(_load_dataset, f.type)  # type: ignore
+            for f in dataset_fields
+        }
+        datasets = {
+            name: future.result()
+            for name, future in futures.items()
+        }
+
+    return WorldDataSnapshot(fetched_at=fetched_at, **datasets)